@@ -0,0 +1,65 @@
+# pylint: disable=all
+"""
+Punto de entrada del paquete
+=============================
+Permite ejecutar el juego con:
+    python -m squash_proyecto          -> Juego con ventana
+    python -m squash_proyecto --startup-report
+                                       -> Juego, con los tiempos del arranque en consola
+    python -m squash_proyecto --config RUTA --fps 0 ...
+                                       -> Juego con ajustes del archivo y de la línea de
+                                          comandos (ver config.linea_comandos, --help)
+    python -m squash_proyecto sim ...  -> Simulación headless
+    python -m squash_proyecto replay ARCHIVO [--sin-limite | --headless]
+                                       -> Reproducir una partida grabada
+    python -m squash_proyecto balanceo ...
+                                       -> Distribuciones por dificultad (Monte Carlo)
+    python -m squash_proyecto bench ... -> Benchmarks con compuerta de regresión
+"""
+
+import os
+import sys
+
+# Los módulos del proyecto se importan desde la carpeta squash_proyecto
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def principal(argv=None):
+    """Despacha al subcomando solicitado o inicia el juego."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv and argv[0] == "sim":
+        from simulacion.ejecutor import ejecutar_simulaciones
+        return ejecutar_simulaciones(argv[1:])
+
+    if argv and argv[0] == "replay":
+        from simulacion.repeticion import ejecutar_repeticion
+        return ejecutar_repeticion(argv[1:])
+
+    if argv and argv[0] == "balanceo":
+        from simulacion.balanceo import ejecutar_balanceo
+        return ejecutar_balanceo(argv[1:])
+
+    if argv and argv[0] == "bench":
+        from benchmarks.ejecutor import ejecutar_benchmarks
+        return ejecutar_benchmarks(argv[1:])
+
+    # El informe se crea antes de importar pygame para medir también ese import
+    from sistema.arranque import InformeArranque
+    informe = InformeArranque()
+    with informe.fase("configuración"):
+        from config.linea_comandos import preparar_configuracion
+        try:
+            _, args = preparar_configuracion(argv)
+        except ValueError as error:
+            print(f"❌ [CONFIG] {error}")
+            return 2
+    informe.activo = args.startup_report
+    informe.importar("pygame")
+    informe.importar("main").main(informe=informe)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(principal())
@@ -0,0 +1,137 @@
+# pylint: disable=all
+"""
+Controlador de Raqueta por IA
+=============================
+Mueve la raqueta hacia el punto donde la pelota cruzará su altura,
+calculado en forma cerrada por fisica.prediccion. El costo por paso es
+O(1): la predicción solo se rehace cuando cambia la trayectoria.
+
+La habilidad se modela con dos parámetros:
+    reaccion: pasos que tarda en notar una trayectoria nueva
+    error:    desvío típico (en píxeles) de su estimación del cruce
+
+Se usa como tipo de entrada 'ia' de InputAdapter y como controlador de
+las simulaciones headless (ver simulacion.ejecutor.CONTROLADORES).
+"""
+
+import random
+import numpy as np
+from config.configuracion import ANCHO_CANCHA
+from fisica.prediccion import PredictorAterrizaje, predecir_cruce, pasos_hasta_cruce
+from simulacion.nucleo import ENTRADA_IZQUIERDA, ENTRADA_DERECHA
+from simulacion.semillas import derivar_semilla
+
+# Niveles de habilidad predefinidos
+NIVELES_IA = {
+    "novato": {"reaccion": 20, "error": 60.0},
+    "medio": {"reaccion": 8, "error": 20.0},
+    "experto": {"reaccion": 0, "error": 0.0},
+}
+
+# Rama de semillas del error de la IA (separada del azar de la partida)
+RAMA_SEMILLA_IA = 1
+
+
+class ControladorIA:
+    """
+    Controlador invocable: recibe la SimulacionJuego y retorna la máscara
+    de entrada del paso. Si se usa con otra partida, reinicia su estado,
+    así que una misma instancia sirve para un lote de partidas.
+    """
+
+    def __init__(self, reaccion=8, error=20.0):
+        """
+        Args:
+            reaccion: Pasos de demora antes de seguir una trayectoria nueva
+            error: Desvío típico del punto de cruce estimado, en píxeles
+        """
+        self.reaccion = reaccion
+        self.error = error
+        self.predictor = PredictorAterrizaje(ANCHO_CANCHA)
+        self.simulacion = None
+        self.rng = None
+        self.objetivo = None            # x hacia donde va la raqueta
+        self.objetivo_pendiente = None  # Predicción nueva aún no "vista"
+        self.paso_reaccion = 0
+        self.clave_multibola = None
+
+    @classmethod
+    def desde_nivel(cls, nivel):
+        """Crea un controlador con un nivel de NIVELES_IA."""
+        return cls(**NIVELES_IA[nivel])
+
+    def _reiniciar(self, simulacion):
+        """Prepara el controlador para una partida nueva."""
+        self.simulacion = simulacion
+        self.rng = random.Random(derivar_semilla(simulacion.semilla, RAMA_SEMILLA_IA))
+        self.predictor = PredictorAterrizaje(ANCHO_CANCHA)
+        self.objetivo = None
+        self.objetivo_pendiente = None
+        self.paso_reaccion = 0
+        self.clave_multibola = None
+
+    def __call__(self, simulacion):
+        """
+        Returns:
+            Máscara de entrada para el siguiente paso
+        """
+        if simulacion is not self.simulacion:
+            self._reiniciar(simulacion)
+
+        raqueta = simulacion.raqueta
+        if simulacion.motor is not None:
+            x_cruce = self._cruce_multibola(simulacion)
+            if x_cruce is not None:
+                self._nueva_prediccion(x_cruce, simulacion.pasos)
+        else:
+            pelota = simulacion.pelota
+            if self.predictor.predecir(pelota, raqueta.y - pelota.radio, simulacion.pasos):
+                self._nueva_prediccion(self.predictor.x_cruce, simulacion.pasos)
+
+        # Demora de reacción: la predicción nueva se sigue recién después
+        if self.objetivo_pendiente is not None and simulacion.pasos >= self.paso_reaccion:
+            self.objetivo = self.objetivo_pendiente
+            self.objetivo_pendiente = None
+
+        if self.objetivo is None:
+            return 0
+
+        centro = raqueta.x + raqueta.ancho / 2
+        margen = raqueta.velocidad / 2
+        if self.objetivo < centro - margen:
+            return ENTRADA_IZQUIERDA
+        if self.objetivo > centro + margen:
+            return ENTRADA_DERECHA
+        return 0
+
+    def _nueva_prediccion(self, x_cruce, paso):
+        """Registra una trayectoria nueva (con el error y la demora del nivel)."""
+        if x_cruce is None:
+            return
+        if self.error:
+            x_cruce += self.rng.gauss(0.0, self.error)
+        self.objetivo_pendiente = x_cruce
+        self.paso_reaccion = paso + self.reaccion
+
+    def _cruce_multibola(self, simulacion):
+        """
+        En multibola sigue a la pelota que cruzará primero. Elegirla es una
+        pasada vectorizada sobre el motor; la predicción en sí es O(1).
+        """
+        motor = simulacion.motor
+        y_objetivo = simulacion.raqueta.y - motor.radio_defecto
+        pasos = pasos_hasta_cruce(motor.y, motor.vy, motor.activa, y_objetivo)
+        indice = int(np.argmin(pasos))
+        if not np.isfinite(pasos[indice]):
+            return None
+
+        # Igual que con una pelota: solo se recalcula si cambia la trayectoria
+        clave = (indice, abs(float(motor.vx[indice])), abs(float(motor.vy[indice])))
+        if clave == self.clave_multibola:
+            return None
+        self.clave_multibola = clave
+
+        cruce = predecir_cruce(float(motor.x[indice]), float(motor.y[indice]),
+                               float(motor.vx[indice]), float(motor.vy[indice]),
+                               y_objetivo, motor.ancho)
+        return cruce[0]
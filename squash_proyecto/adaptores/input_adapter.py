@@ -5,7 +5,15 @@ PATRÓN ADAPTER - Adaptador de Entradas
 Permite usar diferentes dispositivos de entrada sin cambiar el código base.
 """
 
+from collections import defaultdict
 import pygame
+from config.configuracion import ANCHO_CANCHA
+from renderizado.vista import Vista
+from simulacion.nucleo import entrada_desde_teclas, TECLAS_ENTRADA
+from adaptores.controlador_ia import ControladorIA
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("adapter")
 
 # =============================================================================
 # PATRÓN ADAPTER
@@ -15,28 +23,40 @@ class InputAdapter:
     """
     PATRÓN: ADAPTER
     ---------------
-    Adapta diferentes tipos de entrada (teclado, mouse, joystick)
-    a una interfaz común de teclas presionadas.
+    Adapta diferentes tipos de entrada (teclado, mouse, joystick,
+    repetición, IA) a una interfaz común de teclas presionadas.
     
     Propósito: Permitir que el juego funcione con diferentes
     dispositivos sin modificar la lógica principal.
     """
     
-    def __init__(self, tipo_entrada="teclado"):
+    def __init__(self, tipo_entrada="teclado", repeticion=None, simulacion=None, nivel_ia="medio"):
         """
         Inicializa el adaptador con el tipo de entrada deseado.
         
         Args:
-            tipo_entrada: 'teclado', 'mouse' o 'joystick'
+            tipo_entrada: 'teclado', 'mouse', 'joystick', 'repeticion' o 'ia'
+            repeticion: LectorRepeticion con las entradas grabadas
+                        (solo para el tipo 'repeticion')
+            simulacion: SimulacionJuego que observa la IA (tipo 'ia')
+            nivel_ia: Nivel de habilidad de la IA (ver NIVELES_IA)
         """
         self.tipo_entrada = tipo_entrada
         self.joystick = None
+        self.repeticion = repeticion
+        self.paso_repeticion = 0
+        self.simulacion = simulacion
+        self.nivel_ia = nivel_ia
+        self.controlador_ia = None
+        
+        if tipo_entrada == "ia":
+            self._inicializar_ia()
         
         # Intentar inicializar joystick si se solicita
         if tipo_entrada == "joystick":
             self._inicializar_joystick()
         
-        print(f"🎮 [ADAPTER] Tipo de entrada: {self.tipo_entrada}")
+        registro.info("🎮 [ADAPTER] Tipo de entrada: %s", self.tipo_entrada)
     
     def _inicializar_joystick(self):
         """Inicializa el joystick si está disponible."""
@@ -45,11 +65,20 @@ class InputAdapter:
         if pygame.joystick.get_count() > 0:
             self.joystick = pygame.joystick.Joystick(0)
             self.joystick.init()
-            print(f"🎮 [ADAPTER] Joystick detectado: {self.joystick.get_name()}")
+            registro.info("🎮 [ADAPTER] Joystick detectado: %s", self.joystick.get_name())
         else:
-            print("⚠️ [ADAPTER] No se detectó joystick. Usando teclado.")
+            registro.warning("⚠️ [ADAPTER] No se detectó joystick. Usando teclado.")
             self.tipo_entrada = "teclado"
     
+    def _inicializar_ia(self):
+        """Crea el controlador de IA (necesita la simulación que observa)."""
+        if self.simulacion is None:
+            registro.warning("⚠️ [ADAPTER] La IA necesita una simulación. Usando teclado.")
+            self.tipo_entrada = "teclado"
+            return
+        self.controlador_ia = ControladorIA.desde_nivel(self.nivel_ia)
+        registro.info("🤖 [ADAPTER] IA de nivel %s", self.nivel_ia)
+    
     def obtener_entrada(self):
         """
         Obtiene la entrada del dispositivo actual y la adapta
@@ -67,9 +96,46 @@ class InputAdapter:
         elif self.tipo_entrada == "joystick":
             return self._obtener_entrada_joystick()
         
+        elif self.tipo_entrada == "repeticion":
+            return self._obtener_entrada_repeticion()
+        
+        elif self.tipo_entrada == "ia":
+            return self._teclas_desde_mascara(self.obtener_mascara())
+        
         # Por defecto, usar teclado
         return self._obtener_entrada_teclado()
     
+    def obtener_mascara(self):
+        """
+        Entrada del paso como máscara de bits ENTRADA_* (la que consume
+        SimulacionJuego y la que se graba en las repeticiones).
+        
+        Returns:
+            La máscara, o None si se terminó la repetición
+        """
+        if self.tipo_entrada == "repeticion":
+            if self.paso_repeticion >= len(self.repeticion):
+                return None
+            mascara = self.repeticion[self.paso_repeticion]
+            self.paso_repeticion += 1
+            return mascara
+        
+        if self.tipo_entrada == "ia":
+            return self.controlador_ia(self.simulacion)
+        
+        return entrada_desde_teclas(self.obtener_entrada())
+    
+    def _obtener_entrada_repeticion(self):
+        """Adapta la máscara grabada del siguiente paso a teclas presionadas."""
+        return self._teclas_desde_mascara(self.obtener_mascara() or 0)
+    
+    def _teclas_desde_mascara(self, mascara):
+        """Convierte una máscara ENTRADA_* en teclas presionadas simuladas."""
+        teclas_simuladas = defaultdict(bool)
+        for tecla, bit in TECLAS_ENTRADA:
+            teclas_simuladas[tecla] = bool(mascara & bit)
+        return teclas_simuladas
+    
     def _obtener_entrada_teclado(self):
         """Obtiene entrada del teclado (sin adaptación)."""
         return pygame.key.get_pressed()
@@ -80,11 +146,12 @@ class InputAdapter:
         Mouse a la izquierda = tecla LEFT
         Mouse a la derecha = tecla RIGHT
         """
-        x_mouse, _ = pygame.mouse.get_pos()
-        centro_pantalla = 1000 // 2
+        x_mouse, _ = Vista.obtener_instancia().a_cancha(*pygame.mouse.get_pos())
+        centro_pantalla = ANCHO_CANCHA // 2
         
-        # Crear lista simulando teclas presionadas
-        teclas_simuladas = [False] * 512
+        # Crear teclas presionadas simuladas; en Pygame 2 las flechas tienen
+        # códigos enormes (K_LEFT = 0x40000050), así que no sirve una lista
+        teclas_simuladas = defaultdict(bool)
         
         # Zona muerta en el centro para evitar movimientos erráticos
         zona_muerta = 100
@@ -119,8 +186,8 @@ class InputAdapter:
         except:
             return self._obtener_entrada_teclado()
         
-        # Crear lista simulando teclas presionadas
-        teclas_simuladas = [False] * 512
+        # Crear teclas presionadas simuladas (ver _obtener_entrada_mouse)
+        teclas_simuladas = defaultdict(bool)
         
         # Zona muerta para evitar drift del joystick
         zona_muerta = 0.2
@@ -157,15 +224,21 @@ class InputAdapter:
         Cambia el tipo de entrada dinámicamente.
         
         Args:
-            nuevo_tipo: 'teclado', 'mouse' o 'joystick'
+            nuevo_tipo: 'teclado', 'mouse', 'joystick' o 'ia'
         """
+        if self.tipo_entrada == "repeticion":
+            # Una repetición no se puede cambiar a mano
+            return
+        
         tipo_anterior = self.tipo_entrada
         self.tipo_entrada = nuevo_tipo
         
         if nuevo_tipo == "joystick" and not self.joystick:
             self._inicializar_joystick()
+        elif nuevo_tipo == "ia" and not self.controlador_ia:
+            self._inicializar_ia()
         
-        print(f"🎮 [ADAPTER] Entrada cambiada: {tipo_anterior} → {nuevo_tipo}")
+        registro.info("🎮 [ADAPTER] Entrada cambiada: %s → %s", tipo_anterior, nuevo_tipo)
     
     def obtener_tipo_actual(self):
         """Retorna el tipo de entrada actual."""
@@ -0,0 +1,198 @@
+# pylint: disable=all
+"""
+Motor de Audio
+==============
+Backend de sonido de baja latencia para ObservadorSonido.
+
+Los efectos se sintetizan con NumPy al iniciar y quedan precargados como
+pygame.mixer.Sound, así que al dispararlos no hay lectura de disco ni se
+crean objetos nuevos. Se usa un grupo fijo de canales: si todos están
+sonando se roba el que empezó hace más tiempo. Cada sonido tiene además
+un intervalo mínimo entre disparos para no saturar la mezcla cuando hay
+muchos golpes seguidos (p. ej. en multibola).
+"""
+
+import numpy as np
+import pygame
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("audio")
+
+# Identificadores de sonido (índices en las tablas del motor)
+SONIDO_GOLPE = 0
+SONIDO_PELOTA_PERDIDA = 1
+SONIDO_NIVEL_SUBIDO = 2
+SONIDO_GAME_OVER = 3
+
+# Intervalo mínimo entre dos disparos del mismo sonido, en ms
+INTERVALOS_MINIMOS = (40, 150, 300, 1000)
+
+
+# =============================================================================
+# SÍNTESIS DE EFECTOS
+# =============================================================================
+
+def _tono(frecuencia, duracion, frecuencia_muestreo, frecuencia_final=None, decaimiento=8.0):
+    """
+    Onda senoidal con envolvente exponencial.
+
+    Args:
+        frecuencia: Frecuencia inicial en Hz
+        duracion: Duración en segundos
+        frecuencia_muestreo: Muestras por segundo del mezclador
+        frecuencia_final: Si se indica, la frecuencia barre linealmente hasta ella
+        decaimiento: Velocidad de la caída de volumen
+
+    Returns:
+        Arreglo float32 con valores en [-1, 1]
+    """
+    n = int(duracion * frecuencia_muestreo)
+    t = np.arange(n, dtype=np.float32) / frecuencia_muestreo
+    if frecuencia_final is None:
+        fase = 2.0 * np.pi * frecuencia * t
+    else:
+        # Barrido lineal: la fase es la integral de la frecuencia
+        pendiente = (frecuencia_final - frecuencia) / duracion
+        fase = 2.0 * np.pi * (frecuencia * t + 0.5 * pendiente * t * t)
+    envolvente = np.exp(-decaimiento * t / duracion)
+
+    # Ataque corto para evitar el "click" inicial
+    ataque = min(n, int(0.005 * frecuencia_muestreo))
+    envolvente[:ataque] *= np.linspace(0.0, 1.0, ataque, dtype=np.float32)
+    return (np.sin(fase) * envolvente).astype(np.float32)
+
+
+def sintetizar_efectos(frecuencia_muestreo):
+    """
+    Genera las formas de onda de todos los efectos.
+
+    Returns:
+        Lista de arreglos float32 indexada por SONIDO_*
+    """
+    fm = frecuencia_muestreo
+    golpe = _tono(880.0, 0.06, fm, decaimiento=6.0)
+    perdida = _tono(440.0, 0.35, fm, frecuencia_final=110.0, decaimiento=3.0)
+    nivel = np.concatenate([_tono(f, 0.09, fm, decaimiento=2.0) for f in (523.25, 659.25, 783.99, 1046.5)])
+    game_over = np.concatenate([_tono(f, 0.25, fm, decaimiento=2.5) for f in (392.0, 311.13, 261.63, 196.0)])
+    return [golpe, perdida, nivel, game_over]
+
+
+def _a_sound(onda, canales, volumen):
+    """Convierte una onda float32 en un pygame.mixer.Sound de 16 bits."""
+    muestras = (onda * (32767 * volumen)).astype(np.int16)
+    if canales > 1:
+        muestras = np.ascontiguousarray(np.repeat(muestras[:, None], canales, axis=1))
+    return pygame.sndarray.make_sound(muestras)
+
+
+# =============================================================================
+# MOTOR
+# =============================================================================
+
+class MotorAudio:
+    """
+    PATRÓN: SINGLETON
+    -----------------
+    Único dueño del mezclador de Pygame. Mientras no se llame a iniciar()
+    (p. ej. en la simulación headless) reproducir() no hace nada.
+    """
+
+    _instancia = None
+
+    def __new__(cls):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+            cls._instancia._inicializar()
+        return cls._instancia
+
+    @classmethod
+    def obtener_instancia(cls):
+        """Método estático para obtener la instancia Singleton."""
+        if cls._instancia is None:
+            cls()
+        return cls._instancia
+
+    def _inicializar(self):
+        """Estado vacío: sin mezclador ni sonidos."""
+        self.activo = False
+        self.sonidos = []
+        self.canales = []
+        self.inicio_canal = []
+        self.ultimo_disparo = [-10 ** 9] * len(INTERVALOS_MINIMOS)
+        self.robos = 0
+        self.descartados = 0
+
+    def iniciar(self, frecuencia=44100, tamano_buffer=512, num_canales=8, volumen=1.0):
+        """
+        Abre el mezclador y precarga los efectos.
+
+        Args:
+            frecuencia: Frecuencia de muestreo en Hz
+            tamano_buffer: Muestras por bloque del mezclador (menos = menos latencia)
+            num_canales: Tamaño del grupo fijo de canales
+            volumen: Volumen de los efectos en [0, 1]
+
+        Returns:
+            True si el audio quedó disponible
+        """
+        if self.activo:
+            return True
+
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frecuencia, -16, 2, tamano_buffer)
+            frecuencia, _, canales = pygame.mixer.get_init()
+
+            pygame.mixer.set_num_channels(num_canales)
+            self.canales = [pygame.mixer.Channel(i) for i in range(num_canales)]
+            self.inicio_canal = [0] * num_canales
+
+            self.sonidos = [_a_sound(onda, canales, volumen) for onda in sintetizar_efectos(frecuencia)]
+        except pygame.error as error:
+            registro.warning("⚠️ [AUDIO] Sin audio: %s", error)
+            self._inicializar()
+            return False
+
+        self.activo = True
+        registro.info("🔊 [AUDIO] Mezclador a %s Hz, buffer de %s muestras, %s canales",
+                      frecuencia, tamano_buffer, num_canales)
+        return True
+
+    def reproducir(self, sonido):
+        """
+        Dispara un efecto. No reserva memoria ni bloquea: elige un canal
+        libre del grupo (o roba el más antiguo) y llama a Channel.play().
+
+        Args:
+            sonido: Identificador SONIDO_*
+        """
+        if not self.activo:
+            return
+
+        ahora = pygame.time.get_ticks()
+        if ahora - self.ultimo_disparo[sonido] < INTERVALOS_MINIMOS[sonido]:
+            self.descartados += 1
+            return
+        self.ultimo_disparo[sonido] = ahora
+
+        canales = self.canales
+        inicio = self.inicio_canal
+        elegido = 0
+        for i in range(len(canales)):
+            if not canales[i].get_busy():
+                elegido = i
+                break
+            if inicio[i] < inicio[elegido]:
+                elegido = i
+        else:
+            # Todos ocupados: robar la voz más antigua
+            self.robos += 1
+
+        inicio[elegido] = ahora
+        canales[elegido].play(self.sonidos[sonido])
+
+    def detener(self):
+        """Cierra el mezclador."""
+        if self.activo:
+            pygame.mixer.quit()
+        self._inicializar()
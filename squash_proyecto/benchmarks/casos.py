@@ -0,0 +1,306 @@
+# pylint: disable=all
+"""
+Casos de Benchmark
+==================
+Cada caso es una función que prepara lo que necesita y retorna la
+función a medir (una muestra por llamada); si esa función retorna un
+número, ese es el tiempo de la muestra en nanosegundos. Se registran
+con el decorador @caso y el ejecutor (benchmarks.ejecutor) los corre
+en orden.
+
+Todos corren con SDL_VIDEODRIVER=dummy: no abren ventana ni necesitan
+una tarjeta de video, así que sirven igual en una máquina de CI. El
+backend de texturas usa el renderer por software de SDL.
+"""
+
+import os
+
+# Antes de importar pygame: sin ventana ni dispositivo de audio reales
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import random
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+import pygame
+from config.configuracion import ConfiguracionJuego, ANCHO_CANCHA, ALTO_CANCHA
+from estados.gestor_estados import GestorEstados
+from estados.estado_menu import EstadoMenu
+from estados.estado_jugando import EstadoJugando
+from estados.estado_pausa import EstadoPausa
+from estrategias.difficultad import DificultadNormal
+from entidades.fabrica_pelotas import FabricaPelotas
+from comandos.sistema_comandos import InvocadorComandos, ComandoAgregarPuntos
+from renderizado.vista import Vista
+from renderizado.lienzo import LienzoTexturas
+
+# Registro de casos: nombre -> (función de preparación, muestras por defecto, descripción)
+CASOS = {}
+
+
+def caso(nombre, muestras, descripcion):
+    """Registra una función de preparación como caso de benchmark."""
+    def registrar(preparar):
+        CASOS[nombre] = (preparar, muestras, descripcion)
+        return preparar
+    return registrar
+
+
+# =============================================================================
+# AUXILIARES
+# =============================================================================
+
+_pantalla = None
+
+
+def obtener_pantalla():
+    """Pantalla (dummy) compartida por todos los casos."""
+    global _pantalla
+    if _pantalla is None:
+        pygame.init()
+        _pantalla = Vista.obtener_instancia().abrir_ventana(ConfiguracionJuego.obtener_instancia())
+    return _pantalla
+
+
+# Semilla de las partidas medidas: todas las corridas miden la misma partida
+SEMILLA_PARTIDA = 22
+
+# Nivel al que la partida medida vuelve a empezar, para medir siempre el
+# juego en un estado normal (en Normal la pelota llega a la velocidad
+# máxima en el nivel 18; más arriba solo crecen los puntos)
+NIVEL_REINICIO = 20
+
+
+def crear_partida(pasos_previos=300, renderizado_sucio=False, pelotas=1, pantalla=None):
+    """
+    EstadoJugando de una partida en curso, jugada por la IA con SEMILLA_PARTIDA.
+
+    Args:
+        pasos_previos: Pasos a jugar antes de medir (HUD y combo poblados)
+        renderizado_sucio: Valor de ConfiguracionJuego.renderizado_sucio
+                           mientras se crea el estado
+        pelotas: Pelotas simultáneas (más de una = multibola)
+        pantalla: Lienzo donde dibujar (por defecto el de obtener_pantalla())
+    """
+    config = ConfiguracionJuego.obtener_instancia()
+    anterior = config.renderizado_sucio
+    config.aplicar({"renderizado_sucio": renderizado_sucio}, "el benchmark")
+    try:
+        gestor = GestorEstados(pantalla or obtener_pantalla())
+        estado = EstadoJugando(gestor, DificultadNormal(), pelotas=pelotas, semilla=SEMILLA_PARTIDA)
+    finally:
+        config.aplicar({"renderizado_sucio": anterior}, "el benchmark")
+
+    gestor.cambiar_estado(estado)
+    estado.input_adapter.cambiar_tipo_entrada("ia")
+    for _ in range(pasos_previos):
+        estado.actualizar()
+    return gestor, estado
+
+
+def muestra_de_partida(medir, **opciones):
+    """
+    Muestra que mide medir(estado) sobre una partida de crear_partida().
+    Antes de cada muestra, y fuera del tiempo medido, la partida vuelve a
+    empezar (con la misma semilla) si le queda una sola vida o llegó a
+    NIVEL_REINICIO: nunca se mide el paso al Game Over ni un nivel que ya
+    no se juega normalmente.
+
+    Args:
+        medir: Función que recibe el EstadoJugando (un paso, un frame...)
+        opciones: Argumentos de crear_partida()
+    """
+    partida = [crear_partida(**opciones)[1]]
+    reloj = time.perf_counter_ns
+
+    def muestra():
+        simulacion = partida[0].simulacion
+        if simulacion.vidas <= 1 or simulacion.nivel >= NIVEL_REINICIO:
+            partida[0] = crear_partida(**opciones)[1]
+        estado = partida[0]
+        inicio = reloj()
+        medir(estado)
+        return reloj() - inicio
+    return muestra
+
+
+def jugar_y_dibujar(estado):
+    """Un paso de la partida y un frame completo."""
+    estado.actualizar()
+    estado.dibujar(0.5)
+
+
+# =============================================================================
+# CASOS
+# =============================================================================
+
+@caso("jugando_actualizar", 5000, "EstadoJugando.actualizar() con la IA jugando")
+def preparar_jugando_actualizar():
+    return muestra_de_partida(EstadoJugando.actualizar)
+
+
+@caso("jugando_dibujar", 1000, "EstadoJugando.dibujar() completo, con HUD")
+def preparar_jugando_dibujar():
+    return muestra_de_partida(jugar_y_dibujar)
+
+
+@caso("jugando_dibujar_sucio", 1000, "EstadoJugando.dibujar() con rectángulos sucios")
+def preparar_jugando_dibujar_sucio():
+    return muestra_de_partida(jugar_y_dibujar, renderizado_sucio=True)
+
+
+@caso("jugando_dibujar_texturas", 1000, "EstadoJugando.dibujar() + presentar con LienzoTexturas")
+def preparar_jugando_dibujar_texturas():
+    obtener_pantalla()
+    lienzo = LienzoTexturas((ANCHO_CANCHA, ALTO_CANCHA), (ANCHO_CANCHA, ALTO_CANCHA))
+
+    def medir(estado):
+        jugar_y_dibujar(estado)
+        lienzo.presentar()
+    return muestra_de_partida(medir, pantalla=lienzo)
+
+
+@caso("multibola_dibujar", 1000, "EstadoJugando.dibujar() con 64 pelotas")
+def preparar_multibola_dibujar():
+    return muestra_de_partida(jugar_y_dibujar, pelotas=64)
+
+
+@caso("pausa_dibujar", 1000, "EstadoPausa.dibujar() cambiando la opción seleccionada")
+def preparar_pausa_dibujar():
+    gestor, estado = crear_partida()
+    estado.dibujar()
+    pausa = EstadoPausa(gestor)
+    gestor.apilar_estado(pausa)
+    pausa.dibujar()
+
+    def muestra():
+        pausa.opcion_seleccionada = (pausa.opcion_seleccionada + 1) % len(pausa.opciones)
+        pausa.dibujar()
+    return muestra
+
+
+@caso("menu_dibujar", 1000, "EstadoMenu.dibujar()")
+def preparar_menu_dibujar():
+    gestor = GestorEstados(obtener_pantalla())
+    menu = EstadoMenu(gestor)
+    gestor.cambiar_estado(menu)
+
+    def muestra():
+        menu.opcion_seleccionada = (menu.opcion_seleccionada + 1) % len(menu.opciones)
+        menu.dibujar()
+    return muestra
+
+
+@caso("fabrica_pelotas", 2000, "100 pelotas con FabricaPelotas.crear_pelota_aleatoria()")
+def preparar_fabrica_pelotas():
+    rng = random.Random(1)
+    crear = FabricaPelotas.crear_pelota_aleatoria
+
+    def muestra():
+        for nivel in range(100):
+            crear(nivel % 10 + 1, rng)
+    return muestra
+
+
+@caso("invocador_comandos", 2000, "64 ejecutar + 32 deshacer + 16 rehacer con el historial lleno")
+def preparar_invocador_comandos():
+    juego = SimpleNamespace(puntaje=0)
+    invocador = InvocadorComandos(capacidad=1024)
+    for _ in range(invocador.limite_historial):
+        invocador.ejecutar_comando(ComandoAgregarPuntos(juego, 10))
+
+    def muestra():
+        for _ in range(64):
+            invocador.ejecutar_comando(ComandoAgregarPuntos(juego, 10))
+        for _ in range(32):
+            invocador.deshacer()
+        for _ in range(16):
+            invocador.rehacer()
+    return muestra
+
+
+@caso("transicion_pausa", 500, "Apilar y desapilar EstadoPausa sobre una partida")
+def preparar_transicion_pausa():
+    gestor, estado = crear_partida()
+    estado.dibujar()
+
+    def muestra():
+        gestor.apilar_estado(EstadoPausa(gestor))
+        gestor.desapilar_estado()
+    return muestra
+
+
+@caso("transicion_menu_jugando", 100, "Menú -> partida nueva -> menú con cambiar_estado()")
+def preparar_transicion_menu_jugando():
+    gestor = GestorEstados(obtener_pantalla())
+    gestor.cambiar_estado(EstadoMenu(gestor))
+    estrategia = DificultadNormal()
+
+    def muestra():
+        gestor.cambiar_estado(EstadoJugando(gestor, estrategia))
+        gestor.cambiar_estado(EstadoMenu(gestor))
+    return muestra
+
+
+# =============================================================================
+# ARRANQUE EN FRÍO (proceso nuevo)
+# =============================================================================
+
+# Mismo arranque que main.main() hasta presentar el primer frame del menú
+SCRIPT_ARRANQUE = r"""
+import os, sys
+sys.path.insert(0, sys.argv[1])
+import pygame
+from config.configuracion import ConfiguracionJuego
+from estados.gestor_estados import GestorEstados
+from estados.estado_menu import EstadoMenu
+from sistema.arranque import InformeArranque, iniciar_video, cargar_en_segundo_plano
+from sistema.registro import configurar_registro
+configurar_registro("WARNING", modo_release=True)
+config = ConfiguracionJuego.obtener_instancia()
+informe = InformeArranque()
+pantalla = iniciar_video(config, informe)
+carga = cargar_en_segundo_plano(config, informe)
+gestor = GestorEstados(pantalla)
+gestor.cambiar_estado(EstadoMenu(gestor))
+gestor.dibujar()
+pygame.display.flip()
+try:
+    import resource
+    pico_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+except ImportError:
+    pico_kb = -1
+print("PRIMER_FRAME", pico_kb, flush=True)
+carga.join()
+"""
+
+
+@caso("arranque_primer_frame", 10, "Proceso nuevo hasta el primer frame del menú")
+def preparar_arranque():
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    entorno = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                   PYGAME_HIDE_SUPPORT_PROMPT="1")
+
+    def muestra():
+        inicio = time.perf_counter_ns()
+        proceso = subprocess.Popen([sys.executable, "-c", SCRIPT_ARRANQUE, raiz],
+                                   stdout=subprocess.PIPE, env=entorno, text=True)
+        duracion = None
+        for linea in proceso.stdout:
+            if linea.startswith("PRIMER_FRAME"):
+                duracion = time.perf_counter_ns() - inicio
+                muestra.memoria_pico_kb = max(muestra.memoria_pico_kb, int(linea.split()[1]))
+                break
+        proceso.stdout.close()
+        if proceso.wait() != 0 or duracion is None:
+            raise RuntimeError("El proceso de arranque terminó sin dibujar el primer frame")
+        # Solo cuenta hasta el primer frame, no el cierre del proceso
+        return duracion
+
+    # El pico de memoria se mide en el proceso hijo (RSS), no con tracemalloc
+    muestra.memoria_pico_kb = 0
+    return muestra
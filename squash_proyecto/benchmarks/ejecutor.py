@@ -0,0 +1,225 @@
+# pylint: disable=all
+"""
+Ejecutor de Benchmarks
+======================
+Corre los casos de benchmarks.casos, calcula percentiles del tiempo por
+muestra y el pico de memoria, y los compara con una línea base en JSON.
+Termina con código 1 si algún caso empeoró más que el umbral, así que
+se puede usar como compuerta en CI.
+
+Uso:
+    python -m squash_proyecto bench                      -> Medir y comparar con la línea base
+    python -m squash_proyecto bench --guardar-base       -> Medir y guardar como línea base
+    python -m squash_proyecto bench --solo jugando_actualizar menu_dibujar
+    python -m squash_proyecto bench --rapido             -> 10% de las muestras (prueba de humo)
+"""
+
+import argparse
+import gc
+import json
+import os
+import time
+import tracemalloc
+import numpy as np
+from benchmarks.casos import CASOS
+from sistema.registro import configurar_registro
+
+RUTA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base.json")
+
+# Métricas que se comparan con la línea base
+METRICAS_COMPARADAS = ("p50_us", "memoria_pico_kb")
+
+# Una regresión de memoria además tiene que superar este margen absoluto: los
+# picos de tracemalloc de los casos chicos son de pocos KB y un 20% es ruido
+MARGEN_MEMORIA_KB = 256
+
+# Muestras descartadas al principio (cachés frías, primera rasterización)
+CALENTAMIENTO = 0.05
+
+
+# =============================================================================
+# MEDICIÓN
+# =============================================================================
+
+def medir_tiempos(muestra, cantidad):
+    """
+    Llama 'cantidad' veces a la muestra y retorna los tiempos en ns.
+    El recolector de basura queda apagado mientras se mide (como en timeit).
+    """
+    reloj = time.perf_counter_ns
+    tiempos = np.empty(cantidad, dtype=np.int64)
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(cantidad):
+            inicio = reloj()
+            resultado = muestra()
+            tiempos[i] = reloj() - inicio if resultado is None else resultado
+    finally:
+        if gc_activo:
+            gc.enable()
+    return tiempos
+
+
+def medir_memoria(preparar, cantidad):
+    """Pico de memoria (KB, tracemalloc) de preparar el caso y correr algunas muestras."""
+    tracemalloc.start()
+    try:
+        muestra = preparar()
+        for _ in range(cantidad):
+            muestra()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico / 1024
+
+
+def correr_caso(nombre, factor=1.0):
+    """
+    Corre un caso y resume sus tiempos.
+
+    Args:
+        nombre: Nombre registrado en CASOS
+        factor: Multiplicador de la cantidad de muestras
+
+    Returns:
+        Diccionario con muestras, media, p50/p95/p99/max (µs) y pico de memoria (KB)
+    """
+    preparar, muestras, _ = CASOS[nombre]
+    cantidad = max(int(muestras * factor), 5)
+    calentamiento = max(int(cantidad * CALENTAMIENTO), 1)
+
+    muestra = preparar()
+    medir_tiempos(muestra, calentamiento)
+    tiempos = medir_tiempos(muestra, cantidad) / 1000.0
+
+    if hasattr(muestra, "memoria_pico_kb"):
+        # El caso mide su propia memoria (p. ej. en otro proceso)
+        memoria = float(muestra.memoria_pico_kb)
+    else:
+        memoria = medir_memoria(preparar, min(cantidad, 100))
+
+    p50, p95, p99 = np.percentile(tiempos, (50, 95, 99))
+    return {
+        "muestras": cantidad,
+        "media_us": float(tiempos.mean()),
+        "p50_us": float(p50),
+        "p95_us": float(p95),
+        "p99_us": float(p99),
+        "max_us": float(tiempos.max()),
+        "memoria_pico_kb": memoria,
+    }
+
+
+# =============================================================================
+# LÍNEA BASE
+# =============================================================================
+
+def comparar(resultados, base, umbral):
+    """
+    Compara los resultados con la línea base.
+
+    Returns:
+        Lista de (caso, métrica, valor_base, valor_actual) que empeoraron
+        más que el umbral (y, en memoria, más que MARGEN_MEMORIA_KB)
+    """
+    regresiones = []
+    for nombre, actual in resultados.items():
+        anterior = base.get(nombre)
+        if anterior is None:
+            continue
+        for metrica in METRICAS_COMPARADAS:
+            valor_base = anterior.get(metrica)
+            if not valor_base or valor_base <= 0:
+                continue
+            limite = valor_base * (1.0 + umbral)
+            if metrica == "memoria_pico_kb":
+                limite = max(limite, valor_base + MARGEN_MEMORIA_KB)
+            if actual[metrica] > limite:
+                regresiones.append((nombre, metrica, valor_base, actual[metrica]))
+    return regresiones
+
+
+def cambio(actual, anterior):
+    """Texto con el cambio porcentual respecto de la línea base."""
+    if not anterior:
+        return "    —"
+    return f"{(actual / anterior - 1.0) * 100:+6.1f}%"
+
+
+# =============================================================================
+# PUNTO DE ENTRADA
+# =============================================================================
+
+def crear_parser():
+    """Crea el parser de argumentos del subcomando 'bench'."""
+    parser = argparse.ArgumentParser(
+        prog="python -m squash_proyecto bench",
+        description="Benchmarks de actualización, dibujo, arranque y memoria con compuerta de regresión."
+    )
+    parser.add_argument("--solo", nargs="+", choices=list(CASOS), metavar="CASO",
+                        help="Correr solo estos casos (por defecto todos: " + ", ".join(CASOS) + ")")
+    parser.add_argument("--base", default=RUTA_BASE,
+                        help="Archivo JSON de la línea base")
+    parser.add_argument("--guardar-base", action="store_true",
+                        help="Guardar los resultados como nueva línea base")
+    parser.add_argument("--umbral", type=float, default=0.20,
+                        help="Empeoramiento tolerado antes de fallar (por defecto 0.20 = 20%%)")
+    parser.add_argument("--rapido", action="store_true",
+                        help="Usar el 10%% de las muestras (prueba de humo, no para comparar)")
+    parser.add_argument("--json", metavar="RUTA",
+                        help="Guardar también los resultados en este archivo")
+    return parser
+
+
+def ejecutar_benchmarks(argv=None):
+    """Ejecuta el subcomando 'bench'."""
+    args = crear_parser().parse_args(argv)
+    configurar_registro("WARNING", modo_release=True)
+
+    nombres = args.solo or list(CASOS)
+    factor = 0.1 if args.rapido else 1.0
+
+    base = {}
+    if os.path.exists(args.base):
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+
+    print("=" * 100)
+    print(f"⏱️ [BENCH] {len(nombres)} casos | línea base: "
+          f"{args.base if base else 'ninguna (use --guardar-base)'}")
+    print(f"   {'caso':<26}{'p50 µs':>11}{'p95 µs':>11}{'p99 µs':>11}{'max µs':>11}"
+          f"{'memoria KB':>12}{'Δ p50':>9}{'Δ mem':>9}")
+
+    resultados = {}
+    for nombre in nombres:
+        r = correr_caso(nombre, factor)
+        resultados[nombre] = r
+        anterior = base.get(nombre, {})
+        print(f"   {nombre:<26}{r['p50_us']:>11.1f}{r['p95_us']:>11.1f}{r['p99_us']:>11.1f}"
+              f"{r['max_us']:>11.1f}{r['memoria_pico_kb']:>12.0f}"
+              f"{cambio(r['p50_us'], anterior.get('p50_us')):>9}"
+              f"{cambio(r['memoria_pico_kb'], anterior.get('memoria_pico_kb')):>9}", flush=True)
+    print("=" * 100)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2)
+
+    if args.guardar_base:
+        # Se conservan los casos de la base que no se corrieron esta vez
+        base.update(resultados)
+        with open(args.base, "w", encoding="utf-8") as archivo:
+            json.dump(base, archivo, indent=2)
+        print(f"💾 [BENCH] Línea base guardada en {args.base}")
+        return 0
+
+    regresiones = comparar(resultados, base, args.umbral)
+    for nombre, metrica, valor_base, valor in regresiones:
+        print(f"❌ [BENCH] Regresión en {nombre}: {metrica} {valor_base:.1f} → {valor:.1f} "
+              f"({cambio(valor, valor_base).strip()}, umbral {args.umbral:.0%})")
+    if regresiones:
+        return 1
+    if base:
+        print(f"✅ [BENCH] Sin regresiones (umbral {args.umbral:.0%})")
+    return 0
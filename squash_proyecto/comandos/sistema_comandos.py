@@ -5,7 +5,12 @@ PATRÓN COMMAND - Sistema de Comandos
 Encapsula acciones como objetos, permitiendo deshacer/rehacer.
 """
 
+import json
 from abc import ABC, abstractmethod
+from config.configuracion import ANCHO_CANCHA
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("command")
 
 # =============================================================================
 # PATRÓN COMMAND - INTERFACE
@@ -17,8 +22,13 @@ class Comando(ABC):
     ---------------
     Interface para todos los comandos del juego.
     Encapsula una acción y su lógica de ejecución/deshecho.
+    
+    Los comandos usan __slots__: se crean en cada golpe y el historial
+    puede guardar miles, así que no llevan un __dict__ por instancia.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def ejecutar(self):
         """Ejecuta el comando."""
@@ -32,6 +42,10 @@ class Comando(ABC):
     def obtener_descripcion(self):
         """Retorna una descripción del comando."""
         return self.__class__.__name__
+    
+    def obtener_datos(self):
+        """Datos serializables del comando (para exportar el diario)."""
+        return {}
 
 
 # =============================================================================
@@ -41,6 +55,8 @@ class Comando(ABC):
 class ComandoCambiarModo(Comando):
     """Comando para cambiar el modo de la raqueta."""
     
+    __slots__ = ("raqueta", "nuevo_modo", "modo_anterior")
+    
     def __init__(self, raqueta, nuevo_modo):
         self.raqueta = raqueta
         self.nuevo_modo = nuevo_modo
@@ -50,21 +66,26 @@ class ComandoCambiarModo(Comando):
         """Cambia al nuevo modo."""
         self.modo_anterior = self.raqueta.modo_actual
         self.raqueta.cambiar_modo(self.nuevo_modo)
-        print(f"⚡ [COMMAND] Modo cambiado a: {self.nuevo_modo}")
+        registro.debug("⚡ [COMMAND] Modo cambiado a: %s", self.nuevo_modo)
     
     def deshacer(self):
         """Vuelve al modo anterior."""
         if self.modo_anterior:
             self.raqueta.cambiar_modo(self.modo_anterior)
-            print(f"↩️ [COMMAND] Modo revertido a: {self.modo_anterior}")
+            registro.debug("↩️ [COMMAND] Modo revertido a: %s", self.modo_anterior)
     
     def obtener_descripcion(self):
         return f"CambiarModo({self.nuevo_modo})"
+    
+    def obtener_datos(self):
+        return {"modo": self.nuevo_modo, "anterior": self.modo_anterior}
 
 
 class ComandoMoverRaqueta(Comando):
     """Comando para mover la raqueta."""
     
+    __slots__ = ("raqueta", "direccion", "distancia", "posicion_anterior")
+    
     def __init__(self, raqueta, direccion, distancia):
         self.raqueta = raqueta
         self.direccion = direccion  # 'izquierda' o 'derecha'
@@ -78,18 +99,23 @@ class ComandoMoverRaqueta(Comando):
         if self.direccion == 'izquierda':
             self.raqueta.x = max(0, self.raqueta.x - self.distancia)
         elif self.direccion == 'derecha':
-            limite = 1000 - self.raqueta.ancho
+            limite = ANCHO_CANCHA - self.raqueta.ancho
             self.raqueta.x = min(limite, self.raqueta.x + self.distancia)
     
     def deshacer(self):
         """Restaura la posición anterior."""
         if self.posicion_anterior is not None:
             self.raqueta.x = self.posicion_anterior
+    
+    def obtener_datos(self):
+        return {"direccion": self.direccion, "distancia": self.distancia}
 
 
 class ComandoOtorgarVida(Comando):
     """Comando para otorgar una vida al jugador."""
     
+    __slots__ = ("juego", "vida_otorgada")
+    
     def __init__(self, juego):
         self.juego = juego
         self.vida_otorgada = False
@@ -98,19 +124,21 @@ class ComandoOtorgarVida(Comando):
         """Otorga una vida."""
         self.juego.vidas += 1
         self.vida_otorgada = True
-        print(f"❤️ [COMMAND] Vida otorgada. Total: {self.juego.vidas}")
+        registro.debug("❤️ [COMMAND] Vida otorgada. Total: %s", self.juego.vidas)
     
     def deshacer(self):
         """Quita la vida otorgada."""
         if self.vida_otorgada and self.juego.vidas > 0:
             self.juego.vidas -= 1
             self.vida_otorgada = False
-            print(f"↩️ [COMMAND] Vida revertida. Total: {self.juego.vidas}")
+            registro.debug("↩️ [COMMAND] Vida revertida. Total: %s", self.juego.vidas)
 
 
 class ComandoAgregarPuntos(Comando):
     """Comando para agregar puntos."""
     
+    __slots__ = ("juego", "puntos", "puntos_agregados")
+    
     def __init__(self, juego, puntos):
         self.juego = juego
         self.puntos = puntos
@@ -126,11 +154,16 @@ class ComandoAgregarPuntos(Comando):
         if self.puntos_agregados:
             self.juego.puntaje -= self.puntos
             self.puntos_agregados = False
+    
+    def obtener_datos(self):
+        return {"puntos": self.puntos}
 
 
 class ComandoCambiarDificultad(Comando):
     """Comando para cambiar la dificultad del juego."""
     
+    __slots__ = ("gestor_dificultad", "nueva_estrategia", "estrategia_anterior")
+    
     def __init__(self, gestor_dificultad, nueva_estrategia):
         self.gestor_dificultad = gestor_dificultad
         self.nueva_estrategia = nueva_estrategia
@@ -140,13 +173,16 @@ class ComandoCambiarDificultad(Comando):
         """Cambia la estrategia de dificultad."""
         self.estrategia_anterior = self.gestor_dificultad.obtener_estrategia()
         self.gestor_dificultad.cambiar_estrategia(self.nueva_estrategia)
-        print(f"⚙️ [COMMAND] Dificultad cambiada a: {self.nueva_estrategia.obtener_nombre()}")
+        registro.debug("⚙️ [COMMAND] Dificultad cambiada a: %s", self.nueva_estrategia.obtener_nombre())
     
     def deshacer(self):
         """Vuelve a la estrategia anterior."""
         if self.estrategia_anterior:
             self.gestor_dificultad.cambiar_estrategia(self.estrategia_anterior)
-            print(f"↩️ [COMMAND] Dificultad revertida a: {self.estrategia_anterior.obtener_nombre()}")
+            registro.debug("↩️ [COMMAND] Dificultad revertida a: %s", self.estrategia_anterior.obtener_nombre())
+    
+    def obtener_datos(self):
+        return {"dificultad": self.nueva_estrategia.obtener_nombre()}
 
 
 # =============================================================================
@@ -157,12 +193,52 @@ class InvocadorComandos:
     """
     Invocador que ejecuta comandos y mantiene historial
     para deshacer/rehacer.
+    
+    El historial es un buffer circular de capacidad fija: agregar,
+    deshacer, rehacer y descartar el comando más viejo son O(1).
+    Los comandos deshechos quedan en el buffer hasta que un comando
+    nuevo los pisa (así se pueden rehacer).
     """
     
-    def __init__(self):
-        self.historial = []
-        self.indice_actual = -1
-        self.limite_historial = 50
+    def __init__(self, capacidad=None):
+        """
+        Args:
+            capacidad: Comandos que se recuerdan (por defecto
+                       ConfiguracionJuego.capacidad_historial)
+        """
+        if capacidad is None:
+            from config.configuracion import ConfiguracionJuego
+            capacidad = ConfiguracionJuego.obtener_instancia().capacidad_historial
+        
+        self.capacidad = max(1, capacidad)
+        self._buffer = [None] * self.capacidad
+        self._inicio = 0      # Posición del comando más viejo
+        self._cantidad = 0    # Comandos guardados (aplicados + deshechos)
+        self._aplicados = 0   # Comandos aplicados (los primeros de los guardados)
+        self.descartados = 0  # Comandos viejos pisados por falta de espacio
+    
+    # Compatibilidad con la interfaz anterior basada en lista
+    @property
+    def limite_historial(self):
+        return self.capacidad
+    
+    @property
+    def indice_actual(self):
+        return self._aplicados - 1
+    
+    @property
+    def historial(self):
+        """Copia ordenada (del más viejo al más nuevo) de los comandos guardados."""
+        return list(self)
+    
+    def __len__(self):
+        return self._cantidad
+    
+    def __iter__(self):
+        buffer = self._buffer
+        capacidad = self.capacidad
+        for i in range(self._cantidad):
+            yield buffer[(self._inicio + i) % capacidad]
     
     def ejecutar_comando(self, comando):
         """
@@ -170,61 +246,92 @@ class InvocadorComandos:
         """
         comando.ejecutar()
         
-        # Eliminar comandos posteriores si estamos en medio del historial
-        self.historial = self.historial[:self.indice_actual + 1]
+        # Descartar los comandos deshechos (ya no se pueden rehacer)
+        self._cantidad = self._aplicados
         
-        # Agregar nuevo comando
-        self.historial.append(comando)
-        self.indice_actual += 1
+        # Historial lleno: se pisa el comando más viejo
+        if self._cantidad == self.capacidad:
+            self._inicio = (self._inicio + 1) % self.capacidad
+            self._cantidad -= 1
+            self._aplicados -= 1
+            self.descartados += 1
         
-        # Limitar tamaño del historial
-        if len(self.historial) > self.limite_historial:
-            self.historial.pop(0)
-            self.indice_actual -= 1
+        self._buffer[(self._inicio + self._cantidad) % self.capacidad] = comando
+        self._cantidad += 1
+        self._aplicados += 1
     
     def deshacer(self):
         """Deshace el último comando."""
         if self.puede_deshacer():
-            comando = self.historial[self.indice_actual]
+            self._aplicados -= 1
+            comando = self._buffer[(self._inicio + self._aplicados) % self.capacidad]
             comando.deshacer()
-            self.indice_actual -= 1
-            print(f"↩️ [COMMAND] Deshecho: {comando.obtener_descripcion()}")
+            registro.debug("↩️ [COMMAND] Deshecho: %s", comando.obtener_descripcion())
             return True
         
-        print("⚠️ [COMMAND] No hay comandos para deshacer")
+        registro.warning("⚠️ [COMMAND] No hay comandos para deshacer")
         return False
     
     def rehacer(self):
         """Rehace el siguiente comando."""
         if self.puede_rehacer():
-            self.indice_actual += 1
-            comando = self.historial[self.indice_actual]
+            comando = self._buffer[(self._inicio + self._aplicados) % self.capacidad]
             comando.ejecutar()
-            print(f"↪️ [COMMAND] Rehecho: {comando.obtener_descripcion()}")
+            self._aplicados += 1
+            registro.debug("↪️ [COMMAND] Rehecho: %s", comando.obtener_descripcion())
             return True
         
-        print("⚠️ [COMMAND] No hay comandos para rehacer")
+        registro.warning("⚠️ [COMMAND] No hay comandos para rehacer")
         return False
     
     def puede_deshacer(self):
         """Verifica si se puede deshacer."""
-        return self.indice_actual >= 0
+        return self._aplicados > 0
     
     def puede_rehacer(self):
         """Verifica si se puede rehacer."""
-        return self.indice_actual < len(self.historial) - 1
+        return self._aplicados < self._cantidad
     
     def limpiar_historial(self):
         """Limpia el historial de comandos."""
-        self.historial.clear()
-        self.indice_actual = -1
-        print("🧹 [COMMAND] Historial limpiado")
+        self._buffer = [None] * self.capacidad
+        self._inicio = 0
+        self._cantidad = 0
+        self._aplicados = 0
+        self.descartados = 0
+        registro.info("🧹 [COMMAND] Historial limpiado")
+    
+    def exportar(self, destino):
+        """
+        Escribe el diario de comandos como JSON Lines (un comando por línea,
+        del más viejo al más nuevo).
+        
+        Args:
+            destino: Ruta del archivo o un objeto con write()
+        
+        Returns:
+            Cantidad de comandos escritos
+        """
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8") as archivo:
+                return self.exportar(archivo)
+        
+        # "n" es la posición en el historial completo de la sesión
+        for i, comando in enumerate(self):
+            destino.write(json.dumps({
+                "n": self.descartados + i,
+                "comando": comando.__class__.__name__,
+                "aplicado": i < self._aplicados,
+                "datos": comando.obtener_datos()
+            }, ensure_ascii=False))
+            destino.write("\n")
+        return self._cantidad
     
     def mostrar_historial(self):
         """Muestra el historial de comandos."""
-        print("\n📜 [COMMAND] HISTORIAL DE COMANDOS")
-        print("=" * 50)
-        for i, comando in enumerate(self.historial):
+        lineas = ["📜 [COMMAND] HISTORIAL DE COMANDOS", "=" * 50]
+        for i, comando in enumerate(self):
             marcador = "→" if i == self.indice_actual else " "
-            print(f"{marcador} {i+1}. {comando.obtener_descripcion()}")
-        print("=" * 50 + "\n")
\ No newline at end of file
+            lineas.append(f"{marcador} {i+1}. {comando.obtener_descripcion()}")
+        lineas.append("=" * 50)
+        registro.info("\n".join(lineas))
\ No newline at end of file
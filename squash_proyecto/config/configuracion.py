@@ -1,14 +1,128 @@
 """
 PATRÓN SINGLETON - Configuración del Juego
 ===========================================
+Los ajustes de AJUSTES_PERSISTENTES se pueden guardar y cargar de un
+archivo JSON (por defecto RUTA_CONFIGURACION), para ajustar cada máquina
+sin tocar el código. El juego con ventana carga el archivo al arrancar,
+le aplica las opciones de la línea de comandos (config.linea_comandos) y
+congela la configuración: desde ahí es de solo lectura.
 """
 
+import json
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("config")
+
+# Archivo de configuración por defecto (relativo a la carpeta de trabajo)
+RUTA_CONFIGURACION = "squash_config.json"
+
+# Valores posibles de los ajustes de opción
+ESCALADOS = ("sdl", "software")
+BACKENDS_RENDER = ("superficie", "texturas")
+NIVELES_REGISTRO = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+CALIDADES_EFECTOS = ("baja", "alta")
+
+# Dimensiones de la cancha: unidades de la lógica (física, IA, repeticiones),
+# independientes de la resolución a la que se dibuje
+ANCHO_CANCHA = 1000
+ALTO_CANCHA = 700
+
+# Velocidad máxima de la pelota por componente, en unidades por paso. Menor
+# que el alto de la raqueta (15): un golpe nunca deja a la pelota a un paso
+# de otro golpe, por rápido que sea el nivel
+VELOCIDAD_MAXIMA_PELOTA = 14
+
+
+# =============================================================================
+# VALIDACIÓN DE AJUSTES
+# =============================================================================
+
+def _entero(minimo, maximo):
+    """Validador de un entero en [minimo, maximo]."""
+    def validar(valor):
+        if isinstance(valor, bool) or not isinstance(valor, int):
+            raise ValueError(f"se esperaba un entero, no {valor!r}")
+        if not minimo <= valor <= maximo:
+            raise ValueError(f"{valor} fuera de [{minimo}, {maximo}]")
+        return valor
+    return validar
+
+
+def _real(minimo, maximo):
+    """Validador de un número en [minimo, maximo]."""
+    def validar(valor):
+        if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+            raise ValueError(f"se esperaba un número, no {valor!r}")
+        if not minimo <= valor <= maximo:
+            raise ValueError(f"{valor} fuera de [{minimo}, {maximo}]")
+        return float(valor)
+    return validar
+
+
+def _potencia_de_dos(minimo, maximo):
+    """Validador de una potencia de dos en [minimo, maximo]."""
+    validar_entero = _entero(minimo, maximo)
+    def validar(valor):
+        valor = validar_entero(valor)
+        if valor & (valor - 1):
+            raise ValueError(f"{valor} no es potencia de dos")
+        return valor
+    return validar
+
+
+def _opcion(opciones):
+    """Validador de un valor de la tupla opciones."""
+    def validar(valor):
+        if valor not in opciones:
+            raise ValueError(f"{valor!r} no es una de: {', '.join(opciones)}")
+        return valor
+    return validar
+
+
+def _booleano(valor):
+    """Validador de true/false."""
+    if not isinstance(valor, bool):
+        raise ValueError(f"se esperaba true o false, no {valor!r}")
+    return valor
+
+
+def _tamano_opcional(valor):
+    """Validador de [ancho, alto] o None."""
+    if valor is None:
+        return None
+    if (not isinstance(valor, (list, tuple)) or len(valor) != 2
+            or any(isinstance(lado, bool) or not isinstance(lado, int) or lado <= 0 for lado in valor)):
+        raise ValueError(f"se esperaba [ancho, alto] en píxeles o null, no {valor!r}")
+    return tuple(valor)
+
+
+# Ajustes que se guardan en el archivo: nombre -> validador (retorna el
+# valor normalizado o lanza ValueError)
+AJUSTES_PERSISTENTES = {
+    "fps": _entero(0, 1000),
+    "vsync": _booleano,
+    "escala_render": _real(0.25, 2.0),
+    "tamano_ventana": _tamano_opcional,
+    "escalado": _opcion(ESCALADOS),
+    "backend_render": _opcion(BACKENDS_RENDER),
+    "headless": _booleano,
+    "renderizado_sucio": _booleano,
+    "buffer_audio": _potencia_de_dos(64, 8192),
+    "nivel_registro": _opcion(NIVELES_REGISTRO),
+    "modo_release": _booleano,
+    "calidad_efectos": _opcion(CALIDADES_EFECTOS),
+}
+
+
 class ConfiguracionJuego:
     """
     PATRÓN: SINGLETON
     -----------------
     Gestiona la configuración global del juego.
     Asegura una única instancia en todo el programa.
+    
+    Se lee con acceso directo a atributos (config.fps); una vez congelada
+    cualquier asignación lanza AttributeError.
     """
     
     _instancia = None
@@ -28,11 +142,48 @@ class ConfiguracionJuego:
     
     def _inicializar(self):
         """Inicializa la configuración por defecto."""
-        self.ancho_pantalla = 1000
-        self.alto_pantalla = 700
-        self.fps = 60
+        self.congelada = False
+        self.origen = "valores por defecto"  # Archivo del que se cargó
+        
+        # Video: framebuffer interno de la cancha por escala_render (0.5 = la
+        # mitad de cada lado) escalado a la ventana (None = tamaño de la
+        # cancha) con "sdl" (pygame.SCALED) o "software" (transform.scale);
+        # vsync si el driver lo permite.
+        # Backend: "superficie" (pygame.Surface) o "texturas" (Renderer de SDL2)
+        self.backend_render = "superficie"
+        self.escala_render = 1.0
+        self.tamano_ventana = None
+        self.escalado = "sdl"
+        self.vsync = False
+        self.fps = 60  # Límite de frames dibujados por segundo (0 = sin límite)
+        self.headless = False  # Sin ventana ni dispositivo de audio (drivers dummy de SDL)
+        
+        # Simulación de paso fijo: la velocidad del juego no depende de fps
+        self.tasa_simulacion = 60  # Pasos de lógica por segundo
+        self.max_pasos_por_frame = 5  # Pasos seguidos antes de forzar un dibujo
+        
         self.color_fondo = (0, 0, 30)
         
+        # Renderizado por rectángulos sucios (solo actualiza lo que se movió)
+        self.renderizado_sucio = False
+        
+        # Calidad de efectos: "alta" suaviza los bordes de los sprites de las
+        # pelotas (se rasterizan una vez); "baja" los deja con bordes duros
+        self.calidad_efectos = "baja"
+        
+        # Estados inactivos (menú, pausa, game over): esperar eventos en vez
+        # de redibujar a tasa fija; se redibuja al menos cada tantos ms
+        self.espera_inactivo_ms = 500
+        
+        # Registro (logging): nivel mínimo y modo release, que apaga los
+        # mensajes de las rutas calientes (golpes, comandos, sonidos)
+        self.nivel_registro = "INFO"
+        self.modo_release = False
+        
+        # Perfilador de frames (F3): frames en los buffers y refresco del overlay
+        self.frames_perfilador = 600
+        self.intervalo_perfilador_ms = 250
+        
         # Colores de la interfaz
         self.color_texto = (255, 255, 255)
         self.color_secundario = (100, 200, 255)
@@ -42,17 +193,91 @@ class ConfiguracionJuego:
         # Configuración de audio
         self.volumen_musica = 0.5
         self.volumen_efectos = 0.7
+        self.frecuencia_audio = 44100
+        self.buffer_audio = 512  # Muestras por bloque del mezclador (menos = menos latencia)
+        self.canales_audio = 8  # Voces simultáneas antes de robar la más antigua
         
         # Configuración de juego
         self.max_nivel = 10
         self.max_pelotas_especiales = 3
+        self.capacidad_historial = 1024  # Comandos en el historial de deshacer/rehacer
+        self.nivel_ia = "medio"  # Habilidad de la entrada 'ia' (novato, medio, experto)
         
-        print("⚙️ [SINGLETON] Configuración inicializada")
+        # Repeticiones: grabar cada partida en carpeta_repeticiones/*.sqrp
+        self.grabar_repeticiones = False
+        self.carpeta_repeticiones = "repeticiones"
+        
+        registro.info("⚙️ [SINGLETON] Configuración inicializada")
+    
+    def __setattr__(self, nombre, valor):
+        if self.__dict__.get("congelada"):
+            raise AttributeError(f"Configuración congelada: no se puede cambiar '{nombre}'")
+        super().__setattr__(nombre, valor)
+    
+    def congelar(self):
+        """Vuelve la configuración de solo lectura (al terminar de cargarla)."""
+        self.congelada = True
+    
+    def aplicar(self, valores, origen):
+        """
+        Valida y aplica ajustes persistentes. Los nombres desconocidos se
+        avisan y se ignoran.
+        
+        Args:
+            valores: dict nombre -> valor
+            origen: De dónde vienen (para los mensajes)
+        
+        Raises:
+            ValueError: Si algún valor no es válido (entonces no se aplica ninguno)
+        """
+        validados = {}
+        errores = []
+        for nombre, valor in valores.items():
+            validar = AJUSTES_PERSISTENTES.get(nombre)
+            if validar is None:
+                registro.warning("⚠️ [CONFIG] Ajuste desconocido en %s: %s", origen, nombre)
+                continue
+            try:
+                validados[nombre] = validar(valor)
+            except ValueError as error:
+                errores.append(f"{nombre}: {error}")
+        
+        if errores:
+            raise ValueError(f"Configuración inválida en {origen}: " + "; ".join(errores))
+        for nombre, valor in validados.items():
+            setattr(self, nombre, valor)
     
-    def guardar_configuracion(self):
-        """Guarda la configuración en un archivo (para futuras implementaciones)."""
-        print("💾 [SINGLETON] Configuración guardada")
+    def guardar_configuracion(self, ruta=RUTA_CONFIGURACION):
+        """Guarda los ajustes persistentes en un archivo JSON."""
+        valores = {nombre: getattr(self, nombre) for nombre in AJUSTES_PERSISTENTES}
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(valores, archivo, indent=2)
+            archivo.write("\n")
+        registro.info("💾 [SINGLETON] Configuración guardada en %s", ruta)
     
-    def cargar_configuracion(self):
-        """Carga la configuración desde un archivo (para futuras implementaciones)."""
-        print("📂 [SINGLETON] Configuración cargada")
\ No newline at end of file
+    def cargar_configuracion(self, ruta=RUTA_CONFIGURACION):
+        """
+        Carga los ajustes persistentes de un archivo JSON. Si no existe se
+        mantienen los valores actuales.
+        
+        Returns:
+            True si se leyó el archivo
+        
+        Raises:
+            ValueError: Si el archivo no es JSON válido o tiene ajustes inválidos
+        """
+        try:
+            with open(ruta, encoding="utf-8") as archivo:
+                valores = json.load(archivo)
+        except FileNotFoundError:
+            registro.info("📂 [SINGLETON] No existe %s, se usan los valores por defecto", ruta)
+            return False
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{ruta} no es JSON válido: {error}") from None
+        
+        if not isinstance(valores, dict):
+            raise ValueError(f"{ruta} debe contener un objeto JSON")
+        self.aplicar(valores, ruta)
+        self.origen = ruta
+        registro.info("📂 [SINGLETON] Configuración cargada de %s", ruta)
+        return True
\ No newline at end of file
@@ -0,0 +1,86 @@
+# pylint: disable=all
+"""
+Opciones del Juego con Ventana
+==============================
+Los ajustes salen, en orden de prioridad creciente, de los valores por
+defecto de ConfiguracionJuego, del archivo de configuración y de las
+opciones de la línea de comandos. Todo se valida con los mismos
+validadores (AJUSTES_PERSISTENTES) y al final la configuración queda
+congelada.
+
+Uso:
+    python -m squash_proyecto --config cabina.json --fps 0 --escala-render 0.5
+    python -m squash_proyecto --vsync --calidad-efectos alta --guardar-config
+    python -m squash_proyecto --renderizado-sucio --modo-release
+"""
+
+import argparse
+from config.configuracion import (ConfiguracionJuego, RUTA_CONFIGURACION, ESCALADOS,
+                                  BACKENDS_RENDER, NIVELES_REGISTRO, CALIDADES_EFECTOS)
+
+# Opciones de la línea de comandos que pisan un ajuste del mismo nombre
+OPCIONES_AJUSTES = ("fps", "vsync", "escala_render", "headless", "renderizado_sucio",
+                    "buffer_audio", "nivel_registro", "modo_release", "calidad_efectos",
+                    "backend_render", "escalado")
+
+
+def crear_parser():
+    """Crea el parser de argumentos del juego con ventana."""
+    parser = argparse.ArgumentParser(
+        prog="python -m squash_proyecto",
+        description="Juego de Squash con ventana. Las opciones pisan a las del archivo de configuración."
+    )
+    parser.add_argument("--config", metavar="RUTA", default=RUTA_CONFIGURACION,
+                        help=f"Archivo de configuración JSON (por defecto {RUTA_CONFIGURACION}; "
+                             "si no existe se usan los valores por defecto)")
+    parser.add_argument("--guardar-config", action="store_true",
+                        help="Guardar en --config los ajustes resultantes")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="Mostrar los tiempos del arranque en consola")
+    parser.add_argument("--fps", type=int,
+                        help="Límite de frames dibujados por segundo (0 = sin límite)")
+    parser.add_argument("--vsync", action=argparse.BooleanOptionalAction,
+                        help="Sincronizar con el monitor si el driver lo permite")
+    parser.add_argument("--escala-render", type=float, metavar="ESCALA",
+                        help="Tamaño del framebuffer interno respecto de la cancha (0.25 a 2)")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction,
+                        help="Sin ventana ni dispositivo de audio (drivers dummy de SDL)")
+    parser.add_argument("--renderizado-sucio", action=argparse.BooleanOptionalAction,
+                        help="Actualizar en pantalla solo los rectángulos que cambiaron")
+    parser.add_argument("--buffer-audio", type=int, metavar="MUESTRAS",
+                        help="Muestras por bloque del mezclador (potencia de dos, 64 a 8192)")
+    parser.add_argument("--nivel-registro", type=str.upper, choices=NIVELES_REGISTRO,
+                        help="Nivel mínimo de los mensajes de registro")
+    parser.add_argument("--modo-release", action=argparse.BooleanOptionalAction,
+                        help="Registrar solo advertencias y errores, sin los mensajes de las rutas calientes")
+    parser.add_argument("--calidad-efectos", choices=CALIDADES_EFECTOS,
+                        help="'alta' suaviza los bordes de las pelotas")
+    parser.add_argument("--backend-render", choices=BACKENDS_RENDER,
+                        help="Dibujar con superficies de pygame o con texturas del Renderer de SDL2")
+    parser.add_argument("--escalado", choices=ESCALADOS,
+                        help="Cómo se escala el framebuffer a la ventana")
+    return parser
+
+
+def preparar_configuracion(argv=None):
+    """
+    Carga el archivo, aplica las opciones y congela la configuración.
+
+    Returns:
+        (ConfiguracionJuego congelada, argumentos ya interpretados)
+
+    Raises:
+        ValueError: Si el archivo o alguna opción tiene un valor inválido
+    """
+    args = crear_parser().parse_args(argv)
+    config = ConfiguracionJuego.obtener_instancia()
+    config.cargar_configuracion(args.config)
+
+    cambios = {nombre: getattr(args, nombre) for nombre in OPCIONES_AJUSTES
+               if getattr(args, nombre) is not None}
+    config.aplicar(cambios, "la línea de comandos")
+
+    if args.guardar_config:
+        config.guardar_configuracion(args.config)
+    config.congelar()
+    return config, args
@@ -3,8 +3,17 @@ PATRÓN FACTORY METHOD - Creación de Pelotas
 ============================================
 """
 
-import pygame
 import random
+import numpy as np
+from fisica.colisiones import (tiempo_impacto_paredes, tiempo_impacto_circulo_rectangulo,
+                               SOLAPADO)
+from fisica.prediccion import reflejar_entre_paredes
+from config.configuracion import ANCHO_CANCHA, ALTO_CANCHA
+from renderizado.sprites import CacheSprites
+from renderizado.vista import Vista
+
+# Límite de rebotes resueltos dentro de un mismo paso
+MAX_REBOTES_POR_PASO = 8
 
 class Pelota:
     """Clase base para pelotas."""
@@ -12,6 +21,8 @@ class Pelota:
     def __init__(self, x, y, velocidad_x, velocidad_y):
         self.x = x
         self.y = y
+        self.x_anterior = x  # Posición del paso anterior (para interpolar)
+        self.y_anterior = y
         self.velocidad_x = velocidad_x
         self.velocidad_y = velocidad_y
         self.radio = 10
@@ -19,44 +30,197 @@ class Pelota:
         self.activa = True
         self.tipo = "Normal"
         self.puntos_bonus = 0
+        
+        # Trayectoria actual: entre golpes la posición se calcula desde el
+        # origen del tramo (no sumando paso a paso), así que saltar varios
+        # pasos de una vez da exactamente los mismos números
+        self.origen = None      # (x, y, vx, vy) al comenzar el tramo
+        self.edad = 0           # Pasos desde el origen
+        self.esperado = None    # Estado que dejó el último paso
+    
+    def estado_cinematico(self):
+        """Posición y velocidad actuales, como tupla."""
+        return (self.x, self.y, self.velocidad_x, self.velocidad_y)
+    
+    def _sincronizar_trayectoria(self):
+        """Empieza un tramo nuevo si algo de afuera cambió posición o velocidad."""
+        estado = self.estado_cinematico()
+        if estado != self.esperado:
+            self.origen = estado
+            self.edad = 0
+    
+    def _posicion_en(self, edad):
+        """Posición y velocidad a 'edad' pasos del origen del tramo."""
+        x0, y0, vx0, vy0 = self.origen
+        x, vx = reflejar_entre_paredes(x0, vx0, edad, ANCHO_CANCHA)
+        y = y0 + vy0 * edad
+        vy = vy0
+        if y < 0:
+            # Rebote en el techo (a lo sumo uno por tramo)
+            y = -y
+            vy = -vy
+        return x, y, vx, vy
     
     def mover(self):
-        self.x += self.velocidad_x
-        self.y += self.velocidad_y
+        """Mueve la pelota un paso rebotando en las paredes (sin raqueta)."""
+        self.avanzar(None)
+    
+    def avanzar(self, raqueta=None, dt=1.0):
+        """
+        Mueve la pelota 'dt' pasos con detección continua de colisiones.
+        La posición siempre sale del tramo (_posicion_en), que resuelve los
+        rebotes en paredes y techo; el barrido solo busca el instante en que
+        la pelota toca la raqueta. Si la toca, la pelota llega al punto de
+        contacto, rebota y gasta el resto del paso en un tramo nuevo, así
+        que no puede atravesar la raqueta por rápida que sea.
         
-        # Rebotes en bordes
-        if self.x <= 0 or self.x >= 1000:
-            self.velocidad_x = -self.velocidad_x
+        Args:
+            raqueta: Raqueta contra la que probar el impacto (o None)
+            dt: Duración del paso, en pasos de simulación
+        
+        Returns:
+            True si la pelota golpeó la raqueta durante el paso
+        """
+        self.x_anterior = self.x
+        self.y_anterior = self.y
+        self._sincronizar_trayectoria()
         
-        if self.y <= 0:
-            self.velocidad_y = -self.velocidad_y
+        t = None
+        if raqueta is not None:
+            t = self.tiempo_impacto_raqueta(raqueta, dt)
+        
+        if t is None:
+            self.edad += dt
+            self.x, self.y, self.velocidad_x, self.velocidad_y = self._posicion_en(self.edad)
+            # Con pasos enteros el próximo paso sigue el mismo tramo
+            self.esperado = self.estado_cinematico() if dt == 1.0 else None
+        else:
+            self.x, self.y, self.velocidad_x, self.velocidad_y = self._posicion_en(self.edad + dt * t)
+            self.rebotar_en_raqueta(raqueta)
+            self.origen = self.estado_cinematico()
+            self.x, self.y, self.velocidad_x, self.velocidad_y = self._posicion_en(dt * (1.0 - t))
+            # El próximo paso empieza otro tramo desde donde quedó la pelota
+            self.esperado = None
         
         # Verificar si se perdió la pelota
-        if self.y >= 700:
+        if self.y >= ALTO_CANCHA:
             self.activa = False
+        
+        return t is not None
+    
+    def tiempo_impacto_raqueta(self, raqueta, dt=1.0):
+        """
+        Barrido del próximo paso contra la raqueta, siguiendo los rebotes en
+        las paredes. Solo calcula el instante: no mueve la pelota.
+        
+        Returns:
+            Fracción del paso en que la pelota toca la raqueta, o None
+        """
+        x, y, vx, vy = self.estado_cinematico()
+        transcurrido = 0.0
+        
+        for _ in range(MAX_REBOTES_POR_PASO):
+            restante = 1.0 - transcurrido
+            dx = vx * dt * restante
+            dy = vy * dt * restante
+            
+            impacto = tiempo_impacto_circulo_rectangulo(
+                x, y, dx, dy, self.radio,
+                raqueta.x, raqueta.y, raqueta.ancho, raqueta.alto)
+            # Si ya se tocaban, solo cuenta si la pelota va hacia la raqueta
+            if impacto == SOLAPADO and vy <= 0:
+                impacto = None
+            
+            pared = tiempo_impacto_paredes(x, y, dx, dy, ANCHO_CANCHA)
+            if impacto is not None and (pared is None or impacto[0] <= pared[0]):
+                return transcurrido + restante * impacto[0]
+            if pared is None:
+                return None
+            
+            t, eje = pared
+            x += dx * t
+            y += dy * t
+            if eje == "x":
+                vx = -vx
+            else:
+                vy = -vy
+            transcurrido += restante * t
+        return None
+    
+    def avanzar_sin_obstaculos(self, pasos):
+        """
+        Equivale a llamar mover() 'pasos' veces, sabiendo que en ese tramo la
+        pelota no llega a la raqueta ni se pierde. Los rebotes en paredes y
+        techo se resuelven desplegando la cancha; solo el último paso se
+        simula, para que x_anterior/y_anterior queden como paso a paso.
+        """
+        if pasos <= 0:
+            return
+        
+        # Mismo cálculo que hace avanzar() en cada paso, con la edad final
+        self._sincronizar_trayectoria()
+        self.edad += pasos - 1
+        self.x, self.y, self.velocidad_x, self.velocidad_y = self._posicion_en(self.edad)
+        self.esperado = self.estado_cinematico()
+        
+        self.avanzar(None)
     
     def verificar_colision(self, raqueta):
+        """Prueba de solapamiento (AABB) al final del paso, sin barrido."""
         if (self.x + self.radio > raqueta.x and 
             self.x - self.radio < raqueta.x + raqueta.ancho and
             self.y + self.radio > raqueta.y and 
             self.y - self.radio < raqueta.y + raqueta.alto):
             
-            self.velocidad_y = -abs(self.velocidad_y)
-            
-            # Ajustar dirección según dónde golpeó
-            centro_raqueta = raqueta.x + raqueta.ancho / 2
-            diferencia = self.x - centro_raqueta
-            self.velocidad_x = diferencia * 0.1
-            
+            self.rebotar_en_raqueta(raqueta)
             return True
         return False
     
+    def rebotar_en_raqueta(self, raqueta):
+        """Rebota hacia arriba con un desvío según dónde golpeó la raqueta."""
+        self.velocidad_y = -abs(self.velocidad_y)
+        
+        # Ajustar dirección según dónde golpeó
+        centro_raqueta = raqueta.x + raqueta.ancho / 2
+        diferencia = self.x - centro_raqueta
+        self.velocidad_x = diferencia * 0.1
+    
     def efecto_especial(self, juego):
         """Efecto especial (sobrescribir en clases hijas)."""
         pass
     
-    def dibujar(self, superficie):
-        pygame.draw.circle(superficie, self.color, (int(self.x), int(self.y)), self.radio)
+    def dibujar(self, lienzo, alfa=1.0):
+        """
+        Dibuja la pelota en el lienzo interpolando entre el paso anterior y el actual.
+        
+        Returns:
+            Rectángulo ocupado (para el renderizado por rectángulos sucios)
+        """
+        x = self.x_anterior + (self.x - self.x_anterior) * alfa
+        y = self.y_anterior + (self.y - self.y_anterior) * alfa
+        escala = Vista.obtener_instancia().escala
+        sprite = CacheSprites.obtener_instancia().pelota(self.color, self.radio)
+        radio = sprite.get_width() // 2
+        return lienzo.blit(sprite, (int(x * escala) - radio, int(y * escala) - radio))
+
+
+# =============================================================================
+# EFECTOS ESPECIALES (compartidos por Pelota y por el motor multibola)
+# =============================================================================
+
+def efecto_lento(juego):
+    """Pelota lenta: la raqueta se vuelve más rápida."""
+    juego.raqueta.velocidad *= 1.5
+
+
+def efecto_doble(juego):
+    """Pelota de puntos dobles: activa el multiplicador."""
+    juego.activar_multiplicador(5)
+
+
+def efecto_vida(juego):
+    """Pelota de vida extra: otorga una vida."""
+    juego.vidas += 1
 
 
 class FabricaPelotas:
@@ -66,6 +230,14 @@ class FabricaPelotas:
     Crea diferentes tipos de pelotas.
     """
     
+    # Datos por tipo. El índice en TIPOS es el "id de tipo" que usa el
+    # motor multibola para guardar las pelotas en arreglos.
+    TIPOS = ["normal", "rapida", "lenta", "puntos_dobles", "vida_extra"]
+    NOMBRES = ["Normal", "Rápida", "Lenta", "Puntos Dobles", "Vida Extra"]
+    COLORES = [(255, 255, 255), (255, 100, 100), (100, 200, 255), (255, 255, 0), (0, 255, 0)]
+    PUNTOS_BONUS = [0, 10, 5, 20, 15]
+    EFECTOS = [None, None, efecto_lento, efecto_doble, efecto_vida]
+    
     @staticmethod
     def crear_pelota_normal(nivel):
         """Crea una pelota normal."""
@@ -91,10 +263,6 @@ class FabricaPelotas:
         pelota.color = (100, 200, 255)
         pelota.tipo = "Lenta"
         pelota.puntos_bonus = 5
-        
-        def efecto_lento(juego):
-            juego.raqueta.velocidad *= 1.5
-        
         pelota.efecto_especial = efecto_lento
         return pelota
     
@@ -105,10 +273,6 @@ class FabricaPelotas:
         pelota.color = (255, 255, 0)
         pelota.tipo = "Puntos Dobles"
         pelota.puntos_bonus = 20
-        
-        def efecto_doble(juego):
-            juego.activar_multiplicador(5)
-        
         pelota.efecto_especial = efecto_doble
         return pelota
     
@@ -119,30 +283,45 @@ class FabricaPelotas:
         pelota.color = (0, 255, 0)
         pelota.tipo = "Vida Extra"
         pelota.puntos_bonus = 15
-        
-        def efecto_vida(juego):
-            juego.vidas += 1
-        
         pelota.efecto_especial = efecto_vida
         return pelota
     
     @staticmethod
-    def crear_pelota_aleatoria(nivel):
-        """
-        Crea una pelota aleatoria según la probabilidad.
-        Usa la estrategia de dificultad para determinar probabilidades.
-        """
-        # Por defecto, usar distribución normal
-        tipos = ["normal", "rapida", "lenta", "puntos_dobles", "vida_extra"]
+    def obtener_pesos(nivel):
+        """Pesos de probabilidad de cada tipo (mismo orden que TIPOS)."""
         pesos = [40, 20, 15, 15, 10]  # Pesos base
         
         # Ajustar según nivel
-        for i in range(nivel - 1):
-            if i < len(pesos) - 1:
-                pesos[i] -= 5
-                pesos[i + 1] += 5
+        for i in range(min(nivel - 1, len(pesos) - 1)):
+            pesos[i] -= 5
+            pesos[i + 1] += 5
         
-        tipo = random.choices(tipos, weights=pesos)[0]
+        return pesos
+    
+    @staticmethod
+    def obtener_velocidad(tipo_id, nivel):
+        """Velocidad inicial (componente x, positiva) de un tipo de pelota."""
+        if tipo_id == 1:
+            return 7 * (1 + 0.1 * nivel)
+        if tipo_id == 2:
+            return 3
+        if tipo_id == 4:
+            return 4
+        return 5
+    
+    @staticmethod
+    def crear_pelota_aleatoria(nivel, rng=None):
+        """
+        Crea una pelota aleatoria según la probabilidad.
+        Usa la estrategia de dificultad para determinar probabilidades.
+        
+        Args:
+            nivel: Nivel actual
+            rng: random.Random de la partida (por defecto el módulo random)
+        """
+        if rng is None:
+            rng = random
+        tipo = rng.choices(FabricaPelotas.TIPOS, weights=FabricaPelotas.obtener_pesos(nivel))[0]
         
         if tipo == "normal":
             return FabricaPelotas.crear_pelota_normal(nivel)
@@ -155,4 +334,25 @@ class FabricaPelotas:
         elif tipo == "vida_extra":
             return FabricaPelotas.crear_pelota_vida_extra(nivel)
         
-        return FabricaPelotas.crear_pelota_normal(nivel)
\ No newline at end of file
+        return FabricaPelotas.crear_pelota_normal(nivel)
+    
+    @staticmethod
+    def generar_en_motor(motor, nivel, cantidad=1, rng=None):
+        """
+        Genera pelotas aleatorias directamente en los huecos libres de un
+        MotorPelotas, sin crear objetos Pelota.
+        
+        Args:
+            rng: numpy.random.Generator de la partida (por defecto np.random)
+        
+        Returns:
+            Arreglo con los índices ocupados
+        """
+        if rng is None:
+            rng = np.random
+        pesos = np.array(FabricaPelotas.obtener_pesos(nivel), dtype=float)
+        ids = rng.choice(len(pesos), size=cantidad, p=pesos / pesos.sum())
+        
+        tabla_velocidades = np.array([FabricaPelotas.obtener_velocidad(tipo_id, nivel)
+                                      for tipo_id in range(len(pesos))])
+        return motor.agregar_lote(500, 350, tabla_velocidades[ids], ids)
\ No newline at end of file
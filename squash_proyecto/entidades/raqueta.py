@@ -5,6 +5,12 @@ Entidad Raqueta con soporte para PATRÓN DECORATOR
 """
 
 import pygame
+from config.configuracion import ANCHO_CANCHA
+from renderizado.sprites import CacheSprites, BORDE_ESCUDO
+from renderizado.vista import Vista
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("decorator")
 
 # =============================================================================
 # PATRÓN DECORATOR - PARA MODOS ESPECIALES
@@ -20,7 +26,7 @@ def modo_especial(func):
         if tecla_presionada:
             resultado = func(self)
             if resultado:
-                print(f"🎮 [DECORATOR] Modo activado: {func.__name__}")
+                registro.debug("🎮 [DECORATOR] Modo activado: %s", func.__name__)
             return resultado
         return False
     return wrapper
@@ -39,12 +45,24 @@ class Raqueta:
     def __init__(self, x, y):
         self.x = x
         self.y = y
+        self.x_anterior = x  # Posición del paso anterior (para interpolar)
         self.ancho = 100
         self.alto = 15
         self.velocidad = 8
         self.color = (0, 255, 0)
         self.modo_actual = "Normal"
         
+        # Sprite pre-renderizado del modo actual (ver renderizado.sprites)
+        self.sprite = None
+        self.clave_sprite = None
+        
+        # Tramo de movimiento actual: mientras se mueve en una dirección con
+        # la misma velocidad, x sale del origen del tramo (como la trayectoria
+        # de la pelota), así que mover muchos pasos de una vez da lo mismo
+        self.origen_tramo = None    # (x, dirección, velocidad) al comenzar el tramo
+        self.pasos_tramo = 0        # Pasos desde el origen
+        self.x_esperada = None      # x que dejó el último paso
+        
         # Configuraciones de cada modo
         self.modos = {
             "Normal": {
@@ -119,10 +137,90 @@ class Raqueta:
     
     def mover(self, teclas_presionadas):
         """Mueve la raqueta según las teclas presionadas."""
-        if teclas_presionadas[pygame.K_LEFT] and self.x > 0:
-            self.x -= self.velocidad
-        if teclas_presionadas[pygame.K_RIGHT] and self.x < 1000 - self.ancho:
-            self.x += self.velocidad
+        self.mover_direccion(teclas_presionadas[pygame.K_LEFT],
+                             teclas_presionadas[pygame.K_RIGHT])
+    
+    def mover_direccion(self, izquierda, derecha):
+        """Mueve la raqueta a partir de dos flags, sin depender de pygame."""
+        self.x_anterior = self.x
+        if izquierda and derecha:
+            # Se anulan salvo contra un borde
+            if self.x > 0:
+                self.x -= self.velocidad
+            if self.x < ANCHO_CANCHA - self.ancho:
+                self.x += self.velocidad
+        elif izquierda:
+            self._avanzar_tramo(-1, 1)
+        elif derecha:
+            self._avanzar_tramo(1, 1)
+    
+    def mover_direccion_pasos(self, izquierda, derecha, pasos):
+        """
+        Equivale a llamar mover_direccion() 'pasos' veces con los mismos
+        flags, sin recorrer los pasos uno por uno.
+        """
+        if pasos <= 0:
+            return
+        
+        saltados = pasos - 1
+        if izquierda and derecha:
+            # Ambas teclas: se anulan salvo contra un borde; queda fija enseguida
+            x = self.x
+            velocidad = self.velocidad
+            limite = ANCHO_CANCHA - self.ancho
+            for _ in range(saltados):
+                nueva = x
+                if nueva > 0:
+                    nueva -= velocidad
+                if nueva < limite:
+                    nueva += velocidad
+                if nueva == x:
+                    break
+                x = nueva
+            self.x = x
+        elif izquierda:
+            self._avanzar_tramo(-1, saltados)
+        elif derecha:
+            self._avanzar_tramo(1, saltados)
+        
+        # El último paso normal deja x_anterior como paso a paso
+        self.mover_direccion(izquierda, derecha)
+    
+    def _x_en(self, pasos):
+        """Posición x a 'pasos' pasos del origen del tramo."""
+        x0, direccion, velocidad = self.origen_tramo
+        return x0 + direccion * velocidad * pasos
+    
+    def _puede_avanzar(self, pasos):
+        """Si a 'pasos' pasos del origen la raqueta todavía no llegó al borde."""
+        if self.origen_tramo[1] < 0:
+            return self._x_en(pasos) > 0
+        return self._x_en(pasos) < ANCHO_CANCHA - self.ancho
+    
+    def _avanzar_tramo(self, direccion, pasos):
+        """
+        Mueve la raqueta hasta 'pasos' pasos en una dirección, deteniéndose
+        en el borde. Un paso o muchos usan la misma expresión (_x_en), así
+        que el resultado no depende de cómo se agrupen los pasos.
+        """
+        if (self.origen_tramo is None or self.x != self.x_esperada or
+                self.origen_tramo[1:] != (direccion, self.velocidad)):
+            # Algo cambió la posición, la dirección o la velocidad: tramo nuevo
+            self.origen_tramo = (self.x, direccion, self.velocidad)
+            self.pasos_tramo = 0
+        
+        # Primer paso que ya no mueve (el borde se alcanza una sola vez)
+        bajo, alto = self.pasos_tramo, self.pasos_tramo + pasos
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if self._puede_avanzar(medio):
+                bajo = medio + 1
+            else:
+                alto = medio
+        
+        self.pasos_tramo = bajo
+        self.x = self._x_en(bajo)
+        self.x_esperada = self.x
     
     def aplicar_imantacion(self, pelota):
         """
@@ -141,14 +239,29 @@ class Raqueta:
         
         return False
     
-    def dibujar(self, superficie):
-        """Dibuja la raqueta en la superficie."""
-        pygame.draw.rect(superficie, self.color, (self.x, self.y, self.ancho, self.alto))
+    def dibujar(self, lienzo, alfa=1.0):
+        """
+        Dibuja la raqueta en el lienzo, interpolando su posición.
+        
+        Returns:
+            Rectángulo ocupado (para el renderizado por rectángulos sucios)
+        """
+        escala = Vista.obtener_instancia().escala
+        x = (self.x_anterior + (self.x - self.x_anterior) * alfa) * escala
+        y = self.y * escala
+        
+        # Efecto visual para modo escudo (borde incluido en el sprite)
+        escudo = self.modo_actual == "Escudo"
+        
+        # Solo se busca otro sprite si cambió el color, el ancho o el escudo
+        clave = (self.color, self.ancho, self.alto, escudo)
+        if clave != self.clave_sprite:
+            self.sprite = CacheSprites.obtener_instancia().raqueta(*clave)
+            self.clave_sprite = clave
         
-        # Efecto visual para modo escudo
-        if self.modo_actual == "Escudo":
-            pygame.draw.rect(superficie, (255, 255, 255), 
-                           (self.x - 2, self.y - 2, self.ancho + 4, self.alto + 4), 2)
+        if escudo:
+            return lienzo.blit(self.sprite, (x - BORDE_ESCUDO, y - BORDE_ESCUDO))
+        return lienzo.blit(self.sprite, (x, y))
     
     def obtener_info_modo(self):
         """Retorna información del modo actual."""
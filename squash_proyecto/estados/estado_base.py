@@ -7,6 +7,11 @@ Permite cambiar el comportamiento del juego según su estado.
 
 from abc import ABC, abstractmethod
 import pygame
+from recursos.gestor_recursos import GestorRecursos
+from renderizado.vista import Vista
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("state")
 
 # =============================================================================
 # PATRÓN STATE - INTERFACE
@@ -18,11 +23,35 @@ class Estado(ABC):
     -------------
     Clase base abstracta para todos los estados del juego.
     Cada estado maneja su propia lógica de entrada, actualización y renderizado.
+    
+    Los estados con es_inactivo = True no tienen lógica por paso: el bucle
+    principal duerme esperando eventos y solo los redibuja tras una entrada
+    o al vencer el temporizador.
+    
+    Los estados dibujan en self.pantalla, un Lienzo (renderizado.lienzo)
+    con la misma interfaz que pygame.Surface. Las posiciones y tamaños de
+    la interfaz se escriben en coordenadas de la cancha y se pasan por
+    self.vista al dibujar (ver renderizado.vista).
     """
     
+    es_inactivo = False
+    
     def __init__(self, gestor_estados):
         self.gestor_estados = gestor_estados
         self.pantalla = gestor_estados.pantalla
+        self.vista = Vista.obtener_instancia()
+        self.recursos = GestorRecursos.obtener_instancia()
+        self.recursos_tomados = []
+    
+    def cargar_fuente(self, tamano, ruta=None):
+        """
+        Fuente compartida del GestorRecursos (no se vuelve a leer del disco
+        en cada transición). La referencia se devuelve en salir().
+        El tamaño se escala a la resolución interna.
+        """
+        fuente = self.recursos.fuente(self.vista.tamano_fuente(tamano), ruta)
+        self.recursos_tomados.append(fuente)
+        return fuente
     
     @abstractmethod
     def manejar_eventos(self, eventos):
@@ -35,17 +64,51 @@ class Estado(ABC):
         pass
     
     @abstractmethod
-    def dibujar(self):
-        """Renderiza el estado en pantalla."""
+    def dibujar(self, alfa=1.0):
+        """
+        Renderiza el estado en pantalla.
+        
+        Args:
+            alfa: Fracción [0, 1] del paso de simulación transcurrida,
+                  para interpolar posiciones
+        
+        Returns:
+            None si hay que actualizar la pantalla completa, o la lista de
+            rectángulos que cambiaron (renderizado por rectángulos sucios)
+        """
+        pass
+    
+    def capturar_fondo(self, superficie):
+        """
+        Llamado al apilar este estado sobre otro.
+        
+        Args:
+            superficie: Copia del último frame dibujado por el estado de abajo
+        """
+        pass
+    
+    def reanudar(self):
+        """Llamado cuando el estado vuelve a estar arriba de la pila."""
+        pass
+    
+    def repintar(self):
+        """
+        Fuerza a que el próximo dibujar() cubra toda la pantalla (p. ej. al
+        quitar el overlay del perfilador). Solo lo necesitan los estados
+        que dibujan por partes.
+        """
         pass
     
     def entrar(self):
         """Llamado cuando se entra a este estado."""
-        print(f"🎮 [STATE] Entrando a estado: {self.__class__.__name__}")
+        registro.info("🎮 [STATE] Entrando a estado: %s", self.__class__.__name__)
     
     def salir(self):
         """Llamado cuando se sale de este estado."""
-        print(f"🎮 [STATE] Saliendo de estado: {self.__class__.__name__}")
+        registro.info("🎮 [STATE] Saliendo de estado: %s", self.__class__.__name__)
+        for recurso in self.recursos_tomados:
+            self.recursos.liberar(recurso)
+        self.recursos_tomados = []
 
 
 # =============================================================================
@@ -91,9 +154,9 @@ class GestorEstados:
         if self.pila_estados:
             self.estado_actual.salir()
             self.estado_actual = self.pila_estados.pop()
-            print(f"🎮 [STATE] Regresando a: {self.estado_actual.__class__.__name__}")
+            registro.info("🎮 [STATE] Regresando a: %s", self.estado_actual.__class__.__name__)
         else:
-            print("⚠️ [STATE] No hay estados en la pila")
+            registro.warning("⚠️ [STATE] No hay estados en la pila")
     
     def actualizar(self, eventos):
         """Actualiza el estado actual."""
@@ -6,6 +6,7 @@ Estado Game Over
 
 import pygame
 from estados.estado_base import Estado
+from renderizado.cache_texto import CacheTexto
 
 class EstadoGameOver(Estado):
     """
@@ -13,20 +14,28 @@ class EstadoGameOver(Estado):
     Muestra estadísticas finales y opciones.
     """
     
-    def __init__(self, gestor_estados, estado_jugando):
+    es_inactivo = True  # Pantalla estática: no redibujar a tasa fija
+    
+    def __init__(self, gestor_estados, juego):
         super().__init__(gestor_estados)
         
-        # Guardar datos del juego
-        self.puntaje_final = estado_jugando.puntaje
-        self.nivel_final = estado_jugando.nivel
-        self.combo_maximo = estado_jugando.observador_puntaje.mejor_combo
-        self.precision = estado_jugando.observador_estadisticas.calcular_precision()
-        self.golpes_totales = estado_jugando.observador_estadisticas.golpes_totales
+        # Guardar datos del juego (SimulacionJuego terminada)
+        self.puntaje_final = juego.puntaje
+        self.nivel_final = juego.nivel
+        self.combo_maximo = juego.observador_puntaje.mejor_combo
+        
+        # Las estadísticas se entregan en el hilo de trabajo del bus
+        juego.bus.esperar_entregas()
+        self.precision = juego.observador_estadisticas.calcular_precision()
+        self.golpes_totales = juego.observador_estadisticas.golpes_totales
         
         # Fuentes
-        self.fuente_titulo = pygame.font.Font(None, 80)
-        self.fuente_stat = pygame.font.Font(None, 36)
-        self.fuente_opcion = pygame.font.Font(None, 40)
+        self.fuente_titulo = self.cargar_fuente(80)
+        self.fuente_stat = self.cargar_fuente(36)
+        self.fuente_opcion = self.cargar_fuente(40)
+        
+        # Caché compartida de textos ya rasterizados
+        self.textos = CacheTexto.obtener_instancia()
         
         # Opciones
         self.opciones = [
@@ -62,13 +71,13 @@ class EstadoGameOver(Estado):
         """No hay actualizaciones en game over."""
         pass
     
-    def dibujar(self):
+    def dibujar(self, alfa=1.0):
         """Dibuja la pantalla de game over."""
         self.pantalla.fill(self.color_fondo)
         
         # Título
-        texto_titulo = self.fuente_titulo.render("GAME OVER", True, self.color_titulo)
-        rect_titulo = texto_titulo.get_rect(center=(500, 80))
+        texto_titulo = self.textos.render(self.fuente_titulo, "GAME OVER", True, self.color_titulo)
+        rect_titulo = texto_titulo.get_rect(center=self.vista.punto(500, 80))
         self.pantalla.blit(texto_titulo, rect_titulo)
         
         # Estadísticas
@@ -86,18 +95,18 @@ class EstadoGameOver(Estado):
         for i, (etiqueta, valor, destacado) in enumerate(stats):
             color_valor = self.color_destaque if destacado else self.color_stat
             
-            texto_etiqueta = self.fuente_stat.render(etiqueta, True, self.color_stat)
-            texto_valor = self.fuente_stat.render(valor, True, color_valor)
+            texto_etiqueta = self.textos.render(self.fuente_stat, etiqueta, True, self.color_stat)
+            texto_valor = self.textos.render(self.fuente_stat, valor, True, color_valor)
             
             y_pos = y_stats + i * espaciado_stats
             
-            self.pantalla.blit(texto_etiqueta, (250, y_pos))
-            self.pantalla.blit(texto_valor, (550, y_pos))
+            self.pantalla.blit(texto_etiqueta, self.vista.punto(250, y_pos))
+            self.pantalla.blit(texto_valor, self.vista.punto(550, y_pos))
         
         # Mensaje según rendimiento
         mensaje = self.obtener_mensaje_rendimiento()
-        texto_mensaje = self.fuente_stat.render(mensaje, True, (150, 150, 255))
-        rect_mensaje = texto_mensaje.get_rect(center=(500, y_stats + len(stats) * espaciado_stats + 30))
+        texto_mensaje = self.textos.render(self.fuente_stat, mensaje, True, (150, 150, 255))
+        rect_mensaje = texto_mensaje.get_rect(center=self.vista.punto(500, y_stats + len(stats) * espaciado_stats + 30))
         self.pantalla.blit(texto_mensaje, rect_mensaje)
         
         # Opciones
@@ -107,8 +116,8 @@ class EstadoGameOver(Estado):
         for i, opcion in enumerate(self.opciones):
             color = self.color_seleccionado if i == self.opcion_seleccionada else self.color_opcion
             
-            texto_opcion = self.fuente_opcion.render(opcion, True, color)
-            rect_opcion = texto_opcion.get_rect(center=(500, y_opciones + i * espaciado_opciones))
+            texto_opcion = self.textos.render(self.fuente_opcion, opcion, True, color)
+            rect_opcion = texto_opcion.get_rect(center=self.vista.punto(500, y_opciones + i * espaciado_opciones))
             self.pantalla.blit(texto_opcion, rect_opcion)
         
         
@@ -138,7 +147,6 @@ class EstadoGameOver(Estado):
             self.gestor_estados.cambiar_estado(EstadoMenu(self.gestor_estados))
 
         elif self.opcion_seleccionada == 2:
-            # Salir del juego
-            import sys
-            pygame.quit()
-            sys.exit()
+            # Salir del juego por el loop principal, como al cerrar la
+            # ventana: así los estados salen (y se cierra la repetición)
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
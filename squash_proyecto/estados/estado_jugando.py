@@ -3,20 +3,28 @@
 Estado Principal del Juego
 ===========================
 Integra todos los patrones de diseño.
+La lógica de la partida vive en SimulacionJuego; este estado agrega
+la entrada del jugador, la pantalla y las transiciones.
 """
 
+import os
+import time
 import pygame
-import random
 from estados.estado_base import Estado
 from estados.estado_pausa import EstadoPausa
 from estados.estado_gameover import EstadoGameOver
-from entidades.raqueta import Raqueta
-from entidades.fabrica_pelotas import FabricaPelotas
 from adaptores.input_adapter import InputAdapter
-from estrategias.difficultad import GestorDificultad
-from observers.observador_eventos import *
-from comandos.sistema_comandos import *
+from simulacion.nucleo import SimulacionJuego
+from simulacion.repeticion import GrabadorRepeticion
 from config.configuracion import ConfiguracionJuego
+from renderizado.hud import CampoHUD, componer_panel
+from renderizado.rects_sucios import RenderizadorRectsSucios
+from renderizado.sprites import CacheSprites
+from entidades.fabrica_pelotas import FabricaPelotas
+from sistema.perfilador import PerfiladorFrames, FASE_ENTRADA, FASE_ENTIDADES, FASE_HUD
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("state")
 
 class EstadoJugando(Estado):
     """
@@ -24,57 +32,101 @@ class EstadoJugando(Estado):
     Integra todos los patrones de diseño implementados.
     """
     
-    def __init__(self, gestor_estados, estrategia_dificultad=None):
+    def __init__(self, gestor_estados, estrategia_dificultad=None, pelotas=1, repeticion=None, semilla=None):
+        """
+        Args:
+            gestor_estados: GestorEstados dueño de este estado
+            estrategia_dificultad: EstrategiaDificultad de la partida
+            pelotas: Pelotas simultáneas
+            repeticion: LectorRepeticion; si se indica, se reproduce esa
+                        partida (semilla, dificultad y entradas grabadas)
+            semilla: Semilla de la partida (por defecto una nueva)
+        """
         super().__init__(gestor_estados)
         
         # Obtener configuración Singleton
         self.config = ConfiguracionJuego.obtener_instancia()
+        self.grabador = None
+        
+        if repeticion is not None:
+            # Reproducir: misma lógica, entradas leídas del archivo (ADAPTER)
+            self.simulacion = SimulacionJuego(repeticion.crear_estrategia(), pelotas=repeticion.pelotas,
+                                              pasos_por_segundo=repeticion.tasa_simulacion,
+                                              semilla=repeticion.semilla)
+            self.input_adapter = InputAdapter(tipo_entrada="repeticion", repeticion=repeticion)
+        else:
+            # Lógica de la partida (sin ventana)
+            self.simulacion = SimulacionJuego(estrategia_dificultad, pelotas=pelotas, semilla=semilla)
+            
+            # Configurar ADAPTER para entrada
+            self.input_adapter = InputAdapter(tipo_entrada="teclado", simulacion=self.simulacion,
+                                              nivel_ia=self.config.nivel_ia)
+            
+            if self.config.grabar_repeticiones:
+                self.iniciar_grabacion()
         
-        # Inicializar estrategia de dificultad (STRATEGY)
-        self.gestor_dificultad = GestorDificultad(estrategia_dificultad)
-        
-        # Inicializar variables del juego
-        self.puntaje = 0
-        self.nivel = 1
-        self.vidas = self.gestor_dificultad.obtener_estrategia().calcular_vidas_iniciales()
-        self.multiplicador_activo = False
-        self.tiempo_multiplicador = 0
-        
-        # Crear raqueta con DECORATOR
-        self.raqueta = Raqueta(450, 650)
-        
-        # Crear pelota inicial con FACTORY METHOD
-        self.pelota = FabricaPelotas.crear_pelota_aleatoria(self.nivel)
-        
-        # Configurar ADAPTER para entrada
-        self.input_adapter = InputAdapter(tipo_entrada="teclado")
-        
-        # Sistema de OBSERVER
-        self.observador_puntaje = ObservadorPuntaje()
-        self.observador_sonido = ObservadorSonido()
-        self.observador_estadisticas = ObservadorEstadisticas()
-        self.observador_logros = ObservadorLogros()
+        # Perfilador de frames (F3); apagado solo cuesta leer 'activo'
+        self.perfilador = PerfiladorFrames.obtener_instancia()
+        self.simulacion.perfilador = self.perfilador
         
-        # Invoker de COMMAND
-        self.invocador = InvocadorComandos()
+        # Sprites de cada tipo de pelota y modo de raqueta, antes del primer frame
+        raqueta = self.simulacion.raqueta
+        radio = self.simulacion.motor.radio_defecto if self.simulacion.motor is not None else self.simulacion.pelota.radio
+        CacheSprites.obtener_instancia().precargar(FabricaPelotas.COLORES, radio, raqueta.modos, raqueta.alto)
         
         # Fuentes
-        self.fuente = pygame.font.Font(None, 36)
-        self.fuente_pequena = pygame.font.Font(None, 24)
-        
-        # Control de teclas para modos
-        self.teclas_activadas = {
-            pygame.K_a: False,
-            pygame.K_s: False,
-            pygame.K_d: False,
-            pygame.K_w: False,
-            pygame.K_q: False
-        }
-        
-        # Aplicar configuración de dificultad
-        self.gestor_dificultad.aplicar_configuracion(self, self.nivel)
+        self.fuente = self.cargar_fuente(36)
+        self.fuente_pequena = self.cargar_fuente(24)
+        
+        # HUD: cada campo se rasteriza solo cuando cambia su valor
+        punto = self.vista.punto
+        self.campo_puntaje = CampoHUD(self.fuente, "Puntos: {}", punto(10, 10))
+        self.campo_vidas = CampoHUD(self.fuente, "❤️ {}", punto(10, 50))
+        self.campo_nivel = CampoHUD(self.fuente, "Nivel: {}", punto(10, 90))
+        self.campo_modo = CampoHUD(self.fuente, "Modo: {}", punto(10, 130))
+        self.campo_combo = CampoHUD(self.fuente, "COMBO x{}!", punto(10, 170), (255, 255, 0))
+        self.campo_multiplicador = CampoHUD(self.fuente, "🔥 x2 PUNTOS ({}s)", punto(10, 210), (255, 100, 0))
+        if self.simulacion.motor is not None:
+            self.campo_pelota = CampoHUD(self.fuente_pequena, "Pelotas: {}", punto(10, 250))
+        else:
+            self.campo_pelota = CampoHUD(self.fuente_pequena, "Pelota: {}", punto(10, 250))
+        self.campo_dificultad = CampoHUD(self.fuente_pequena, "Dificultad: {}", punto(10, 275), (150, 150, 255))
+        
+        self.campos_hud = [
+            self.campo_puntaje, self.campo_vidas, self.campo_nivel, self.campo_modo,
+            self.campo_combo, self.campo_multiplicador, self.campo_pelota, self.campo_dificultad
+        ]
         
-        print("🎮 [JUGANDO] Estado de juego inicializado")
+        # Instrucciones: texto estático compuesto una sola vez
+        instrucciones = [
+            "🎮 CONTROLES:",
+            "← → : Movimiento",
+            "A : Modo Rápido",
+            "S : Modo Ancho",
+            "D : Imantación",
+            "W : Normal",
+            "Q : Escudo",
+            "P/ESC : Pausa",
+            "F1 : Cambiar entrada"
+        ]
+        lineas = [(inst, (255, 255, 0) if i == 0 else (200, 200, 200))
+                  for i, inst in enumerate(instrucciones)]
+        self.panel_instrucciones = componer_panel(self.fuente_pequena, lineas, self.vista.px(25))
+        
+        # Fondo en caché: color de fondo + instrucciones
+        self.fondo = pygame.Surface(self.pantalla.get_size())
+        if pygame.display.get_surface() is not None:
+            self.fondo = self.fondo.convert()
+        self.fondo.fill(self.config.color_fondo)
+        self.fondo.blit(self.panel_instrucciones, punto(750, 10))
+        
+        # Renderizado por rectángulos sucios (opcional; en multibola hay
+        # demasiados objetos y conviene repintar todo)
+        self.renderizador = None
+        if self.config.renderizado_sucio and self.simulacion.motor is None:
+            self.renderizador = RenderizadorRectsSucios(self.pantalla, self.fondo)
+        
+        registro.info("🎮 [JUGANDO] Estado de juego inicializado")
     
     def manejar_eventos(self, eventos):
         """Maneja eventos durante el juego."""
@@ -86,213 +138,156 @@ class EstadoJugando(Estado):
                 
                 elif evento.key == pygame.K_F1:
                     # Cambiar tipo de entrada (demo)
-                    tipos = ["teclado", "mouse"]
+                    tipos = ["teclado", "mouse", "ia"]
                     tipo_actual = self.input_adapter.obtener_tipo_actual()
-                    indice = tipos.index(tipo_actual)
-                    nuevo_tipo = tipos[(indice + 1) % len(tipos)]
-                    self.input_adapter.cambiar_tipo_entrada(nuevo_tipo)
+                    if tipo_actual in tipos:
+                        indice = tipos.index(tipo_actual)
+                        nuevo_tipo = tipos[(indice + 1) % len(tipos)]
+                        self.input_adapter.cambiar_tipo_entrada(nuevo_tipo)
+    
+    def iniciar_grabacion(self):
+        """Graba la partida en la carpeta de repeticiones."""
+        os.makedirs(self.config.carpeta_repeticiones, exist_ok=True)
+        nombre = time.strftime("partida_%Y%m%d_%H%M%S.sqrp")
+        ruta = os.path.join(self.config.carpeta_repeticiones, nombre)
+        
+        self.grabador = GrabadorRepeticion(
+            ruta, self.simulacion.semilla, self.simulacion.gestor_dificultad.obtener_estrategia(),
+            self.simulacion.pelotas_simultaneas, self.simulacion.pasos_por_segundo
+        )
+        self.simulacion.grabador = self.grabador
+        registro.info("🎬 [JUGANDO] Grabando repetición en %s", ruta)
     
     def actualizar(self):
         """Actualiza la lógica del juego."""
-        # Obtener entrada adaptada (ADAPTER)
-        teclas = self.input_adapter.obtener_entrada()
-        
-        # Manejar cambios de modo de la raqueta (DECORATOR)
-        self.manejar_modos(teclas)
-        
-        # Mover raqueta
-        self.raqueta.mover(teclas)
-        
-        # Aplicar efecto de imantación si está activo
-        if self.raqueta.modo_actual == "Imantación":
-            self.raqueta.aplicar_imantacion(self.pelota)
-        
-        # Mover pelota
-        self.pelota.mover()
-        
-        # Verificar colisión con raqueta
-        if self.pelota.verificar_colision(self.raqueta):
-            # Ejecutar comando de agregar puntos (COMMAND)
-            estrategia = self.gestor_dificultad.obtener_estrategia()
-            puntos_base = estrategia.calcular_puntos_por_golpe(self.nivel)
-            puntos_bonus = self.pelota.puntos_bonus
-            
-            if self.multiplicador_activo:
-                puntos_totales = (puntos_base + puntos_bonus) * 2
-            else:
-                puntos_totales = puntos_base + puntos_bonus
-            
-            comando_puntos = ComandoAgregarPuntos(self, puntos_totales)
-            self.invocador.ejecutar_comando(comando_puntos)
-            
-            # Notificar observadores (OBSERVER)
-            self.observador_puntaje.actualizar("golpe_exitoso", {
-                "puntos": puntos_totales,
-                "combo": self.observador_puntaje.combo_actual + 1
-            })
-            self.observador_sonido.actualizar("golpe_exitoso", None)
-            self.observador_estadisticas.actualizar("golpe_exitoso", None)
-            self.observador_logros.actualizar("golpe_exitoso", {
-                "combo": self.observador_puntaje.combo_actual
-            })
-            
-            # Aplicar efecto especial de la pelota
-            self.pelota.efecto_especial(self)
-            
-            # Modo escudo: rebote más fuerte
-            if self.raqueta.modo_actual == "Escudo":
-                self.pelota.velocidad_y *= 1.2
-        
-        # Verificar si la pelota se perdió
-        if not self.pelota.activa:
-            self.vidas -= 1
-            
-            # Notificar observadores
-            self.observador_puntaje.actualizar("pelota_perdida", None)
-            self.observador_sonido.actualizar("pelota_perdida", None)
-            self.observador_estadisticas.actualizar("pelota_perdida", None)
-            
-            if self.vidas > 0:
-                # Crear nueva pelota (FACTORY METHOD)
-                self.pelota = FabricaPelotas.crear_pelota_aleatoria(self.nivel)
-                self.gestor_dificultad.aplicar_configuracion(self, self.nivel)
-                
-                # Volver a modo normal
-                self.raqueta.activar_modo_normal(True)
-            else:
-                # Game Over
-                self.observador_sonido.actualizar("game_over", None)
-                self.observador_estadisticas.actualizar("game_over", None)
-                self.gestor_estados.cambiar_estado(EstadoGameOver(self.gestor_estados, self))
-        
-        # Verificar subida de nivel
-        estrategia = self.gestor_dificultad.obtener_estrategia()
-        puntos_necesarios = self.nivel * 100
-        
-        if self.puntaje >= puntos_necesarios:
-            self.nivel += 1
-            
-            # Notificar observadores
-            self.observador_sonido.actualizar("nivel_subido", None)
-            self.observador_logros.actualizar("nivel_subido", {"nivel": self.nivel})
-            
-            # Aplicar nueva configuración de dificultad
-            self.gestor_dificultad.aplicar_configuracion(self, self.nivel)
-            
-            print(f"🎊 ¡NIVEL {self.nivel}!")
-        
-        # Actualizar multiplicador
-        if self.multiplicador_activo:
-            self.tiempo_multiplicador -= 1
-            if self.tiempo_multiplicador <= 0:
-                self.multiplicador_activo = False
-                print("⏰ Multiplicador desactivado")
+        # Obtener entrada adaptada (ADAPTER) como máscara de bits
+        medir = self.perfilador.activo
+        if medir:
+            inicio = time.perf_counter_ns()
+        entrada = self.input_adapter.obtener_mascara()
+        if medir:
+            self.perfilador.medir_desde(FASE_ENTRADA, inicio)
+        
+        if entrada is None:
+            # Fin de la repetición
+            self.gestor_estados.cambiar_estado(EstadoGameOver(self.gestor_estados, self.simulacion))
+            return
+        
+        # Avanzar la partida un frame
+        self.simulacion.paso(entrada)
+        
+        if self.simulacion.terminado:
+            # Game Over
+            self.gestor_estados.cambiar_estado(EstadoGameOver(self.gestor_estados, self.simulacion))
     
-    def manejar_modos(self, teclas):
-        """Maneja el cambio de modos de la raqueta."""
-        teclas_actuales = {
-            pygame.K_a: teclas[pygame.K_a],
-            pygame.K_s: teclas[pygame.K_s],
-            pygame.K_d: teclas[pygame.K_d],
-            pygame.K_w: teclas[pygame.K_w],
-            pygame.K_q: teclas[pygame.K_q]
-        }
-        
-        for tecla, presionada in teclas_actuales.items():
-            if presionada and not self.teclas_activadas[tecla]:
-                # Crear y ejecutar comando de cambio de modo (COMMAND)
-                if tecla == pygame.K_a:
-                    comando = ComandoCambiarModo(self.raqueta, "Rápido")
-                    self.invocador.ejecutar_comando(comando)
-                elif tecla == pygame.K_s:
-                    comando = ComandoCambiarModo(self.raqueta, "Ancho")
-                    self.invocador.ejecutar_comando(comando)
-                elif tecla == pygame.K_d:
-                    comando = ComandoCambiarModo(self.raqueta, "Imantación")
-                    self.invocador.ejecutar_comando(comando)
-                elif tecla == pygame.K_w:
-                    comando = ComandoCambiarModo(self.raqueta, "Normal")
-                    self.invocador.ejecutar_comando(comando)
-                elif tecla == pygame.K_q:
-                    comando = ComandoCambiarModo(self.raqueta, "Escudo")
-                    self.invocador.ejecutar_comando(comando)
-            
-            self.teclas_activadas[tecla] = presionada
+    def salir(self):
+        """Termina de escribir la repetición (si se estaba grabando)."""
+        super().salir()
+        if self.grabador is not None:
+            self.grabador.cerrar()
+            self.grabador = None
+            self.simulacion.grabador = None
+        if self.input_adapter.repeticion is not None:
+            self.input_adapter.repeticion.cerrar()
     
-    def activar_multiplicador(self, duracion=5):
-        """Activa el multiplicador de puntos temporalmente."""
-        self.multiplicador_activo = True
-        self.tiempo_multiplicador = duracion * 60  # Convertir a frames
-    
-    def dibujar(self):
-        """Dibuja el estado del juego."""
-        self.pantalla.fill(self.config.color_fondo)
+    def dibujar(self, alfa=1.0):
+        """
+        Dibuja el estado del juego.
+        
+        Args:
+            alfa: Fracción del paso de simulación transcurrida, para
+                  interpolar las posiciones entre el paso anterior y el actual
+        
+        Returns:
+            None (pantalla completa) o los rectángulos que cambiaron
+        """
+        medir = self.perfilador.activo
+        if medir:
+            inicio = time.perf_counter_ns()
+        
+        if self.renderizador is not None:
+            # Rectángulos sucios: restaurar solo las zonas del frame anterior
+            self.renderizador.preparar()
+        else:
+            # Fondo con las instrucciones ya compuestas
+            self.pantalla.blit(self.fondo, (0, 0))
         
         # Dibujar entidades
-        self.pelota.dibujar(self.pantalla)
-        self.raqueta.dibujar(self.pantalla)
+        rects = self.dibujar_entidades(alfa)
+        if medir:
+            inicio = self.perfilador.medir_desde(FASE_ENTIDADES, inicio)
         
         # HUD - Información del juego
-        self.dibujar_hud()
+        rects.extend(self.dibujar_hud())
+        if medir:
+            self.perfilador.medir_desde(FASE_HUD, inicio)
         
-        # Instrucciones
-        self.dibujar_instrucciones()
+        if self.renderizador is None:
+            return None
+        return self.renderizador.presentar(rects)
+    
+    def dibujar_entidades(self, alfa):
+        """
+        Dibuja pelota(s) y raqueta.
+        
+        Returns:
+            Lista de rectángulos ocupados (en multibola, solo el de la raqueta)
+        """
+        if self.simulacion.motor is not None:
+            self.simulacion.motor.dibujar(self.pantalla, alfa)
+            rects = []
+        else:
+            rects = [self.simulacion.pelota.dibujar(self.pantalla, alfa)]
+        rects.append(self.simulacion.raqueta.dibujar(self.pantalla, alfa))
+        return rects
+    
+    def reanudar(self):
+        """Al volver de la pausa hay que repintar todo lo que tapó el overlay."""
+        self.repintar()
+    
+    def repintar(self):
+        """El próximo frame se dibuja completo."""
+        if self.renderizador is not None:
+            self.renderizador.invalidar()
     
     def dibujar_hud(self):
-        """Dibuja el HUD con información del juego."""
-        # Puntaje
-        texto_puntaje = self.fuente.render(f"Puntos: {self.puntaje}", True, (255, 255, 255))
-        self.pantalla.blit(texto_puntaje, (10, 10))
+        """
+        Dibuja el HUD con información del juego.
         
-        # Vidas
-        color_vidas = (255, 50, 50) if self.vidas <= 1 else (255, 255, 255)
-        texto_vidas = self.fuente.render(f"❤️ {self.vidas}", True, color_vidas)
-        self.pantalla.blit(texto_vidas, (10, 50))
+        Returns:
+            Lista de rectángulos ocupados por los campos visibles
+        """
+        juego = self.simulacion
         
-        # Nivel
-        texto_nivel = self.fuente.render(f"Nivel: {self.nivel}", True, (255, 255, 255))
-        self.pantalla.blit(texto_nivel, (10, 90))
-        
-        # Modo actual
-        texto_modo = self.fuente.render(f"Modo: {self.raqueta.modo_actual}", True, self.raqueta.color)
-        self.pantalla.blit(texto_modo, (10, 130))
+        # Actualizar valores (solo se rasteriza lo que cambió)
+        self.campo_puntaje.actualizar(juego.puntaje)
+        self.campo_vidas.actualizar(juego.vidas, (255, 50, 50) if juego.vidas <= 1 else (255, 255, 255))
+        self.campo_nivel.actualizar(juego.nivel)
+        self.campo_modo.actualizar(juego.raqueta.modo_actual, juego.raqueta.color)
         
         # Combo
-        if self.observador_puntaje.combo_actual > 0:
-            texto_combo = self.fuente.render(f"COMBO x{self.observador_puntaje.combo_actual}!", True, (255, 255, 0))
-            self.pantalla.blit(texto_combo, (10, 170))
+        combo = juego.observador_puntaje.combo_actual
+        self.campo_combo.visible = combo > 0
+        if self.campo_combo.visible:
+            self.campo_combo.actualizar(combo)
         
         # Multiplicador
-        if self.multiplicador_activo:
-            segundos = self.tiempo_multiplicador // 60
-            texto_multi = self.fuente.render(f"🔥 x2 PUNTOS ({segundos}s)", True, (255, 100, 0))
-            self.pantalla.blit(texto_multi, (10, 210))
+        self.campo_multiplicador.visible = juego.multiplicador_activo
+        if juego.multiplicador_activo:
+            self.campo_multiplicador.actualizar(juego.tiempo_multiplicador // juego.pasos_por_segundo)
         
         # Tipo de pelota
-        texto_pelota = self.fuente_pequena.render(f"Pelota: {self.pelota.tipo}", True, self.pelota.color)
-        self.pantalla.blit(texto_pelota, (10, 250))
+        if juego.motor is not None:
+            self.campo_pelota.actualizar(juego.motor.cantidad_activas())
+        else:
+            self.campo_pelota.actualizar(juego.pelota.tipo, juego.pelota.color)
         
         # Dificultad
-        estrategia = self.gestor_dificultad.obtener_estrategia()
-        texto_dif = self.fuente_pequena.render(f"Dificultad: {estrategia.obtener_nombre()}", True, (150, 150, 255))
-        self.pantalla.blit(texto_dif, (10, 275))
-    
-    def dibujar_instrucciones(self):
-        """Dibuja las instrucciones en pantalla."""
-        instrucciones = [
-            "🎮 CONTROLES:",
-            "← → : Movimiento",
-            "A : Modo Rápido",
-            "S : Modo Ancho",
-            "D : Imantación",
-            "W : Normal",
-            "Q : Escudo",
-            "P/ESC : Pausa",
-            "F1 : Cambiar entrada"
-        ]
-        
-        y_inicio = 10
-        for i, inst in enumerate(instrucciones):
-            color = (255, 255, 0) if i == 0 else (200, 200, 200)
-            texto = self.fuente_pequena.render(inst, True, color)
-            self.pantalla.blit(texto, (750, y_inicio + i * 25))
\ No newline at end of file
+        self.campo_dificultad.actualizar(juego.gestor_dificultad.obtener_estrategia().obtener_nombre())
+        
+        rects = []
+        for campo in self.campos_hud:
+            rect = campo.dibujar(self.pantalla)
+            if rect is not None:
+                rects.append(rect)
+        return rects
\ No newline at end of file
@@ -6,8 +6,11 @@ Estado del Menú Principal
 
 import pygame
 from estados.estado_base import Estado
-from estados.estado_jugando import EstadoJugando
-from estrategias.difficultad import *
+from renderizado.cache_texto import CacheTexto
+from estrategias.difficultad import DificultadFacil, DificultadNormal, DificultadDificil, DificultadExtrema
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("state")
 
 class EstadoMenu(Estado):
     """
@@ -15,13 +18,18 @@ class EstadoMenu(Estado):
     Permite seleccionar dificultad e iniciar el juego.
     """
     
+    es_inactivo = True  # Pantalla estática: no redibujar a tasa fija
+    
     def __init__(self, gestor_estados):
         super().__init__(gestor_estados)
         
         # Fuentes
-        self.fuente_titulo = pygame.font.Font(None, 80)
-        self.fuente_opcion = pygame.font.Font(None, 40)
-        self.fuente_descripcion = pygame.font.Font(None, 28)
+        self.fuente_titulo = self.cargar_fuente(80)
+        self.fuente_opcion = self.cargar_fuente(40)
+        self.fuente_descripcion = self.cargar_fuente(28)
+        
+        # Caché compartida de textos ya rasterizados
+        self.textos = CacheTexto.obtener_instancia()
         
         # Opciones del menú
         self.opciones = [
@@ -63,23 +71,23 @@ class EstadoMenu(Estado):
         """Actualiza el menú (no hay mucha lógica aquí)."""
         pass
     
-    def dibujar(self):
+    def dibujar(self, alfa=1.0):
         """Dibuja el menú en pantalla."""
         self.pantalla.fill(self.color_fondo)
         
         # Título
-        texto_titulo = self.fuente_titulo.render("🎮 SQUASH", True, self.color_titulo)
-        rect_titulo = texto_titulo.get_rect(center=(500, 100))
+        texto_titulo = self.textos.render(self.fuente_titulo, "🎮 SQUASH", True, self.color_titulo)
+        rect_titulo = texto_titulo.get_rect(center=self.vista.punto(500, 100))
         self.pantalla.blit(texto_titulo, rect_titulo)
         
         # Subtítulo
-        texto_sub = self.fuente_descripcion.render("Proyecto con Patrones de Diseño", True, (100, 200, 255))
-        rect_sub = texto_sub.get_rect(center=(500, 150))
+        texto_sub = self.textos.render(self.fuente_descripcion, "Proyecto con Patrones de Diseño", True, (100, 200, 255))
+        rect_sub = texto_sub.get_rect(center=self.vista.punto(500, 150))
         self.pantalla.blit(texto_sub, rect_sub)
         
         # Instrucciones
-        texto_inst = self.fuente_descripcion.render("Selecciona la dificultad:", True, (200, 200, 200))
-        rect_inst = texto_inst.get_rect(center=(500, 220))
+        texto_inst = self.textos.render(self.fuente_descripcion, "Selecciona la dificultad:", True, (200, 200, 200))
+        rect_inst = texto_inst.get_rect(center=self.vista.punto(500, 220))
         self.pantalla.blit(texto_inst, rect_inst)
         
         # Opciones de dificultad
@@ -90,16 +98,16 @@ class EstadoMenu(Estado):
             color = self.color_seleccionado if i == self.opcion_seleccionada else self.color_opcion
             
             # Texto de la opción
-            texto_opcion = self.fuente_opcion.render(opcion["texto"], True, color)
-            rect_opcion = texto_opcion.get_rect(center=(500, y_inicio + i * espaciado))
+            texto_opcion = self.textos.render(self.fuente_opcion, opcion["texto"], True, color)
+            rect_opcion = texto_opcion.get_rect(center=self.vista.punto(500, y_inicio + i * espaciado))
             self.pantalla.blit(texto_opcion, rect_opcion)
             
             # Descripción de la dificultad
             if i == self.opcion_seleccionada:
                 estrategia = opcion["estrategia"]
                 descripcion = estrategia.obtener_descripcion()
-                texto_desc = self.fuente_descripcion.render(descripcion, True, self.color_descripcion)
-                rect_desc = texto_desc.get_rect(center=(500, y_inicio + i * espaciado + 30))
+                texto_desc = self.textos.render(self.fuente_descripcion, descripcion, True, self.color_descripcion)
+                rect_desc = texto_desc.get_rect(center=self.vista.punto(500, y_inicio + i * espaciado + 30))
                 self.pantalla.blit(texto_desc, rect_desc)
         
         # Controles
@@ -110,8 +118,8 @@ class EstadoMenu(Estado):
         ]
         
         for i, control in enumerate(controles):
-            texto = self.fuente_descripcion.render(control, True, (150, 150, 150))
-            rect = texto.get_rect(center=(500, y_controles + i * 30))
+            texto = self.textos.render(self.fuente_descripcion, control, True, (150, 150, 150))
+            rect = texto.get_rect(center=self.vista.punto(500, y_controles + i * 30))
             self.pantalla.blit(texto, rect)
     
     def iniciar_juego(self):
@@ -119,8 +127,10 @@ class EstadoMenu(Estado):
         opcion = self.opciones[self.opcion_seleccionada]
         estrategia = opcion["estrategia"]
         
-        print(f"\n🎮 [MENU] Iniciando juego con dificultad: {estrategia.obtener_nombre()}\n")
+        registro.info("🎮 [MENU] Iniciando juego con dificultad: %s", estrategia.obtener_nombre())
         
-        # Cambiar al estado de juego
+        # Cambiar al estado de juego (el módulo ya suele estar cargado por
+        # sistema.arranque; importarlo aquí mantiene el menú liviano)
+        from estados.estado_jugando import EstadoJugando
         estado_jugando = EstadoJugando(self.gestor_estados, estrategia)
         self.gestor_estados.cambiar_estado(estado_jugando)
\ No newline at end of file
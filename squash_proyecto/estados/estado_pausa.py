@@ -6,6 +6,7 @@ Estado de Pausa
 
 import pygame
 from estados import Estado
+from renderizado.cache_texto import CacheTexto
 
 class EstadoPausa(Estado):
     """
@@ -13,12 +14,17 @@ class EstadoPausa(Estado):
     Se superpone sobre el estado de juego.
     """
     
+    es_inactivo = True  # Pantalla estática: no redibujar a tasa fija
+    
     def __init__(self, gestor_estados):
         super().__init__(gestor_estados)
         
         # Fuentes
-        self.fuente_titulo = pygame.font.Font(None, 72)
-        self.fuente_opcion = pygame.font.Font(None, 40)
+        self.fuente_titulo = self.cargar_fuente(72)
+        self.fuente_opcion = self.cargar_fuente(40)
+        
+        # Caché compartida de textos ya rasterizados
+        self.textos = CacheTexto.obtener_instancia()
         
         # Opciones
         self.opciones = [
@@ -29,12 +35,35 @@ class EstadoPausa(Estado):
         
         self.opcion_seleccionada = 0
         
+        # Frame congelado del juego, oscurecido y con el título (se compone una vez)
+        self.fondo = None
+        self.opcion_dibujada = None
+        self.rects_opciones = []
+        
         # Colores
         self.color_overlay = (0, 0, 0, 180)  # Fondo semi-transparente
         self.color_titulo = (255, 255, 255)
         self.color_opcion = (200, 200, 200)
         self.color_seleccionado = (255, 255, 0)
     
+    def capturar_fondo(self, superficie):
+        """Oscurece una sola vez el frame congelado del juego y le agrega el título."""
+        overlay = pygame.Surface(superficie.get_size())
+        overlay.set_alpha(self.color_overlay[3])
+        overlay.fill(self.color_overlay[:3])
+        superficie.blit(overlay, (0, 0))
+        
+        texto_titulo = self.textos.render(self.fuente_titulo, "⏸ PAUSA", True, self.color_titulo)
+        rect_titulo = texto_titulo.get_rect(center=self.vista.punto(500, 200))
+        superficie.blit(texto_titulo, rect_titulo)
+        
+        self.fondo = superficie.convert() if pygame.display.get_surface() is not None else superficie
+        self.opcion_dibujada = None
+    
+    def repintar(self):
+        """Vuelve a copiar el frame congelado completo en el próximo dibujo."""
+        self.opcion_dibujada = None
+    
     def manejar_eventos(self, eventos):
         """Maneja eventos del menú de pausa."""
         for evento in eventos:
@@ -56,29 +85,39 @@ class EstadoPausa(Estado):
         """No hay actualizaciones en pausa."""
         pass
     
-    def dibujar(self):
-        """Dibuja el menú de pausa sobre el juego."""
-        # Crear superficie semi-transparente
-        overlay = pygame.Surface((1000, 700))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.pantalla.blit(overlay, (0, 0))
+    def dibujar(self, alfa=1.0):
+        """
+        Dibuja el menú de pausa sobre el frame congelado del juego.
+        Solo se repintan las opciones, y solo cuando cambia la selección.
+        """
+        if self.fondo is None:
+            # Sin estado debajo: fondo negro con el título
+            self.capturar_fondo(pygame.Surface(self.pantalla.get_size()))
         
-        # Título
-        texto_titulo = self.fuente_titulo.render("⏸ PAUSA", True, self.color_titulo)
-        rect_titulo = texto_titulo.get_rect(center=(500, 200))
-        self.pantalla.blit(texto_titulo, rect_titulo)
+        primer_frame = self.opcion_dibujada is None
+        if not primer_frame and self.opcion_dibujada == self.opcion_seleccionada:
+            return []
+        
+        if primer_frame:
+            self.pantalla.blit(self.fondo, (0, 0))
+        else:
+            for rect in self.rects_opciones:
+                self.pantalla.blit(self.fondo, rect, rect)
         
         # Opciones
         y_inicio = 320
         espaciado = 60
         
+        self.rects_opciones = []
         for i, opcion in enumerate(self.opciones):
             color = self.color_seleccionado if i == self.opcion_seleccionada else self.color_opcion
             
-            texto_opcion = self.fuente_opcion.render(opcion, True, color)
-            rect_opcion = texto_opcion.get_rect(center=(500, y_inicio + i * espaciado))
-            self.pantalla.blit(texto_opcion, rect_opcion)
+            texto_opcion = self.textos.render(self.fuente_opcion, opcion, True, color)
+            rect_opcion = texto_opcion.get_rect(center=self.vista.punto(500, y_inicio + i * espaciado))
+            self.rects_opciones.append(self.pantalla.blit(texto_opcion, rect_opcion))
+        
+        self.opcion_dibujada = self.opcion_seleccionada
+        return None if primer_frame else self.rects_opciones
     
     def ejecutar_opcion(self):
         """Ejecuta la opción seleccionada."""
@@ -89,13 +128,12 @@ class EstadoPausa(Estado):
         elif self.opcion_seleccionada == 1:
             # Volver al menú
             # Limpiar pila de estados
-            self.gestor_estados.pila_estados.clear()
+            self.gestor_estados.limpiar_pila()
             # Cambiar a menú
             from estados.estado_menu import EstadoMenu
             self.gestor_estados.cambiar_estado(EstadoMenu(self.gestor_estados))
 
         elif self.opcion_seleccionada == 2:
-            # Salir del juego
-            import sys
-            pygame.quit()
-            sys.exit()
+            # Salir del juego por el loop principal, como al cerrar la
+            # ventana: así los estados salen (y se cierra la repetición)
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
@@ -5,6 +5,9 @@ PATRÓN STATE - Gestor de Estados del Juego
 """
 
 import pygame
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("state")
 
 # =============================================================================
 # GESTOR DE ESTADOS (CLASE PRINCIPAL)
@@ -17,6 +20,10 @@ class GestorEstados:
     """
     
     def __init__(self, pantalla):
+        """
+        Args:
+            pantalla: Lienzo donde dibujan los estados (renderizado.lienzo)
+        """
         self.pantalla = pantalla
         self.estado_actual = None
         self.pila_estados = []
@@ -39,6 +46,8 @@ class GestorEstados:
         """
         if self.estado_actual:
             self.pila_estados.append(self.estado_actual)
+            # Congelar el último frame del estado de abajo
+            nuevo_estado.capturar_fondo(self.pantalla.copy())
         
         self.estado_actual = nuevo_estado
         self.estado_actual.entrar()
@@ -50,26 +59,51 @@ class GestorEstados:
         if self.pila_estados:
             self.estado_actual.salir()
             self.estado_actual = self.pila_estados.pop()
-            print(f"🎮 [STATE] Regresando a: {self.estado_actual.__class__.__name__}")
+            self.estado_actual.reanudar()
+            registro.info("🎮 [STATE] Regresando a: %s", self.estado_actual.__class__.__name__)
         else:
-            print("⚠️ [STATE] No hay estados en la pila")
+            registro.warning("⚠️ [STATE] No hay estados en la pila")
     
     def actualizar(self, eventos):
-        """Actualiza el estado actual."""
+        """Procesa los eventos y avanza un paso el estado actual."""
+        self.manejar_eventos(eventos)
+        self.actualizar_logica()
+    
+    def manejar_eventos(self, eventos):
+        """Entrega los eventos del frame al estado actual."""
         if self.estado_actual:
             self.estado_actual.manejar_eventos(eventos)
+    
+    def actualizar_logica(self):
+        """Avanza un paso fijo de la lógica del estado actual."""
+        if self.estado_actual:
             self.estado_actual.actualizar()
     
-    def dibujar(self):
-        """Dibuja el estado actual."""
+    def dibujar(self, alfa=1.0):
+        """
+        Dibuja el estado actual.
+        
+        Returns:
+            None para actualizar la pantalla completa, o la lista de
+            rectángulos que cambiaron
+        """
         if self.estado_actual:
-            self.estado_actual.dibujar()
+            return self.estado_actual.dibujar(alfa)
+        return None
     
     def obtener_estado_actual(self):
         """Retorna el estado actual."""
         return self.estado_actual
     
     def limpiar_pila(self):
-        """Limpia toda la pila de estados."""
-        self.pila_estados.clear()
-        print("🧹 [STATE] Pila de estados limpiada")
\ No newline at end of file
+        """Limpia toda la pila de estados (cada estado apilado sale)."""
+        while self.pila_estados:
+            self.pila_estados.pop().salir()
+        registro.info("🧹 [STATE] Pila de estados limpiada")
+    
+    def finalizar(self):
+        """Sale de todos los estados al cerrar el juego."""
+        if self.estado_actual:
+            self.estado_actual.salir()
+            self.estado_actual = None
+        self.limpiar_pila()
\ No newline at end of file
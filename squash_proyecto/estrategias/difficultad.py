@@ -5,7 +5,12 @@ PATRÓN STRATEGY - Estrategias de Dificultad
 Define diferentes algoritmos de dificultad intercambiables.
 """
 
+import math
 from abc import ABC, abstractmethod
+from config.configuracion import VELOCIDAD_MAXIMA_PELOTA
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("strategy")
 
 # =============================================================================
 # PATRÓN STRATEGY - INTERFACE
@@ -208,12 +213,12 @@ class GestorDificultad:
             estrategia = DificultadNormal()
         
         self._estrategia = estrategia
-        print(f"⚙️ [STRATEGY] Dificultad: {self._estrategia.obtener_nombre()}")
+        registro.info("⚙️ [STRATEGY] Dificultad: %s", self._estrategia.obtener_nombre())
     
     def cambiar_estrategia(self, nueva_estrategia):
         """Cambia la estrategia de dificultad."""
         self._estrategia = nueva_estrategia
-        print(f"⚙️ [STRATEGY] Dificultad cambiada a: {self._estrategia.obtener_nombre()}")
+        registro.info("⚙️ [STRATEGY] Dificultad cambiada a: %s", self._estrategia.obtener_nombre())
     
     def obtener_estrategia(self):
         """Retorna la estrategia actual."""
@@ -227,14 +232,19 @@ class GestorDificultad:
         if nivel == 1:
             juego.vidas = self._estrategia.calcular_vidas_iniciales()
         
-        # Configurar velocidad de pelota
-        if hasattr(juego, 'pelota') and juego.pelota:
-            velocidad = self._estrategia.calcular_velocidad_pelota(nivel)
-            factor = velocidad / 5  # 5 es la velocidad base
-            juego.pelota.velocidad_x = juego.pelota.velocidad_x / abs(juego.pelota.velocidad_x) * velocidad
-            juego.pelota.velocidad_y = abs(juego.pelota.velocidad_y) * factor
+        # Configurar velocidad de pelota: la de la estrategia, con tope por paso
+        velocidad = min(self._estrategia.calcular_velocidad_pelota(nivel), VELOCIDAD_MAXIMA_PELOTA)
+        if getattr(juego, 'motor', None) is not None:
+            # Modo multibola: ajustar todas las pelotas de una vez
+            juego.motor.ajustar_velocidad(velocidad)
+        elif hasattr(juego, 'pelota') and juego.pelota:
+            # Se fija la magnitud (no se multiplica la actual) y se conserva
+            # el sentido: multiplicar acumulaba el factor en cada subida de
+            # nivel y forzar vy hacia abajo devolvía la pelota a la raqueta
+            juego.pelota.velocidad_x = math.copysign(velocidad, juego.pelota.velocidad_x)
+            juego.pelota.velocidad_y = math.copysign(velocidad, juego.pelota.velocidad_y)
         
-        print(f"⚙️ [STRATEGY] Configuración aplicada - Nivel {nivel}")
+        registro.debug("⚙️ [STRATEGY] Configuración aplicada - Nivel %s", nivel)
     
     @staticmethod
     def obtener_estrategias_disponibles():
@@ -0,0 +1,144 @@
+# pylint: disable=all
+"""
+Colisiones Continuas (Barrido)
+==============================
+Calcula el instante exacto de impacto dentro de un paso, en lugar de
+probar solapamiento solo al final del paso. Evita que una pelota rápida
+atraviese la raqueta o quede atrapada fuera de la cancha.
+
+Los tiempos se expresan como fracción [0, 1] del desplazamiento (dx, dy).
+"""
+
+import math
+
+# Resultado cuando el círculo ya solapa el rectángulo al inicio del paso
+SOLAPADO = (0.0, 0.0, 0.0)
+
+
+def tiempo_impacto_paredes(x, y, dx, dy, ancho):
+    """
+    Primer impacto del centro de la pelota con las paredes de la cancha
+    (izquierda x=0, derecha x=ancho, techo y=0). El borde inferior no
+    rebota: es donde se pierde la pelota.
+
+    Returns:
+        Tupla (t, eje) con eje 'x' o 'y', o None si no hay impacto en el paso
+    """
+    t_min = None
+    eje = None
+
+    if dx < 0 and x + dx < 0:
+        t_min = -x / dx
+        eje = "x"
+    elif dx > 0 and x + dx > ancho:
+        t_min = (ancho - x) / dx
+        eje = "x"
+
+    if dy < 0 and y + dy < 0:
+        t = -y / dy
+        if t_min is None or t < t_min:
+            t_min = t
+            eje = "y"
+
+    if t_min is None:
+        return None
+    return max(t_min, 0.0), eje
+
+
+def tiempo_impacto_circulo_rectangulo(x, y, dx, dy, radio, rx, ry, ancho, alto):
+    """
+    Barrido de un círculo contra un rectángulo alineado a los ejes.
+
+    Se prueba el segmento del centro contra el rectángulo expandido por el
+    radio (suma de Minkowski) y, si el impacto cae en una esquina, contra
+    el círculo de radio 'radio' centrado en esa esquina.
+
+    Args:
+        x, y: Centro del círculo al inicio del paso
+        dx, dy: Desplazamiento del centro durante el paso
+        radio: Radio del círculo
+        rx, ry, ancho, alto: Rectángulo
+
+    Returns:
+        Tupla (t, nx, ny) con la fracción del paso y la normal de la
+        superficie golpeada; SOLAPADO si ya se tocaban al inicio;
+        None si no hay impacto en el paso.
+    """
+    izquierda = rx - radio
+    derecha = rx + ancho + radio
+    arriba = ry - radio
+    abajo = ry + alto + radio
+
+    t_entrada = 0.0
+    t_salida = 1.0
+    nx = ny = 0.0
+
+    # Método de los "slabs", eje X
+    if dx == 0.0:
+        if x < izquierda or x > derecha:
+            return None
+    else:
+        t1 = (izquierda - x) / dx
+        t2 = (derecha - x) / dx
+        normal = -1.0
+        if t1 > t2:
+            t1, t2 = t2, t1
+            normal = 1.0
+        if t1 > t_entrada:
+            t_entrada = t1
+            nx, ny = normal, 0.0
+        t_salida = min(t_salida, t2)
+        if t_entrada > t_salida:
+            return None
+
+    # Eje Y
+    if dy == 0.0:
+        if y < arriba or y > abajo:
+            return None
+    else:
+        t1 = (arriba - y) / dy
+        t2 = (abajo - y) / dy
+        normal = -1.0
+        if t1 > t2:
+            t1, t2 = t2, t1
+            normal = 1.0
+        if t1 > t_entrada:
+            t_entrada = t1
+            nx, ny = 0.0, normal
+        t_salida = min(t_salida, t2)
+        if t_entrada > t_salida:
+            return None
+
+    # Punto de contacto sobre el rectángulo expandido
+    px = x + dx * t_entrada
+    py = y + dy * t_entrada
+
+    # ¿Cae en una zona de esquina? Entonces el borde real es redondeado
+    esquina_x = rx if px < rx else (rx + ancho if px > rx + ancho else None)
+    esquina_y = ry if py < ry else (ry + alto if py > ry + alto else None)
+
+    if esquina_x is None or esquina_y is None:
+        if nx == 0.0 and ny == 0.0:
+            return SOLAPADO
+        return t_entrada, nx, ny
+
+    # Intersección del segmento con el círculo de la esquina
+    ox = x - esquina_x
+    oy = y - esquina_y
+    c = ox * ox + oy * oy - radio * radio
+    if c <= 0.0:
+        return SOLAPADO
+
+    a = dx * dx + dy * dy
+    b = ox * dx + oy * dy
+    discriminante = b * b - a * c
+    if a == 0.0 or b >= 0.0 or discriminante < 0.0:
+        return None
+
+    t = (-b - math.sqrt(discriminante)) / a
+    if t < 0.0 or t > 1.0:
+        return None
+
+    nx = (ox + dx * t) / radio
+    ny = (oy + dy * t) / radio
+    return t, nx, ny
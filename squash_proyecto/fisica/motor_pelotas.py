@@ -0,0 +1,269 @@
+# pylint: disable=all
+"""
+Motor Multibola (Estructura de Arreglos)
+=========================================
+Guarda todas las pelotas en arreglos de NumPy (x, y, vx, vy, radio,
+id de tipo y máscara de activas) y resuelve rebotes, colisión con la
+raqueta, desvío por punto de impacto y pérdida en una sola pasada
+vectorizada por operación. Reemplaza a un objeto Pelota por bola cuando
+hay cientos o miles de pelotas en pantalla.
+"""
+
+import numpy as np
+from entidades.fabrica_pelotas import FabricaPelotas, ANCHO_CANCHA, ALTO_CANCHA
+from renderizado.sprites import CacheSprites
+from renderizado.vista import Vista
+
+
+class MotorPelotas:
+    """
+    Motor de física para muchas pelotas a la vez.
+    Las pelotas nuevas ocupan huecos libres de los arreglos;
+    nunca se crean objetos por pelota.
+    """
+
+    def __init__(self, capacidad, ancho=ANCHO_CANCHA, alto=ALTO_CANCHA, radio=10):
+        """
+        Args:
+            capacidad: Número máximo de pelotas simultáneas
+            ancho, alto: Dimensiones de la cancha
+            radio: Radio por defecto de las pelotas nuevas
+        """
+        self.capacidad = capacidad
+        self.ancho = ancho
+        self.alto = alto
+        self.radio_defecto = radio
+
+        self.x = np.zeros(capacidad)
+        self.y = np.zeros(capacidad)
+        self.x_anterior = np.zeros(capacidad)  # Paso anterior (para interpolar)
+        self.y_anterior = np.zeros(capacidad)
+        self.vx = np.zeros(capacidad)
+        self.vy = np.zeros(capacidad)
+        self.radio = np.full(capacidad, float(radio))
+        self.tipo = np.zeros(capacidad, dtype=np.int8)
+        self.activa = np.zeros(capacidad, dtype=bool)
+
+        # Tablas por id de tipo (ver FabricaPelotas.TIPOS)
+        self.puntos_bonus = np.array(FabricaPelotas.PUNTOS_BONUS, dtype=np.int64)
+        self.colores = list(FabricaPelotas.COLORES)
+
+        # Buffers reutilizados para no crear arreglos en cada frame
+        self._mascara = np.zeros(capacidad, dtype=bool)
+        self._auxiliar = np.zeros(capacidad, dtype=bool)
+
+    # -------------------------------------------------------------------------
+    # Gestión de huecos
+    # -------------------------------------------------------------------------
+
+    def agregar(self, x, y, vx, vy, tipo_id=0, radio=None):
+        """
+        Agrega una pelota en el primer hueco libre.
+
+        Returns:
+            Índice ocupado, o -1 si el motor está lleno
+        """
+        libres = np.flatnonzero(~self.activa)
+        if len(libres) == 0:
+            return -1
+
+        i = libres[0]
+        self.x[i] = self.x_anterior[i] = x
+        self.y[i] = self.y_anterior[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.radio[i] = self.radio_defecto if radio is None else radio
+        self.tipo[i] = tipo_id
+        self.activa[i] = True
+        return i
+
+    def agregar_lote(self, x, y, velocidades, tipos):
+        """
+        Agrega varias pelotas que salen desde (x, y) hacia arriba a la derecha.
+
+        Args:
+            velocidades: Velocidad de cada pelota (vx = v, vy = -v)
+            tipos: Id de tipo de cada pelota
+
+        Returns:
+            Arreglo con los índices ocupados (puede ser más corto si no hay espacio)
+        """
+        indices = np.flatnonzero(~self.activa)[:len(tipos)]
+        n = len(indices)
+        velocidades = np.asarray(velocidades, dtype=float)[:n]
+
+        self.x[indices] = x
+        self.y[indices] = y
+        self.x_anterior[indices] = x
+        self.y_anterior[indices] = y
+        self.vx[indices] = velocidades
+        self.vy[indices] = -velocidades
+        self.radio[indices] = self.radio_defecto
+        self.tipo[indices] = np.asarray(tipos, dtype=np.int8)[:n]
+        self.activa[indices] = True
+        return indices
+
+    def liberar(self, indices):
+        """Libera los huecos indicados."""
+        self.activa[indices] = False
+        self.vx[indices] = 0.0
+        self.vy[indices] = 0.0
+
+    def cantidad_activas(self):
+        """Número de pelotas en juego."""
+        return int(np.count_nonzero(self.activa))
+
+    # -------------------------------------------------------------------------
+    # Física vectorizada
+    # -------------------------------------------------------------------------
+
+    def mover(self):
+        """
+        Avanza todas las pelotas un paso y las refleja en las paredes.
+        La reflexión deja la pelota dentro de la cancha (como si hubiera
+        rebotado en el instante exacto del impacto), así que una pelota
+        rápida nunca queda atrapada fuera invirtiendo su velocidad.
+        """
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        mascara = self._mascara
+
+        np.copyto(self.x_anterior, x)
+        np.copyto(self.y_anterior, y)
+
+        # Las pelotas inactivas tienen velocidad 0, así que no se mueven
+        x += vx
+        y += vy
+
+        # Rebote en el borde izquierdo
+        np.less(x, 0, out=mascara)
+        np.negative(x, out=x, where=mascara)
+        np.absolute(vx, out=vx, where=mascara)
+
+        # Rebote en el borde derecho
+        np.greater(x, self.ancho, out=mascara)
+        np.subtract(2 * self.ancho, x, out=x, where=mascara)
+        np.negative(np.absolute(vx), out=vx, where=mascara)
+
+        # Rebote en el borde superior
+        np.less(y, 0, out=mascara)
+        np.negative(y, out=y, where=mascara)
+        np.absolute(vy, out=vy, where=mascara)
+
+    def verificar_colisiones(self, raqueta):
+        """
+        Prueba continua de todas las pelotas contra la raqueta: detecta las
+        que cruzaron la cara superior durante el paso (aunque ya estén del
+        otro lado) y las que terminan solapadas moviéndose hacia ella.
+        Aplica el rebote con desvío según el punto de impacto.
+
+        Returns:
+            Arreglo con los índices de las pelotas que golpearon la raqueta
+        """
+        x, y, r = self.x, self.y, self.radio
+        xa, ya = self.x_anterior, self.y_anterior
+        mascara, auxiliar = self._mascara, self._auxiliar
+        izquierda = raqueta.x
+        derecha = raqueta.x + raqueta.ancho
+
+        # Solapamiento al final del paso, acercándose a la raqueta
+        np.greater(x + r, izquierda, out=mascara)
+        np.less(x - r, derecha, out=auxiliar)
+        mascara &= auxiliar
+        np.greater(y + r, raqueta.y, out=auxiliar)
+        mascara &= auxiliar
+        np.less(y - r, raqueta.y + raqueta.alto, out=auxiliar)
+        mascara &= auxiliar
+        np.greater(self.vy, 0, out=auxiliar)
+        mascara &= auxiliar
+
+        # Cruce de la cara superior durante el paso (evita el "tunneling")
+        plano = raqueta.y - r
+        cruce = (ya <= plano) & (y > plano) & self.activa
+        candidatas = np.flatnonzero(cruce)
+        if len(candidatas):
+            xa_c, ya_c = xa[candidatas], ya[candidatas]
+            t = (plano[candidatas] - ya_c) / (y[candidatas] - ya_c)
+            x_contacto = xa_c + (x[candidatas] - xa_c) * t
+            r_c = r[candidatas]
+            dentro = (x_contacto + r_c > izquierda) & (x_contacto - r_c < derecha)
+            cruzaron = candidatas[dentro]
+            mascara[cruzaron] = True
+        else:
+            cruzaron = candidatas
+        mascara &= self.activa
+
+        golpes = np.flatnonzero(mascara)
+        if len(golpes):
+            centro_raqueta = raqueta.x + raqueta.ancho / 2
+            self.vy[golpes] = -np.abs(self.vy[golpes])
+            self.vx[golpes] = (x[golpes] - centro_raqueta) * 0.1
+
+            if len(cruzaron):
+                # Llevar la pelota al punto de contacto y gastar el resto
+                # del paso con la nueva velocidad
+                t = t[dentro]
+                restante = 1.0 - t
+                x_contacto = x_contacto[dentro]
+                vx_nueva = (x_contacto - centro_raqueta) * 0.1
+                self.vx[cruzaron] = vx_nueva
+                self.x[cruzaron] = x_contacto + vx_nueva * restante
+                self.y[cruzaron] = plano[cruzaron] + self.vy[cruzaron] * restante
+        return golpes
+
+    def recoger_perdidas(self):
+        """
+        Desactiva las pelotas que cruzaron el borde inferior.
+
+        Returns:
+            Arreglo con los índices de las pelotas perdidas en este paso
+        """
+        mascara = self._mascara
+        np.greater_equal(self.y, self.alto, out=mascara)
+        mascara &= self.activa
+        perdidas = np.flatnonzero(mascara)
+        if len(perdidas):
+            self.liberar(perdidas)
+        return perdidas
+
+    def aplicar_imantacion(self, raqueta):
+        """Versión vectorizada de Raqueta.aplicar_imantacion para todas las pelotas."""
+        centro = raqueta.x + raqueta.ancho / 2
+        diferencia = self.x - centro
+        cerca = (np.abs(diferencia) < 150) & (self.y > 300) & self.activa
+        self.vx[cerca] -= diferencia[cerca] * 0.05
+
+    def ajustar_velocidad(self, velocidad):
+        """
+        Aplica la velocidad de la estrategia de dificultad a todas las pelotas.
+        Como con la pelota única, fija la magnitud de vy (en vez de
+        multiplicarla) y conserva su sentido: acumular el factor o forzar vy
+        hacia abajo haría crecer la velocidad sin límite.
+        """
+        activas = self.activa
+        self.vx[activas] = np.sign(self.vx[activas]) * velocidad
+        self.vy[activas] = np.where(self.vy[activas] < 0, -velocidad, velocidad)
+
+    # -------------------------------------------------------------------------
+    # Dibujo
+    # -------------------------------------------------------------------------
+
+    def dibujar(self, lienzo, alfa=1.0):
+        """Dibuja las pelotas activas en el lienzo interpolando entre el paso anterior y el actual."""
+        activas = np.flatnonzero(self.activa)
+        xs = self.x_anterior[activas] + (self.x[activas] - self.x_anterior[activas]) * alfa
+        ys = self.y_anterior[activas] + (self.y[activas] - self.y_anterior[activas]) * alfa
+
+        # Posición en el framebuffer: esquina del sprite (radio ya escalado)
+        escala = Vista.obtener_instancia().escala
+        radios = self.radio[activas].astype(int)
+        mitades = np.rint(radios * escala).astype(int)
+        xs = (xs * escala).astype(int) - mitades
+        ys = (ys * escala).astype(int) - mitades
+
+        # Un solo blits() con los sprites ya rasterizados de cada tipo
+        colores = self.colores
+        sprite = CacheSprites.obtener_instancia().pelota
+        lienzo.blits([(sprite(colores[t], r), (x, y)) for t, r, x, y in
+                      zip(self.tipo[activas].tolist(), radios.tolist(),
+                          xs.tolist(), ys.tolist())],
+                     doreturn=False)
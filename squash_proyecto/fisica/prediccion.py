@@ -0,0 +1,155 @@
+# pylint: disable=all
+"""
+Predicción del Punto de Cruce
+=============================
+Calcula en forma cerrada dónde cruzará la pelota la altura de la raqueta.
+Los rebotes en las paredes laterales y en el techo son reflexiones
+especulares, así que en lugar de simular la trayectoria paso a paso se
+"despliega" la cancha: la pelota sigue en línea recta por copias
+reflejadas de la cancha y la posición real se obtiene plegando x en el
+intervalo [0, ancho]. El costo es O(1) sin importar cuántos rebotes haya.
+"""
+
+import math
+import numpy as np
+from config.configuracion import ANCHO_CANCHA
+
+
+def plegar(x, ancho):
+    """
+    Lleva una coordenada x desplegada (línea recta a través de copias
+    reflejadas de la cancha) a su posición real en [0, ancho].
+    """
+    periodo = 2.0 * ancho
+    x = x % periodo
+    return periodo - x if x > ancho else x
+
+
+def reflejar_entre_paredes(x, v, pasos, ancho):
+    """
+    Avanza una coordenada 'pasos' pasos con velocidad v, rebotando en 0 y
+    en ancho, sin recorrer los rebotes uno por uno.
+
+    Igual que la física paso a paso, llegar justo a una pared no invierte
+    la velocidad todavía: eso pasa recién cuando la pelota intentaría
+    salir de la cancha.
+
+    Returns:
+        Tupla (x, v) al final de los pasos
+    """
+    if v == 0 or pasos <= 0:
+        return x, v
+
+    u = x + v * pasos
+    # Copia desplegada de la cancha donde termina la pelota
+    if v > 0:
+        copia = math.ceil(u / ancho) - 1
+    else:
+        copia = math.floor(u / ancho)
+
+    if copia % 2 == 0:
+        return u - copia * ancho, v
+    return (copia + 1) * ancho - u, -v
+
+
+def predecir_cruce(x, y, vx, vy, y_objetivo, ancho=ANCHO_CANCHA):
+    """
+    Punto donde el centro de la pelota cruzará la altura y_objetivo.
+
+    Args:
+        x, y: Posición actual del centro
+        vx, vy: Velocidad (por paso)
+        y_objetivo: Altura a cruzar (normalmente raqueta.y - radio)
+        ancho: Ancho de la cancha
+
+    Returns:
+        Tupla (x_cruce, pasos) o None si la pelota no llegará a cruzarla
+        (está quieta en y o ya pasó de largo hacia abajo)
+    """
+    if vy > 0:
+        if y > y_objetivo:
+            return None
+        pasos = (y_objetivo - y) / vy
+    elif vy < 0:
+        # Sube, rebota en el techo (y = 0) y baja hasta y_objetivo
+        pasos = (y + y_objetivo) / -vy
+    else:
+        return None
+
+    return plegar(x + vx * pasos, ancho), pasos
+
+
+def pasos_hasta_cruce(y, vy, activa, y_objetivo):
+    """
+    Versión vectorizada del tiempo de cruce para el motor multibola.
+
+    Returns:
+        Arreglo con los pasos hasta cruzar y_objetivo (inf si no cruza)
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pasos = np.where(vy > 0, (y_objetivo - y) / vy, (y + y_objetivo) / -vy)
+    no_cruza = ~activa | (vy == 0) | ((vy > 0) & (y > y_objetivo))
+    pasos[no_cruza] = np.inf
+    return pasos
+
+
+class PredictorAterrizaje:
+    """
+    Predicción con caché para una pelota.
+
+    La trayectoria solo cambia cuando cambia la velocidad de la pelota por
+    algo que no es un rebote en pared: un golpe de raqueta, la imantación,
+    un ajuste de dificultad o una pelota nueva. Los rebotes en pared solo
+    invierten un signo y no cambian el punto de cruce, así que mientras el
+    módulo de la velocidad se mantenga se reutiliza el último cálculo.
+    """
+
+    def __init__(self, ancho=ANCHO_CANCHA):
+        self.ancho = ancho
+        self.x_cruce = None
+        self.paso_cruce = None      # Paso absoluto estimado del cruce
+        self.calculos = 0           # Cuántas veces se recalculó (diagnóstico)
+        self._pelota = None
+        self._clave = None
+        self._vy = 0.0
+
+    def invalidar(self):
+        """Descarta la predicción en caché."""
+        self._pelota = None
+        self._clave = None
+
+    def predecir(self, pelota, y_objetivo, paso_actual=0):
+        """
+        Punto de cruce de la pelota con y_objetivo.
+
+        Args:
+            pelota: Pelota a seguir
+            y_objetivo: Altura a cruzar
+            paso_actual: Paso de la simulación (para paso_cruce)
+
+        Returns:
+            True si la predicción se recalculó en esta llamada
+        """
+        vx = pelota.velocidad_x
+        vy = pelota.velocidad_y
+        clave = (abs(vx), abs(vy), y_objetivo)
+
+        # Pasar de bajar a subir no es un rebote en pared: fue la raqueta
+        golpe = self._vy > 0 and vy < 0
+        self._vy = vy
+
+        if pelota is self._pelota and clave == self._clave and not golpe:
+            return False
+
+        self._pelota = pelota
+        self._clave = clave
+        self.calculos += 1
+
+        cruce = predecir_cruce(pelota.x, pelota.y, vx, vy, y_objetivo, self.ancho)
+        if cruce is None:
+            self.x_cruce = None
+            self.paso_cruce = None
+        else:
+            self.x_cruce, pasos = cruce
+            self.paso_cruce = paso_actual + pasos
+        return True
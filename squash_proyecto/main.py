@@ -15,70 +15,184 @@ Patrones implementados:
 Estructura modular para Visual Studio Code
 """
 
+import os
 import sys
+import time
 import pygame
 from config.configuracion import ConfiguracionJuego
 from estados.gestor_estados import GestorEstados
 from estados.estado_menu import EstadoMenu
+from sistema.bucle_juego import BucleTiempoFijo, BucleSinLimite
+from sistema.perfilador import PerfiladorFrames, FASE_EVENTOS, FASE_PRESENTAR, FASE_ESPERA
+from renderizado.overlay_perfilador import OverlayPerfilador
+from renderizado.vista import Vista
+from sistema.arranque import InformeArranque, iniciar_video, cargar_en_segundo_plano
+from sistema.registro import configurar_registro, obtener_logger
 
-def main():
+registro = obtener_logger("app")
+
+def main(repeticion=None, sin_limite=False, informe=None):
     """
     Función principal del juego.
-    Inicializa Pygame y el gestor de estados.
+    Inicializa Pygame y el gestor de estados con la configuración del
+    singleton (ya cargada y congelada por config.linea_comandos).
+    
+    Args:
+        repeticion: Ruta de una partida grabada; si se indica, se reproduce
+                    en lugar de mostrar el menú
+        sin_limite: Reproducir sin esperar al reloj ni limitar los FPS
+        informe: InformeArranque donde registrar los tiempos del arranque
+                 (--startup-report); por defecto uno que no se imprime
     """
-    # Inicializar Pygame
-    pygame.init()
+    if informe is None:
+        informe = InformeArranque()
+    
+    # Registro en segundo plano (antes que nada, para no perder mensajes)
+    with informe.fase("configurar registro"):
+        configurar_registro()
+        
+        # Obtener configuración usando Singleton
+        config = ConfiguracionJuego.obtener_instancia()
+        configurar_registro(config.nivel_registro, config.modo_release)
     
-    # Obtener configuración usando Singleton
-    config = ConfiguracionJuego.obtener_instancia()
+    # Sin ventana ni audio: drivers dummy de SDL (antes de iniciar el video)
+    if config.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
     
-    # Crear pantalla
-    pantalla = pygame.display.set_mode((config.ancho_pantalla, config.alto_pantalla))
-    pygame.display.set_caption("🎮 Squash - Patrones de Diseño")
+    # Solo display y font antes del primer frame (ver sistema.arranque);
+    # 'pantalla' es el lienzo del framebuffer interno (renderizado.lienzo),
+    # que la vista escala a la ventana
+    pantalla = iniciar_video(config, informe, "🎮 Squash - Patrones de Diseño")
+    vista = Vista.obtener_instancia()
     
-    # Crear reloj para controlar FPS
+    # Mezclador y módulos de la partida en un hilo, mientras se ve el menú
+    carga = cargar_en_segundo_plano(config, informe)
+    
+    # Crear reloj para limitar los FPS de dibujo
     reloj = pygame.time.Clock()
     
+    # Bucle de paso fijo: la lógica corre a tasa constante sin importar los FPS
+    if sin_limite:
+        bucle = BucleSinLimite(config.max_pasos_por_frame)
+    else:
+        bucle = BucleTiempoFijo(config.tasa_simulacion, config.max_pasos_por_frame)
+    
     # Crear gestor de estados e iniciar con el menú
     gestor_estados = GestorEstados(pantalla)
-    gestor_estados.cambiar_estado(EstadoMenu(gestor_estados))
+    if repeticion is not None:
+        from estados.estado_jugando import EstadoJugando
+        from simulacion.repeticion import LectorRepeticion
+        gestor_estados.cambiar_estado(EstadoJugando(gestor_estados, repeticion=LectorRepeticion(repeticion)))
+    else:
+        with informe.fase("EstadoMenu"):
+            gestor_estados.cambiar_estado(EstadoMenu(gestor_estados))
     
     # Mensaje de inicio en consola
-    print("=" * 70)
-    print("🎯 SQUASH - PROYECTO FINAL CON PATRONES DE DISEÑO")
-    print("=" * 70)
-    print("✅ Singleton: ConfiguracionJuego")
-    print("✅ Factory Method: FabricaPelotas")
-    print("✅ Observer: ObservadorEventos")
-    print("✅ Strategy: Estrategias de dificultad")
-    print("✅ Decorator: Modos especiales de raqueta")
-    print("✅ Adapter: InputAdapter para múltiples controles")
-    print("✅ State: Gestión de estados del juego")
-    print("✅ Command: Sistema de comandos")
-    print("=" * 70)
+    registro.info("=" * 70)
+    registro.info("🎯 SQUASH - PROYECTO FINAL CON PATRONES DE DISEÑO")
+    registro.info("=" * 70)
+    registro.info("✅ Singleton: ConfiguracionJuego")
+    registro.info("✅ Factory Method: FabricaPelotas")
+    registro.info("✅ Observer: ObservadorEventos")
+    registro.info("✅ Strategy: Estrategias de dificultad")
+    registro.info("✅ Decorator: Modos especiales de raqueta")
+    registro.info("✅ Adapter: InputAdapter para múltiples controles")
+    registro.info("✅ State: Gestión de estados del juego")
+    registro.info("✅ Command: Sistema de comandos")
+    registro.info("=" * 70)
+    registro.info("⚙️ [CONFIG] %s | fps %s | vsync %s | escala %s | %s | buffer de audio %s | efectos %s",
+                  config.origen, config.fps or "sin límite", "sí" if config.vsync else "no",
+                  config.escala_render, config.backend_render, config.buffer_audio, config.calidad_efectos)
+    
+    # Perfilador de frames por fases (F3)
+    perfilador = PerfiladorFrames.obtener_instancia()
+    overlay_perfilador = None
     
     # Loop principal del juego
     ejecutando = True
+    estado_dibujado = None
+    primer_frame = True
     while ejecutando:
+        estado = gestor_estados.estado_actual
+        inactivo = estado is not None and estado.es_inactivo
+        
+        medir = perfilador.activo
+        if medir:
+            inicio = perfilador.iniciar_frame()
+        
         # Procesar eventos
-        eventos = pygame.event.get()
+        if inactivo and estado is estado_dibujado:
+            # Pantalla estática ya dibujada: dormir hasta una entrada o el temporizador
+            evento = pygame.event.wait(config.espera_inactivo_ms)
+            eventos = [] if evento.type == pygame.NOEVENT else [evento]
+            eventos.extend(pygame.event.get())
+        else:
+            eventos = pygame.event.get()
+        if medir:
+            # La espera de los estados inactivos queda dentro de esta fase
+            perfilador.medir_desde(FASE_EVENTOS, inicio)
+        
         for evento in eventos:
             if evento.type == pygame.QUIT:
                 ejecutando = False
             elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_ESCAPE:
                 ejecutando = False
+            elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_F3:
+                if not perfilador.alternar() and gestor_estados.estado_actual is not None:
+                    # Borrar el overlay: el estado vuelve a dibujar la pantalla completa
+                    gestor_estados.estado_actual.repintar()
+                if overlay_perfilador is None:
+                    overlay_perfilador = OverlayPerfilador(perfilador)
+                overlay_perfilador.invalidar()
+        
+        # Entregar eventos al estado actual
+        gestor_estados.manejar_eventos(eventos)
+        
+        # Avanzar la lógica en pasos fijos (varios si vamos atrasados)
+        if inactivo:
+            # El tiempo en espera no debe recuperarse al volver a jugar
+            bucle.reiniciar()
+            alfa = 1.0
+        else:
+            pasos, alfa = bucle.avanzar()
+            for _ in range(pasos):
+                gestor_estados.actualizar_logica()
         
-        # Actualizar estado actual
-        gestor_estados.actualizar(eventos)
+        # Dibujar estado actual interpolando entre pasos
+        estado_dibujado = estado
+        rects_sucios = gestor_estados.dibujar(alfa)
         
-        # Dibujar estado actual
-        gestor_estados.dibujar()
+        if perfilador.activo:
+            rect_overlay = overlay_perfilador.dibujar(pantalla)
+            if rects_sucios is not None:
+                rects_sucios = rects_sucios + [rect_overlay]
         
-        # Actualizar pantalla
-        pygame.display.flip()
+        # Actualizar pantalla (completa, o solo las zonas que cambiaron)
+        if medir:
+            inicio = time.perf_counter_ns()
+        vista.presentar(rects_sucios)
+        if medir:
+            inicio = perfilador.medir_desde(FASE_PRESENTAR, inicio)
         
-        # Controlar FPS
-        reloj.tick(config.fps)
+        # Limitar FPS de dibujo
+        reloj.tick(0 if sin_limite else config.fps)
+        if medir:
+            perfilador.medir_desde(FASE_ESPERA, inicio)
+            perfilador.terminar_frame()
+        
+        # Informe de arranque: con el primer frame visible y la carga terminada
+        if primer_frame:
+            primer_frame = False
+            informe.marcar("primer frame en pantalla")
+        if not informe.impreso and not carga.is_alive():
+            informe.imprimir()
+    
+    # Cerrar los estados (p. ej. para terminar de escribir una repetición)
+    gestor_estados.finalizar()
+    
+    # No cerrar pygame con el hilo de carga todavía abriendo el mezclador
+    carga.join()
     
     # Finalizar Pygame
     pygame.quit()
@@ -0,0 +1,180 @@
+# pylint: disable=all
+"""
+PATRÓN OBSERVER - Bus de Eventos
+================================
+Sujeto central del patrón Observer. Los eventos son registros tipados
+con __slots__ (sin diccionarios por evento) y las suscripciones se
+indexan por tipo de evento, así que cada evento solo llega a quien lo
+escucha.
+
+Los eventos publicados durante un paso se acumulan y se entregan en un
+solo lote al final del paso con despachar(). Los suscriptores lentos
+pueden pedir la entrega en un hilo de trabajo para no frenar la
+simulación.
+"""
+
+import queue
+import threading
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("observer")
+
+# =============================================================================
+# EVENTOS
+# =============================================================================
+
+class Evento:
+    """Clase base de los eventos del juego."""
+    __slots__ = ()
+
+
+class EventoGolpe(Evento):
+    """La pelota tocó la raqueta."""
+    __slots__ = ("puntos", "combo")
+
+    def __init__(self, puntos, combo):
+        self.puntos = puntos
+        self.combo = combo
+
+
+class EventoPelotaPerdida(Evento):
+    """La pelota salió por abajo."""
+    __slots__ = ()
+
+
+class EventoNivelSubido(Evento):
+    """Se alcanzó un nivel nuevo."""
+    __slots__ = ("nivel",)
+
+    def __init__(self, nivel):
+        self.nivel = nivel
+
+
+class EventoGameOver(Evento):
+    """Se acabaron las vidas."""
+    __slots__ = ()
+
+
+# Los eventos sin datos son inmutables: basta una instancia compartida
+PELOTA_PERDIDA = EventoPelotaPerdida()
+GAME_OVER = EventoGameOver()
+
+
+# =============================================================================
+# HILO DE TRABAJO PARA SUSCRIPTORES LENTOS
+# =============================================================================
+
+class _HiloEntrega:
+    """Hilo único (daemon) que ejecuta las entregas pedidas con en_hilo=True."""
+
+    _instancia = None
+    _candado = threading.Lock()
+
+    @classmethod
+    def obtener_instancia(cls):
+        with cls._candado:
+            if cls._instancia is None:
+                cls._instancia = cls()
+        return cls._instancia
+
+    def __init__(self):
+        self.cola = queue.SimpleQueue()
+        self.hilo = threading.Thread(target=self._ejecutar, name="squash-eventos", daemon=True)
+        self.hilo.start()
+
+    def encolar(self, callback, eventos):
+        self.cola.put((callback, eventos))
+
+    def esperar(self):
+        """Bloquea hasta que se entregue todo lo encolado hasta ahora."""
+        listo = threading.Event()
+        self.cola.put((None, listo))
+        listo.wait()
+
+    def _ejecutar(self):
+        while True:
+            callback, eventos = self.cola.get()
+            if callback is None:
+                eventos.set()
+                continue
+            for evento in eventos:
+                try:
+                    callback(evento)
+                except Exception:
+                    registro.exception("❌ [OBSERVER] Error en suscriptor %r", callback)
+
+
+# =============================================================================
+# BUS DE EVENTOS (SUJETO)
+# =============================================================================
+
+class BusEventos:
+    """
+    PATRÓN: OBSERVER - Sujeto
+    -------------------------
+    Mantiene las suscripciones por tipo de evento y entrega los eventos
+    pendientes en lote.
+    """
+
+    def __init__(self):
+        self._suscriptores = {}        # tipo -> [callback] (en el hilo del juego)
+        self._suscriptores_hilo = {}   # tipo -> [callback] (en el hilo de trabajo)
+        self._pendientes = []
+
+    def suscribir(self, tipo_evento, callback, en_hilo=False):
+        """
+        Registra un callback para un tipo de evento.
+
+        Args:
+            tipo_evento: Subclase de Evento
+            callback: Función que recibe el evento
+            en_hilo: Si True, se entrega en el hilo de trabajo
+        """
+        indice = self._suscriptores_hilo if en_hilo else self._suscriptores
+        indice.setdefault(tipo_evento, []).append(callback)
+
+    def desuscribir(self, tipo_evento, callback):
+        """Quita un callback de un tipo de evento."""
+        for indice in (self._suscriptores, self._suscriptores_hilo):
+            callbacks = indice.get(tipo_evento)
+            if callbacks and callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del indice[tipo_evento]
+
+    def publicar(self, evento):
+        """Agrega un evento al lote del paso actual (si alguien lo escucha)."""
+        tipo = type(evento)
+        if tipo in self._suscriptores or tipo in self._suscriptores_hilo:
+            self._pendientes.append(evento)
+
+    def despachar(self):
+        """Entrega en orden todos los eventos pendientes del paso."""
+        if not self._pendientes:
+            return
+
+        pendientes = self._pendientes
+        self._pendientes = []
+
+        suscriptores = self._suscriptores
+        for evento in pendientes:
+            callbacks = suscriptores.get(type(evento))
+            if callbacks:
+                for callback in callbacks:
+                    callback(evento)
+
+        if self._suscriptores_hilo:
+            # Un solo envío por suscriptor con todos sus eventos del lote, en orden
+            lotes = {}
+            for evento in pendientes:
+                for callback in self._suscriptores_hilo.get(type(evento), ()):
+                    lotes.setdefault(callback, []).append(evento)
+
+            hilo = _HiloEntrega.obtener_instancia()
+            for callback, eventos in lotes.items():
+                hilo.encolar(callback, eventos)
+
+    def esperar_entregas(self):
+        """Espera a que el hilo de trabajo termine las entregas encoladas."""
+        if _HiloEntrega._instancia is not None:
+            _HiloEntrega._instancia.esperar()
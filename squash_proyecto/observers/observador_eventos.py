@@ -1,82 +1,131 @@
 """
 PATRÓN OBSERVER - Sistema de Notificaciones
 ============================================
+Cada observador indica en MANEJADORES qué tipos de evento le interesan
+y qué método los atiende; al suscribirse al bus solo recibe esos.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
+from observers.bus_eventos import EventoGolpe, EventoPelotaPerdida, EventoNivelSubido, EventoGameOver
+from audio.motor_audio import (MotorAudio, SONIDO_GOLPE, SONIDO_PELOTA_PERDIDA,
+                               SONIDO_NIVEL_SUBIDO, SONIDO_GAME_OVER)
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("observer")
 
 class Observador(ABC):
     """
     PATRÓN: OBSERVER - Interface
     """
     
-    @abstractmethod
-    def actualizar(self, evento, datos):
-        pass
+    # Tipo de evento -> nombre del método que lo atiende
+    MANEJADORES = {}
+    
+    # Si True, el bus entrega los eventos en el hilo de trabajo
+    EN_HILO = False
+    
+    def suscribirse(self, bus):
+        """Suscribe los manejadores de este observador al bus de eventos."""
+        for tipo_evento, metodo in self.MANEJADORES.items():
+            bus.suscribir(tipo_evento, getattr(self, metodo), en_hilo=self.EN_HILO)
 
 
 class ObservadorPuntaje(Observador):
     """Observa eventos relacionados con el puntaje."""
     
+    MANEJADORES = {
+        EventoGolpe: "al_golpear",
+        EventoPelotaPerdida: "al_perder_pelota",
+    }
+    
     def __init__(self):
         self.puntaje_total = 0
         self.combo_actual = 0
         self.mejor_combo = 0
         self.golpes_consecutivos = 0
     
-    def actualizar(self, evento, datos):
-        if evento == "golpe_exitoso":
-            self.golpes_consecutivos += 1
-            
-            if datos:
-                self.combo_actual = datos.get("combo", 1)
-                if self.combo_actual > self.mejor_combo:
-                    self.mejor_combo = self.combo_actual
-                
-                if self.golpes_consecutivos >= 10:
-                    print("🎯 [OBSERVER] ¡Combo de 10 golpes consecutivos!")
+    def al_golpear(self, evento):
+        self.golpes_consecutivos += 1
+        
+        self.combo_actual = evento.combo
+        if self.combo_actual > self.mejor_combo:
+            self.mejor_combo = self.combo_actual
         
-        elif evento == "pelota_perdida":
-            self.golpes_consecutivos = 0
-            print("❌ [OBSERVER] Combo roto")
+        if self.golpes_consecutivos >= 10:
+            registro.debug("🎯 [OBSERVER] ¡Combo de 10 golpes consecutivos!")
+    
+    def al_perder_pelota(self, evento):
+        self.golpes_consecutivos = 0
+        registro.debug("❌ [OBSERVER] Combo roto")
 
 
 class ObservadorSonido(Observador):
     """Observa eventos para reproducir sonidos."""
     
-    def actualizar(self, evento, datos):
-        # En una implementación real, aquí se reproducirían sonidos
-        if evento == "golpe_exitoso":
-            print("🔊 [OBSERVER] Sonido: Golpe exitoso")
-        elif evento == "pelota_perdida":
-            print("🔊 [OBSERVER] Sonido: Pelota perdida")
-        elif evento == "nivel_subido":
-            print("🔊 [OBSERVER] Sonido: ¡Nivel subido!")
-        elif evento == "game_over":
-            print("🔊 [OBSERVER] Sonido: Game Over")
+    MANEJADORES = {
+        EventoGolpe: "al_golpear",
+        EventoPelotaPerdida: "al_perder_pelota",
+        EventoNivelSubido: "al_subir_nivel",
+        EventoGameOver: "al_terminar",
+    }
+    
+    # MotorAudio.reproducir() no bloquea: se entrega en el mismo paso,
+    # sin el salto de hilo que retrasaría el sonido
+    EN_HILO = False
+    
+    def __init__(self):
+        self.audio = MotorAudio.obtener_instancia()
+    
+    def al_golpear(self, evento):
+        self.audio.reproducir(SONIDO_GOLPE)
+        registro.debug("🔊 [OBSERVER] Sonido: Golpe exitoso")
+    
+    def al_perder_pelota(self, evento):
+        self.audio.reproducir(SONIDO_PELOTA_PERDIDA)
+        registro.debug("🔊 [OBSERVER] Sonido: Pelota perdida")
+    
+    def al_subir_nivel(self, evento):
+        self.audio.reproducir(SONIDO_NIVEL_SUBIDO)
+        registro.debug("🔊 [OBSERVER] Sonido: ¡Nivel subido!")
+    
+    def al_terminar(self, evento):
+        self.audio.reproducir(SONIDO_GAME_OVER)
+        registro.debug("🔊 [OBSERVER] Sonido: Game Over")
 
 
 class ObservadorEstadisticas(Observador):
     """Recopila estadísticas del juego."""
     
+    MANEJADORES = {
+        EventoGolpe: "al_golpear",
+        EventoPelotaPerdida: "al_perder_pelota",
+        EventoGameOver: "al_terminar",
+    }
+    
+    # Solo cuenta y escribe el resumen en el registro: nada de eso tiene que
+    # pasar dentro del paso. Quien lea los contadores llama antes a
+    # bus.esperar_entregas().
+    EN_HILO = True
+    
     def __init__(self):
         self.golpes_totales = 0
         self.golpes_acertados = 0
         self.golpes_fallados = 0
     
-    def actualizar(self, evento, datos):
-        if evento == "golpe_exitoso":
-            self.golpes_totales += 1
-            self.golpes_acertados += 1
-        elif evento == "pelota_perdida":
-            self.golpes_totales += 1
-            self.golpes_fallados += 1
-        elif evento == "game_over":
-            print(f"📊 [OBSERVER] Estadísticas finales:")
-            print(f"   Golpes totales: {self.golpes_totales}")
-            print(f"   Golpes acertados: {self.golpes_acertados}")
-            print(f"   Golpes fallados: {self.golpes_fallados}")
-            print(f"   Precisión: {self.calcular_precision():.1f}%")
+    def al_golpear(self, evento):
+        self.golpes_totales += 1
+        self.golpes_acertados += 1
+    
+    def al_perder_pelota(self, evento):
+        self.golpes_totales += 1
+        self.golpes_fallados += 1
+    
+    def al_terminar(self, evento):
+        registro.info("📊 [OBSERVER] Estadísticas finales:")
+        registro.info("   Golpes totales: %s", self.golpes_totales)
+        registro.info("   Golpes acertados: %s", self.golpes_acertados)
+        registro.info("   Golpes fallados: %s", self.golpes_fallados)
+        registro.info("   Precisión: %.1f%%", self.calcular_precision())
     
     def calcular_precision(self):
         if self.golpes_totales == 0:
@@ -87,28 +136,32 @@ class ObservadorEstadisticas(Observador):
 class ObservadorLogros(Observador):
     """Maneja el sistema de logros."""
     
+    MANEJADORES = {
+        EventoGolpe: "al_golpear",
+        EventoNivelSubido: "al_subir_nivel",
+    }
+    
     def __init__(self):
         self.logros_desbloqueados = []
     
-    def actualizar(self, evento, datos):
-        if evento == "golpe_exitoso" and datos:
-            combo = datos.get("combo", 0)
-            
-            if combo >= 5 and "combo_5" not in self.logros_desbloqueados:
-                self.logros_desbloqueados.append("combo_5")
-                print("🏆 [OBSERVER] Logro desbloqueado: Combo x5")
-            
-            if combo >= 10 and "combo_10" not in self.logros_desbloqueados:
-                self.logros_desbloqueados.append("combo_10")
-                print("🏆 [OBSERVER] Logro desbloqueado: Combo x10")
+    def al_golpear(self, evento):
+        combo = evento.combo
+        
+        if combo >= 5 and "combo_5" not in self.logros_desbloqueados:
+            self.logros_desbloqueados.append("combo_5")
+            registro.info("🏆 [OBSERVER] Logro desbloqueado: Combo x5")
+        
+        if combo >= 10 and "combo_10" not in self.logros_desbloqueados:
+            self.logros_desbloqueados.append("combo_10")
+            registro.info("🏆 [OBSERVER] Logro desbloqueado: Combo x10")
+    
+    def al_subir_nivel(self, evento):
+        nivel = evento.nivel
+        
+        if nivel >= 3 and "nivel_3" not in self.logros_desbloqueados:
+            self.logros_desbloqueados.append("nivel_3")
+            registro.info("🏆 [OBSERVER] Logro desbloqueado: Nivel 3 alcanzado")
         
-        elif evento == "nivel_subido" and datos:
-            nivel = datos.get("nivel", 0)
-            
-            if nivel >= 3 and "nivel_3" not in self.logros_desbloqueados:
-                self.logros_desbloqueados.append("nivel_3")
-                print("🏆 [OBSERVER] Logro desbloqueado: Nivel 3 alcanzado")
-            
-            if nivel >= 5 and "nivel_5" not in self.logros_desbloqueados:
-                self.logros_desbloqueados.append("nivel_5")
-                print("🏆 [OBSERVER] Logro desbloqueado: Nivel 5 alcanzado")
\ No newline at end of file
+        if nivel >= 5 and "nivel_5" not in self.logros_desbloqueados:
+            self.logros_desbloqueados.append("nivel_5")
+            registro.info("🏆 [OBSERVER] Logro desbloqueado: Nivel 5 alcanzado")
\ No newline at end of file
@@ -0,0 +1,202 @@
+# pylint: disable=all
+"""
+Gestor de Recursos
+==================
+Fuentes, imágenes y sonidos cargados una sola vez por proceso y
+compartidos por clave (ruta, tamaño). Antes cada estado creaba sus
+propias fuentes, así que cada "Jugar de nuevo" o vuelta al menú volvía a
+leer y parsear el archivo de la fuente, y CacheTexto (que usa la fuente
+como parte de la clave) no podía reutilizar nada de la pantalla anterior.
+
+Cada recurso lleva una cuenta de referencias: liberar() la decrementa y
+purgar() descarta los que quedaron en cero. Mientras no se purgue, un
+recurso sin referencias sigue en memoria para la próxima transición.
+"""
+
+import threading
+import pygame
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("res")
+
+# Fuentes de las pantallas de juego, pausa y game over, para precargar
+# mientras se ve el menú (las que ya cargó el menú no se leen de nuevo).
+# Entradas: (tipo, ruta, tamaño)
+MANIFIESTO_JUEGO = [
+    ("fuente", None, 36),
+    ("fuente", None, 24),
+    ("fuente", None, 72),
+    ("fuente", None, 40),
+    ("fuente", None, 80),
+]
+
+
+class GestorRecursos:
+    """
+    PATRÓN: SINGLETON
+    -----------------
+    Único dueño de los recursos cargados desde disco. Se puede usar desde
+    un hilo de precarga: las tablas están protegidas por un candado y un
+    recurso nunca se carga dos veces.
+    """
+
+    _instancia = None
+
+    def __new__(cls):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+            cls._instancia._inicializar()
+        return cls._instancia
+
+    @classmethod
+    def obtener_instancia(cls):
+        """Método estático para obtener la instancia Singleton."""
+        if cls._instancia is None:
+            cls()
+        return cls._instancia
+
+    def _inicializar(self):
+        """Tablas vacías."""
+        self._candado = threading.RLock()
+        self._tablas = {"fuente": {}, "imagen": {}, "sonido": {}}  # tipo -> clave -> [recurso, referencias]
+        self._claves = {}   # id(recurso) -> (tipo, clave), para liberar()
+        self.cargas = 0     # Archivos leídos (diagnóstico)
+        self.aciertos = 0
+
+    # -------------------------------------------------------------------------
+    # Obtención
+    # -------------------------------------------------------------------------
+
+    def fuente(self, tamano, ruta=None, referenciar=True):
+        """
+        Fuente compartida; ruta None es la fuente por defecto de pygame.
+
+        Args:
+            tamano: Tamaño en puntos
+            ruta: Archivo .ttf/.otf
+            referenciar: Contar una referencia (False solo para precargar)
+        """
+        return self._obtener("fuente", (ruta, tamano),
+                             lambda: pygame.font.Font(ruta, tamano), referenciar)
+
+    def imagen(self, ruta, alfa=True, referenciar=True):
+        """
+        Imagen compartida, convertida al formato de la pantalla si ya
+        hay una ventana abierta.
+
+        Args:
+            ruta: Archivo de imagen
+            alfa: Conservar el canal alfa (convert_alpha en vez de convert)
+        """
+        def cargar():
+            superficie = pygame.image.load(ruta)
+            if pygame.display.get_surface() is not None:
+                superficie = superficie.convert_alpha() if alfa else superficie.convert()
+            return superficie
+        return self._obtener("imagen", (ruta, alfa), cargar, referenciar)
+
+    def sonido(self, ruta, referenciar=True):
+        """
+        Sonido compartido.
+
+        Returns:
+            pygame.mixer.Sound, o None si el mezclador no está iniciado
+        """
+        if not pygame.mixer.get_init():
+            registro.warning("⚠️ [RECURSOS] Mezclador apagado, no se carga %s", ruta)
+            return None
+        return self._obtener("sonido", ruta, lambda: pygame.mixer.Sound(ruta), referenciar)
+
+    def _obtener(self, tipo, clave, cargar, referenciar):
+        """Busca el recurso en la tabla o lo carga la primera vez."""
+        tabla = self._tablas[tipo]
+        with self._candado:
+            entrada = tabla.get(clave)
+            if entrada is None:
+                entrada = [cargar(), 0]
+                tabla[clave] = entrada
+                self._claves[id(entrada[0])] = (tipo, clave)
+                self.cargas += 1
+                registro.debug("📦 [RECURSOS] Cargado %s %s", tipo, clave)
+            else:
+                self.aciertos += 1
+            if referenciar:
+                entrada[1] += 1
+            return entrada[0]
+
+    # -------------------------------------------------------------------------
+    # Referencias
+    # -------------------------------------------------------------------------
+
+    def liberar(self, recurso):
+        """Devuelve una referencia obtenida con fuente(), imagen() o sonido()."""
+        with self._candado:
+            ubicacion = self._claves.get(id(recurso))
+            if ubicacion is None:
+                return
+            tipo, clave = ubicacion
+            entrada = self._tablas[tipo][clave]
+            entrada[1] = max(entrada[1] - 1, 0)
+
+    def referencias(self, recurso):
+        """Referencias vivas de un recurso (0 si no es de este gestor)."""
+        with self._candado:
+            ubicacion = self._claves.get(id(recurso))
+            if ubicacion is None:
+                return 0
+            tipo, clave = ubicacion
+            return self._tablas[tipo][clave][1]
+
+    def purgar(self):
+        """
+        Descarta los recursos sin referencias.
+
+        Returns:
+            Cantidad de recursos descartados
+        """
+        descartados = 0
+        with self._candado:
+            for tabla in self._tablas.values():
+                for clave in [clave for clave, entrada in tabla.items() if entrada[1] == 0]:
+                    del self._claves[id(tabla.pop(clave)[0])]
+                    descartados += 1
+        if descartados:
+            registro.info("🧹 [RECURSOS] %s recursos sin uso descartados", descartados)
+        return descartados
+
+    # -------------------------------------------------------------------------
+    # Precarga
+    # -------------------------------------------------------------------------
+
+    def precargar(self, manifiesto):
+        """
+        Carga las entradas (tipo, ruta, tamaño) sin tomar referencias.
+        Una entrada que falla se registra y no detiene al resto.
+        """
+        for tipo, ruta, tamano in manifiesto:
+            try:
+                if tipo == "fuente":
+                    self.fuente(tamano, ruta, referenciar=False)
+                elif tipo == "imagen":
+                    self.imagen(ruta, referenciar=False)
+                elif tipo == "sonido":
+                    self.sonido(ruta, referenciar=False)
+                else:
+                    registro.warning("⚠️ [RECURSOS] Tipo desconocido en el manifiesto: %s", tipo)
+            except (pygame.error, OSError) as error:
+                registro.warning("⚠️ [RECURSOS] No se pudo precargar %s %s: %s", tipo, ruta, error)
+
+    def precargar_en_segundo_plano(self, manifiesto):
+        """
+        precargar() en un hilo (p. ej. mientras se ve el menú).
+
+        Returns:
+            threading.Thread ya iniciado
+        """
+        hilo = threading.Thread(target=self.precargar, args=(manifiesto,),
+                                name="precarga", daemon=True)
+        hilo.start()
+        return hilo
+
+    def __len__(self):
+        return sum(len(tabla) for tabla in self._tablas.values())
@@ -0,0 +1,75 @@
+# pylint: disable=all
+"""
+Caché de Texto Renderizado
+==========================
+Font.render es lo más caro de cada frame en hardware modesto. Esta caché
+guarda las superficies ya rasterizadas y las reutiliza mientras el texto,
+la fuente, el color y el antialias no cambien.
+"""
+
+from collections import OrderedDict
+import pygame
+
+
+class CacheTexto:
+    """
+    PATRÓN: SINGLETON
+    -----------------
+    Caché LRU compartida de superficies de texto, con clave
+    (fuente, texto, color, antialias). Cuando se llena descarta
+    la entrada usada hace más tiempo.
+    """
+
+    _instancia = None
+
+    def __new__(cls, capacidad=512):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+            cls._instancia._inicializar(capacidad)
+        return cls._instancia
+
+    @classmethod
+    def obtener_instancia(cls):
+        """Método estático para obtener la instancia Singleton."""
+        if cls._instancia is None:
+            cls()
+        return cls._instancia
+
+    def _inicializar(self, capacidad):
+        """Inicializa la caché vacía."""
+        self.capacidad = capacidad
+        self._superficies = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def render(self, fuente, texto, antialias, color):
+        """
+        Igual que fuente.render(texto, antialias, color), pero reutiliza
+        la superficie si ya se rasterizó antes.
+        """
+        clave = (fuente, texto, tuple(color), antialias)
+        superficie = self._superficies.get(clave)
+
+        if superficie is not None:
+            self._superficies.move_to_end(clave)
+            self.aciertos += 1
+            return superficie
+
+        self.fallos += 1
+        superficie = fuente.render(texto, antialias, color)
+
+        # Convertir al formato de la pantalla para que el blit sea directo
+        if pygame.display.get_surface() is not None:
+            superficie = superficie.convert_alpha()
+
+        self._superficies[clave] = superficie
+        if len(self._superficies) > self.capacidad:
+            self._superficies.popitem(last=False)
+        return superficie
+
+    def limpiar(self):
+        """Vacía la caché."""
+        self._superficies.clear()
+
+    def __len__(self):
+        return len(self._superficies)
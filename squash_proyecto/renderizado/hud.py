@@ -0,0 +1,96 @@
+# pylint: disable=all
+"""
+Elementos del HUD
+=================
+Campos de texto que solo se vuelven a rasterizar cuando su valor cambia,
+y paneles de texto estático compuestos una sola vez.
+"""
+
+import pygame
+
+
+class CampoHUD:
+    """
+    Campo de texto del HUD con "dirty flag".
+    Guarda el último valor mostrado y solo llama a Font.render
+    cuando el valor o el color cambian.
+    """
+
+    def __init__(self, fuente, plantilla, posicion, color=(255, 255, 255)):
+        """
+        Args:
+            fuente: pygame.font.Font a usar
+            plantilla: Texto con un '{}' donde va el valor (p. ej. "Nivel: {}")
+            posicion: Esquina superior izquierda (x, y)
+            color: Color inicial del texto
+        """
+        self.fuente = fuente
+        self.plantilla = plantilla
+        self.posicion = posicion
+        self.color = color
+        self.valor = None
+        self.superficie = None
+        self.visible = True
+
+    def actualizar(self, valor, color=None):
+        """
+        Actualiza el valor del campo.
+
+        Returns:
+            True si hubo que volver a rasterizar el texto
+        """
+        if color is None:
+            color = self.color
+
+        if valor == self.valor and color == self.color and self.superficie is not None:
+            return False
+
+        self.valor = valor
+        self.color = color
+        superficie = self.fuente.render(self.plantilla.format(valor), True, color)
+        if pygame.display.get_surface() is not None:
+            superficie = superficie.convert_alpha()
+        self.superficie = superficie
+        return True
+
+    def obtener_rect(self):
+        """Rectángulo que ocupa el campo en pantalla."""
+        if self.superficie is None:
+            return pygame.Rect(self.posicion, (0, 0))
+        return self.superficie.get_rect(topleft=self.posicion)
+
+    def dibujar(self, lienzo):
+        """
+        Dibuja el último texto rasterizado en el lienzo.
+        
+        Returns:
+            Rectángulo ocupado, o None si el campo está oculto
+        """
+        if self.visible and self.superficie is not None:
+            return lienzo.blit(self.superficie, self.posicion)
+        return None
+
+
+def componer_panel(fuente, lineas, espaciado):
+    """
+    Compone una lista de líneas de texto estático en una sola superficie.
+
+    Args:
+        fuente: pygame.font.Font a usar
+        lineas: Lista de tuplas (texto, color)
+        espaciado: Distancia vertical entre líneas
+
+    Returns:
+        Superficie con transparencia, convertida al formato de la pantalla
+    """
+    textos = [fuente.render(texto, True, color) for texto, color in lineas]
+    ancho = max(texto.get_width() for texto in textos)
+    alto = espaciado * (len(textos) - 1) + textos[-1].get_height()
+
+    panel = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+    for i, texto in enumerate(textos):
+        panel.blit(texto, (0, i * espaciado))
+
+    if pygame.display.get_surface() is not None:
+        panel = panel.convert_alpha()
+    return panel
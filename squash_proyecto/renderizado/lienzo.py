@@ -0,0 +1,245 @@
+# pylint: disable=all
+"""
+Lienzos: Backends de Renderizado
+================================
+Todos los dibujar() reciben un Lienzo en lugar de la superficie de
+pygame.display. La interfaz usa los mismos nombres y firmas que
+pygame.Surface (blit, blits, fill, get_size, get_rect, copy), así que el
+código de dibujo es el mismo con cualquier backend:
+
+    LienzoSuperficie  Superficie de pygame (SDL por software), con el
+                      escalado de la Vista y display.flip/update
+    LienzoTexturas    pygame._sdl2.video.Renderer: cada superficie que se
+                      dibuja (sprites, textos del HUD, paneles, fondos) se
+                      sube una sola vez a una Texture y se dibuja con
+                      copias que SDL agrupa y escala en la GPU
+
+LienzoTexturas dibuja sobre una textura de la resolución interna que se
+conserva entre frames (los rectángulos sucios y la pausa siguen
+funcionando) y al presentar se copia escalada a la ventana. Sin GPU se
+prueba con el renderer por software de SDL:
+
+    SDL_RENDER_DRIVER=software python -m squash_proyecto
+
+Las superficies dibujadas se tratan como inmutables: la textura se crea
+la primera vez y vive mientras viva la superficie. Si se modifica una ya
+dibujada hay que llamar a invalidar(superficie).
+"""
+
+import weakref
+from abc import ABC, abstractmethod
+import pygame
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("video")
+
+
+class Lienzo(ABC):
+    """
+    Interfaz de los backends de renderizado (subconjunto de pygame.Surface
+    que usan los dibujar(), más presentar()).
+    """
+
+    @abstractmethod
+    def blit(self, imagen, destino, area=None):
+        """
+        Dibuja una superficie.
+
+        Args:
+            imagen: pygame.Surface a dibujar
+            destino: Esquina superior izquierda (x, y) o pygame.Rect
+            area: Parte de la imagen a copiar (None = toda)
+
+        Returns:
+            pygame.Rect ocupado en el lienzo
+        """
+        pass
+
+    @abstractmethod
+    def blits(self, secuencia, doreturn=True):
+        """Varios blit() de pares (imagen, destino)."""
+        pass
+
+    @abstractmethod
+    def fill(self, color, rect=None):
+        """Pinta un color sólido en todo el lienzo o en rect."""
+        pass
+
+    @abstractmethod
+    def get_size(self):
+        """Tamaño del framebuffer (resolución interna)."""
+        pass
+
+    def get_rect(self, **kwargs):
+        """Rectángulo del lienzo, con los mismos argumentos que Surface.get_rect."""
+        rect = pygame.Rect((0, 0), self.get_size())
+        for nombre, valor in kwargs.items():
+            setattr(rect, nombre, valor)
+        return rect
+
+    @abstractmethod
+    def copy(self):
+        """Copia del frame actual como pygame.Surface (p. ej. para la pausa)."""
+        pass
+
+    @abstractmethod
+    def presentar(self, rects=None):
+        """
+        Lleva el frame a la ventana.
+
+        Args:
+            rects: Rectángulos que cambiaron, o None para toda la pantalla
+        """
+        pass
+
+
+# =============================================================================
+# BACKEND: SUPERFICIE DE PYGAME
+# =============================================================================
+
+class LienzoSuperficie(Lienzo):
+    """
+    El camino de siempre: se dibuja en una pygame.Surface. Si es la de la
+    ventana se presenta con display.flip/update; si es un framebuffer
+    aparte, se escala a la ventana con transform.scale.
+    """
+
+    def __init__(self, superficie, ventana=None):
+        """
+        Args:
+            superficie: Framebuffer donde se dibuja
+            ventana: Superficie de pygame.display (None = la misma)
+        """
+        self.superficie = superficie
+        self.ventana = superficie if ventana is None else ventana
+
+    def blit(self, imagen, destino, area=None):
+        return self.superficie.blit(imagen, destino, area)
+
+    def blits(self, secuencia, doreturn=True):
+        return self.superficie.blits(secuencia, doreturn)
+
+    def fill(self, color, rect=None):
+        return self.superficie.fill(color, rect)
+
+    def get_size(self):
+        return self.superficie.get_size()
+
+    def get_rect(self, **kwargs):
+        return self.superficie.get_rect(**kwargs)
+
+    def copy(self):
+        return self.superficie.copy()
+
+    def presentar(self, rects=None):
+        """Con escalado por software siempre se escala y presenta todo."""
+        if self.superficie is not self.ventana:
+            pygame.transform.scale(self.superficie, self.ventana.get_size(), self.ventana)
+            pygame.display.flip()
+        elif rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+
+# =============================================================================
+# BACKEND: RENDERER Y TEXTURAS DE SDL2
+# =============================================================================
+
+class LienzoTexturas(Lienzo):
+    """
+    Dibuja con pygame._sdl2.video.Renderer sobre una textura de destino
+    del tamaño del framebuffer. No usa pygame.display.set_mode: la ventana
+    es una pygame._sdl2.video.Window y pygame.display.get_surface() queda
+    en None (nada se convierte al formato de una pantalla).
+    """
+
+    def __init__(self, resolucion, tamano_ventana, titulo="", vsync=False):
+        """
+        Args:
+            resolucion: Tamaño del framebuffer (ancho, alto)
+            tamano_ventana: Tamaño de la ventana
+            titulo: Título de la ventana
+            vsync: Presentar sincronizado con el monitor (si se puede)
+        """
+        from pygame._sdl2.video import Window, Renderer, Texture
+        self._Texture = Texture
+
+        self.ventana = Window(titulo, size=tamano_ventana)
+        self.vsync = vsync
+        try:
+            self.renderer = Renderer(self.ventana, vsync=vsync, target_texture=True)
+        except pygame.error as error:
+            if not vsync:
+                raise
+            registro.warning("⚠️ [VIDEO] Sin vsync: %s", error)
+            self.vsync = False
+            self.renderer = Renderer(self.ventana, target_texture=True)
+
+        self.tamano = tuple(resolucion)
+        self.rect = pygame.Rect((0, 0), self.tamano)
+        self.framebuffer = Texture(self.renderer, self.tamano, target=True)
+        self.renderer.target = self.framebuffer
+
+        # superficie -> Texture; la textura se libera con la superficie
+        self._texturas = weakref.WeakKeyDictionary()
+        self.subidas = 0    # Texturas creadas (diagnóstico)
+
+    def textura(self, imagen):
+        """Textura de una superficie, subida la primera vez que se dibuja."""
+        textura = self._texturas.get(imagen)
+        if textura is None:
+            textura = self._Texture.from_surface(self.renderer, imagen)
+            self._texturas[imagen] = textura
+            self.subidas += 1
+        return textura
+
+    def invalidar(self, superficie=None):
+        """Descarta la textura de una superficie modificada (o todas)."""
+        if superficie is None:
+            self._texturas.clear()
+        else:
+            self._texturas.pop(superficie, None)
+
+    def blit(self, imagen, destino, area=None):
+        x, y = destino[0], destino[1]
+        if area is None:
+            rect = pygame.Rect(x, y, imagen.get_width(), imagen.get_height())
+            self.textura(imagen).draw(None, rect)
+        else:
+            area = pygame.Rect(area)
+            rect = pygame.Rect(x, y, area.width, area.height)
+            self.textura(imagen).draw(area, rect)
+        return rect.clip(self.rect)
+
+    def blits(self, secuencia, doreturn=True):
+        if doreturn:
+            return [self.blit(imagen, destino) for imagen, destino in secuencia]
+        textura = self.textura
+        for imagen, (x, y) in secuencia:
+            textura(imagen).draw(None, (x, y, imagen.get_width(), imagen.get_height()))
+        return None
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+            return self.rect.copy()
+        rect = pygame.Rect(rect).clip(self.rect)
+        self.renderer.fill_rect(rect)
+        return rect
+
+    def get_size(self):
+        return self.tamano
+
+    def copy(self):
+        """Lee el framebuffer de vuelta a memoria (lento; solo para la pausa)."""
+        return self.renderer.to_surface()
+
+    def presentar(self, rects=None):
+        """Copia el framebuffer escalado a toda la ventana (siempre completo)."""
+        renderer = self.renderer
+        renderer.target = None
+        self.framebuffer.draw()
+        renderer.present()
+        renderer.target = self.framebuffer
@@ -0,0 +1,123 @@
+# pylint: disable=all
+"""
+Overlay del Perfilador (F3)
+===========================
+Tabla con p50/p95/p99/max por fase y una línea de tiempos de frame
+(sparkline) con el presupuesto de 1/fps marcado. El panel se compone de
+nuevo cada intervalo_perfilador_ms y en los frames intermedios solo se
+copia, así que el overlay casi no pesa en lo que mide.
+"""
+
+import pygame
+from config.configuracion import ConfiguracionJuego
+from recursos.gestor_recursos import GestorRecursos
+from renderizado.vista import Vista
+from sistema.perfilador import FILAS
+
+# Frames en la línea de tiempos y píxeles por frame
+FRAMES_SPARKLINE = 150
+PASO_SPARKLINE = 3
+
+COLOR_FONDO = (0, 0, 0, 200)
+COLOR_TEXTO = (220, 220, 220)
+COLOR_TITULO = (100, 200, 255)
+COLOR_ALERTA = (255, 200, 0)
+COLOR_EXCEDIDO = (255, 70, 70)
+COLOR_LINEA = (0, 255, 120)
+
+
+class OverlayPerfilador:
+    """Panel semitransparente con las estadísticas de un PerfiladorFrames."""
+
+    COLUMNAS = ("p50", "p95", "p99", "max")
+
+    def __init__(self, perfilador, posicion=(260, 10)):
+        """
+        Args:
+            perfilador: PerfiladorFrames a mostrar
+            posicion: Esquina superior izquierda del panel (en la cancha;
+                      el panel en sí no se escala, para que siga legible)
+        """
+        config = ConfiguracionJuego.obtener_instancia()
+        self.perfilador = perfilador
+        self.posicion = Vista.obtener_instancia().punto(*posicion)
+        self.presupuesto_ms = 1000.0 / (config.fps or config.tasa_simulacion)
+        self.intervalo_ms = config.intervalo_perfilador_ms
+        self.fuente = GestorRecursos.obtener_instancia().fuente(20)
+        self.alto_linea = 17
+        self.alto_sparkline = 50
+        self.ancho = max(FRAMES_SPARKLINE * PASO_SPARKLINE, 360) + 20
+        self.alto = self.alto_linea * (len(FILAS) + 2) + self.alto_sparkline + 20
+        self.panel = None
+        self.ultimo_refresco = -self.intervalo_ms
+
+    def dibujar(self, lienzo):
+        """
+        Dibuja el panel en el lienzo (recompuesto si venció el intervalo).
+
+        Returns:
+            Rectángulo ocupado en la superficie
+        """
+        ahora = pygame.time.get_ticks()
+        if self.panel is None or ahora - self.ultimo_refresco >= self.intervalo_ms:
+            self.panel = self.componer()
+            self.ultimo_refresco = ahora
+        return lienzo.blit(self.panel, self.posicion)
+
+    def invalidar(self):
+        """Fuerza a recomponer el panel en el próximo dibujo."""
+        self.panel = None
+
+    def _color(self, p99):
+        """Color de una fila según cuánto del presupuesto del frame consume."""
+        if p99 > self.presupuesto_ms:
+            return COLOR_EXCEDIDO
+        if p99 > self.presupuesto_ms / 2:
+            return COLOR_ALERTA
+        return COLOR_TEXTO
+
+    def componer(self):
+        """Compone el panel con los datos actuales del perfilador."""
+        panel = pygame.Surface((self.ancho, self.alto), pygame.SRCALPHA)
+        panel.fill(COLOR_FONDO)
+
+        estadisticas = self.perfilador.estadisticas()
+        titulo = (f"F3 PERFILADOR  {self.perfilador.cantidad} frames  "
+                  f"presupuesto {self.presupuesto_ms:.1f} ms")
+        panel.blit(self.fuente.render(titulo, True, COLOR_TITULO), (10, 6))
+
+        # Tabla: una fila por fase, columnas en ms
+        x_columnas = [10, 130, 200, 270, 340]
+        y = 6 + self.alto_linea
+        for x, texto in zip(x_columnas, ("fase (ms)",) + self.COLUMNAS):
+            panel.blit(self.fuente.render(texto, True, COLOR_TITULO), (x, y))
+        for fila in FILAS:
+            y += self.alto_linea
+            valores = estadisticas.get(fila)
+            color = COLOR_TEXTO if valores is None else self._color(valores[2])
+            panel.blit(self.fuente.render(fila, True, color), (x_columnas[0], y))
+            if valores is None:
+                continue
+            for x, valor in zip(x_columnas[1:], valores):
+                panel.blit(self.fuente.render(f"{valor:6.2f}", True, color), (x, y))
+
+        self._dibujar_sparkline(panel, y + self.alto_linea + 8)
+
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        return panel
+
+    def _dibujar_sparkline(self, panel, y):
+        """Duración de los últimos frames, con la línea del presupuesto."""
+        frames = self.perfilador.ultimos_frames(FRAMES_SPARKLINE)
+        alto = self.alto_sparkline
+        escala = max(2 * self.presupuesto_ms, float(frames.max()) if len(frames) else 0.0)
+        base = y + alto
+
+        y_presupuesto = base - alto * self.presupuesto_ms / escala
+        pygame.draw.line(panel, COLOR_EXCEDIDO, (10, y_presupuesto), (self.ancho - 10, y_presupuesto))
+        if len(frames) < 2:
+            return
+
+        puntos = [(10 + i * PASO_SPARKLINE, base - alto * ms / escala) for i, ms in enumerate(frames)]
+        pygame.draw.lines(panel, COLOR_LINEA, False, puntos)
@@ -0,0 +1,66 @@
+# pylint: disable=all
+"""
+Renderizado por Rectángulos Sucios
+==================================
+En lugar de repintar toda la pantalla y hacer display.flip(), solo se
+restauran desde un fondo en caché las zonas donde había algo en el frame
+anterior y solo se envían a la pantalla las zonas que cambiaron.
+"""
+
+
+class RenderizadorRectsSucios:
+    """
+    Lleva la cuenta de los rectángulos dibujados en cada frame.
+
+    Uso por frame:
+        renderizador.preparar()             # Borra lo del frame anterior
+        rects = [entidad.dibujar(pantalla) for entidad in ...]
+        sucios = renderizador.presentar(rects)
+        # sucios es None si hay que actualizar la pantalla completa
+    """
+
+    def __init__(self, pantalla, fondo):
+        """
+        Args:
+            pantalla: Lienzo donde se dibuja (renderizado.lienzo)
+            fondo: Superficie del mismo tamaño con todo lo estático
+        """
+        self.pantalla = pantalla
+        self.fondo = fondo
+        self.rects_anteriores = []
+        self.invalidado = True
+
+    def invalidar(self):
+        """Fuerza un repintado completo en el próximo frame."""
+        self.invalidado = True
+
+    def preparar(self):
+        """Restaura el fondo donde se dibujó algo en el frame anterior."""
+        if self.invalidado:
+            self.pantalla.blit(self.fondo, (0, 0))
+            return
+
+        blit = self.pantalla.blit
+        fondo = self.fondo
+        for rect in self.rects_anteriores:
+            blit(fondo, rect, rect)
+
+    def presentar(self, rects_actuales):
+        """
+        Registra lo dibujado en este frame.
+
+        Args:
+            rects_actuales: Rectángulos que ocupa cada elemento dibujado
+
+        Returns:
+            Lista de rectángulos a pasar a pygame.display.update(), o None
+            si hay que actualizar la pantalla completa
+        """
+        anteriores = self.rects_anteriores
+        self.rects_anteriores = rects_actuales
+
+        if self.invalidado:
+            self.invalidado = False
+            return None
+
+        return anteriores + rects_actuales
@@ -0,0 +1,147 @@
+# pylint: disable=all
+"""
+Sprites Pre-renderizados
+========================
+Pelotas y raquetas rasterizadas una sola vez por color y tamaño, en el
+formato de la pantalla, para dibujarlas con blit en lugar de volver a
+rasterizar pygame.draw.circle / pygame.draw.rect en cada frame.
+
+Sin suavizado el resultado es idéntico píxel a píxel a las primitivas y
+la transparencia de las pelotas es un color clave con RLEACCEL, que es
+el blit más barato de SDL (más que rasterizar el círculo). Con
+ConfiguracionJuego.calidad_efectos "alta" las pelotas se dibujan a
+SUPERMUESTREO veces su tamaño y se reducen con smoothscale (borde
+antialiasado, alfa por píxel); ese costo se paga una vez, no por frame.
+
+Las claves de la caché son tamaños de la cancha; el sprite se rasteriza
+ya escalado a la resolución interna de la Vista.
+"""
+
+import pygame
+from config.configuracion import ConfiguracionJuego
+from renderizado.vista import Vista
+
+# Factor de supermuestreo de los sprites suavizados
+SUPERMUESTREO = 4
+
+# Color de fondo transparente de los sprites sin suavizado
+COLOR_CLAVE = (0, 0, 0)
+
+# Borde del modo Escudo (mismo que el contorno que se dibujaba antes)
+COLOR_ESCUDO = (255, 255, 255)
+BORDE_ESCUDO = 2
+
+
+def _convertir(sprite, alfa):
+    """Pasa el sprite al formato de la pantalla (si hay una abierta)."""
+    if pygame.display.get_surface() is None:
+        return sprite
+    return sprite.convert_alpha() if alfa else sprite.convert()
+
+
+def crear_sprite_pelota(color, radio, suavizado=False):
+    """
+    Círculo de 2·radio de lado con fondo transparente. Se dibuja en
+    (x - radio, y - radio) para ocupar lo mismo que draw.circle en (x, y).
+    """
+    lado = 2 * radio
+    if suavizado:
+        grande = pygame.Surface((lado * SUPERMUESTREO, lado * SUPERMUESTREO), pygame.SRCALPHA)
+        pygame.draw.circle(grande, color, (radio * SUPERMUESTREO, radio * SUPERMUESTREO),
+                           radio * SUPERMUESTREO)
+        sprite = pygame.transform.smoothscale(grande, (lado, lado))
+        return _convertir(sprite, alfa=True)
+
+    clave = COLOR_CLAVE if tuple(color) != COLOR_CLAVE else (255, 255, 255)
+    sprite = pygame.Surface((lado, lado))
+    sprite.fill(clave)
+    pygame.draw.circle(sprite, color, (radio, radio), radio)
+    sprite.set_colorkey(clave, pygame.RLEACCEL)
+    return _convertir(sprite, alfa=False)
+
+
+def crear_sprite_raqueta(color, ancho, alto, escudo=False):
+    """
+    Rectángulo opaco de la raqueta; con escudo incluye el borde blanco y
+    se dibuja BORDE_ESCUDO píxeles más arriba y a la izquierda.
+    """
+    if escudo:
+        sprite = pygame.Surface((ancho + 2 * BORDE_ESCUDO, alto + 2 * BORDE_ESCUDO))
+        sprite.fill(COLOR_ESCUDO)
+        sprite.fill(color, (BORDE_ESCUDO, BORDE_ESCUDO, ancho, alto))
+    else:
+        sprite = pygame.Surface((ancho, alto))
+        sprite.fill(color)
+    return _convertir(sprite, alfa=False)
+
+
+class CacheSprites:
+    """
+    PATRÓN: SINGLETON
+    -----------------
+    Sprites compartidos por todas las pelotas y raquetas, con clave
+    (color, tamaño). Un cambio de ancho de un modo genera un sprite nuevo
+    la primera vez; los demás siguen sirviendo.
+    """
+
+    _instancia = None
+
+    def __new__(cls):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+            cls._instancia._inicializar()
+        return cls._instancia
+
+    @classmethod
+    def obtener_instancia(cls):
+        """Método estático para obtener la instancia Singleton."""
+        if cls._instancia is None:
+            cls()
+        return cls._instancia
+
+    def _inicializar(self):
+        """Caché vacía."""
+        self.suavizado = ConfiguracionJuego.obtener_instancia().calidad_efectos == "alta"
+        self.vista = Vista.obtener_instancia()
+        self._pelotas = {}
+        self._raquetas = {}
+        self.creados = 0
+
+    def pelota(self, color, radio):
+        """Sprite de una pelota de ese color y radio."""
+        clave = (color, radio)
+        sprite = self._pelotas.get(clave)
+        if sprite is None:
+            sprite = crear_sprite_pelota(color, self.vista.px(radio), self.suavizado)
+            self._pelotas[clave] = sprite
+            self.creados += 1
+        return sprite
+
+    def raqueta(self, color, ancho, alto, escudo=False):
+        """Sprite de una raqueta de ese color y tamaño."""
+        clave = (color, ancho, alto, escudo)
+        sprite = self._raquetas.get(clave)
+        if sprite is None:
+            sprite = crear_sprite_raqueta(color, self.vista.px(ancho), self.vista.px(alto), escudo)
+            self._raquetas[clave] = sprite
+            self.creados += 1
+        return sprite
+
+    def precargar(self, colores_pelota, radio, modos_raqueta, alto_raqueta):
+        """
+        Crea de antemano los sprites de cada tipo de pelota
+        (FabricaPelotas.COLORES) y de cada modo de Raqueta.modos.
+        """
+        for color in colores_pelota:
+            self.pelota(color, radio)
+        for nombre, modo in modos_raqueta.items():
+            self.raqueta(modo["color"], modo["ancho"], alto_raqueta, nombre == "Escudo")
+
+    def invalidar(self):
+        """Descarta todos los sprites (p. ej. si cambia el formato o la resolución de la pantalla)."""
+        self.suavizado = ConfiguracionJuego.obtener_instancia().calidad_efectos == "alta"
+        self._pelotas.clear()
+        self._raquetas.clear()
+
+    def __len__(self):
+        return len(self._pelotas) + len(self._raquetas)
@@ -0,0 +1,179 @@
+# pylint: disable=all
+"""
+Vista: Framebuffer Interno y Escalado
+=====================================
+La lógica del juego (física, IA, repeticiones) trabaja siempre en
+coordenadas de la cancha, ANCHO_CANCHA x ALTO_CANCHA, sin importar la
+ventana. Todo se dibuja en un framebuffer interno de tamaño configurable
+(la cancha por ConfiguracionJuego.escala_render, p. ej. 0.5 en máquinas
+débiles) y al presentar se escala a la ventana:
+
+    escalado "sdl"       pygame.SCALED: el renderer de SDL escala al
+                         presentar (acelerado si hay GPU) y traduce la
+                         posición del mouse al framebuffer
+    escalado "software"  pygame.transform.scale del framebuffer a la
+                         ventana en cada frame
+
+Con ConfiguracionJuego.backend_render = "texturas" el framebuffer es una
+textura de un Renderer de SDL y el escalado lo hace el renderer
+(renderizado.lienzo.LienzoTexturas); "escalado" no se usa.
+
+Los dibujar() pasan las coordenadas de la cancha por px()/punto()/rect()
+y los tamaños de fuente por tamano_fuente(). Con escala 1 (el caso por
+defecto) todo queda exactamente igual que antes, píxel a píxel.
+"""
+
+import pygame
+from config.configuracion import (ConfiguracionJuego, ANCHO_CANCHA, ALTO_CANCHA,
+                                  ESCALADOS, BACKENDS_RENDER)
+from renderizado.lienzo import LienzoSuperficie, LienzoTexturas
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("video")
+
+
+class Vista:
+    """
+    PATRÓN: SINGLETON
+    -----------------
+    Dueña de la ventana y del framebuffer. Mientras no se abra una ventana
+    (simulación headless, pruebas) la escala es 1.
+    """
+
+    _instancia = None
+
+    def __new__(cls):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+            cls._instancia._inicializar()
+        return cls._instancia
+
+    @classmethod
+    def obtener_instancia(cls):
+        """Método estático para obtener la instancia Singleton."""
+        if cls._instancia is None:
+            cls()
+        return cls._instancia
+
+    def _inicializar(self):
+        """Sin ventana: framebuffer del tamaño de la cancha."""
+        self.lienzo = None
+        self.escalado = "sdl"
+        self.vsync = False
+        self._fijar_escala((ANCHO_CANCHA, ALTO_CANCHA), (ANCHO_CANCHA, ALTO_CANCHA))
+
+    def _fijar_escala(self, interna, ventana):
+        """Factores cancha -> framebuffer y ventana -> cancha."""
+        self.resolucion = tuple(interna)
+        self.escala = min(interna[0] / ANCHO_CANCHA, interna[1] / ALTO_CANCHA)
+        self.escala_ventana = min(ventana[0] / ANCHO_CANCHA, ventana[1] / ALTO_CANCHA)
+
+    # -------------------------------------------------------------------------
+    # Ventana
+    # -------------------------------------------------------------------------
+
+    def abrir_ventana(self, config=None, titulo=""):
+        """
+        Abre la ventana según la configuración de video.
+
+        Returns:
+            Lienzo donde dibujan los estados
+        """
+        if config is None:
+            config = ConfiguracionJuego.obtener_instancia()
+        interna = (round(ANCHO_CANCHA * config.escala_render), round(ALTO_CANCHA * config.escala_render))
+        ventana = tuple(config.tamano_ventana or (ANCHO_CANCHA, ALTO_CANCHA))
+        if config.escalado not in ESCALADOS:
+            raise ValueError(f"Escalado desconocido: {config.escalado} (opciones: {', '.join(ESCALADOS)})")
+        if config.backend_render not in BACKENDS_RENDER:
+            raise ValueError(f"Backend desconocido: {config.backend_render} (opciones: {', '.join(BACKENDS_RENDER)})")
+        self.escalado = config.escalado
+        self.vsync = config.vsync
+
+        if config.backend_render == "texturas":
+            self.escalado = "renderer"
+            self.lienzo = LienzoTexturas(interna, ventana, titulo, self.vsync)
+            self.vsync = self.lienzo.vsync
+            # El mouse llega en píxeles de la ventana
+            self._fijar_escala(interna, ventana)
+        else:
+            if ventana == interna:
+                pantalla = self._set_mode(interna, 0)
+                self.lienzo = LienzoSuperficie(pantalla)
+            elif self.escalado == "sdl":
+                pantalla = self._set_mode(interna, pygame.SCALED)
+                self.lienzo = LienzoSuperficie(pantalla)
+                ventana = self._redimensionar(ventana)
+            else:
+                pantalla = self._set_mode(ventana, 0)
+                self.lienzo = LienzoSuperficie(pygame.Surface(interna).convert(), pantalla)
+            pygame.display.set_caption(titulo)
+            # Con SCALED el mouse ya llega en píxeles del framebuffer
+            self._fijar_escala(interna, interna if self.lienzo.superficie is pantalla else ventana)
+
+        registro.info("🖥️ [VIDEO] %s: framebuffer %sx%s, ventana %sx%s, escalado %s, vsync %s",
+                      config.backend_render, interna[0], interna[1], ventana[0], ventana[1],
+                      self.escalado, "sí" if self.vsync else "no")
+        return self.lienzo
+
+    def _set_mode(self, tamano, banderas):
+        """set_mode con vsync si se pidió; si el driver no lo soporta, sin vsync."""
+        if self.vsync:
+            try:
+                # SDL solo sincroniza con un renderer (SCALED) o con OpenGL
+                return pygame.display.set_mode(tamano, banderas | pygame.SCALED, vsync=1)
+            except pygame.error as error:
+                registro.warning("⚠️ [VIDEO] Sin vsync: %s", error)
+                self.vsync = False
+        return pygame.display.set_mode(tamano, banderas)
+
+    def _redimensionar(self, tamano):
+        """
+        Con SCALED, SDL elige el tamaño de la ventana; se ajusta al pedido.
+
+        Returns:
+            Tamaño final de la ventana
+        """
+        try:
+            from pygame._sdl2.video import Window
+            Window.from_display_module().size = tamano
+        except (ImportError, pygame.error) as error:
+            registro.warning("⚠️ [VIDEO] No se pudo fijar el tamaño de la ventana: %s", error)
+        return pygame.display.get_window_size()
+
+    def presentar(self, rects=None):
+        """
+        Lleva el framebuffer a la ventana (ver Lienzo.presentar).
+
+        Args:
+            rects: Rectángulos que cambiaron, o None para toda la pantalla
+        """
+        self.lienzo.presentar(rects)
+
+    # -------------------------------------------------------------------------
+    # Conversión de coordenadas
+    # -------------------------------------------------------------------------
+
+    def px(self, valor):
+        """Longitud en la cancha -> píxeles del framebuffer."""
+        if self.escala == 1.0:
+            return valor
+        return int(round(valor * self.escala))
+
+    def punto(self, x, y):
+        """Punto de la cancha -> píxeles del framebuffer."""
+        return self.px(x), self.px(y)
+
+    def rect(self, x, y, ancho, alto):
+        """Rectángulo de la cancha -> pygame.Rect en el framebuffer."""
+        return pygame.Rect(self.px(x), self.px(y), self.px(ancho), self.px(alto))
+
+    def tamano_fuente(self, puntos):
+        """Tamaño de fuente pensado para la cancha -> tamaño en el framebuffer."""
+        if self.escala == 1.0:
+            return puntos
+        return max(int(round(puntos * self.escala)), 8)
+
+    def a_cancha(self, x, y):
+        """Posición en la ventana (p. ej. del mouse) -> coordenadas de la cancha."""
+        return x / self.escala_ventana, y / self.escala_ventana
@@ -0,0 +1,219 @@
+# pylint: disable=all
+"""
+Balanceo de Dificultades (Monte Carlo)
+======================================
+Juega muchas partidas headless por cada estrategia de
+GestorDificultad.obtener_estrategias_disponibles(), repartidas en un
+ProcessPoolExecutor que usa todos los núcleos. Los resultados llegan a
+medida que terminan los lotes y al final se reportan las distribuciones
+de puntaje, nivel, duración de la sesión, combo y tipos de pelota.
+
+Las semillas de cada partida se derivan de una semilla raíz, así que
+el mismo comando con la misma --semilla da el mismo reporte.
+
+Uso:
+    python -m squash_proyecto balanceo --juegos 25000
+    python -m squash_proyecto balanceo --dificultades facil normal --juegos 1000 --json reporte.json
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from entidades.fabrica_pelotas import FabricaPelotas
+from estrategias.difficultad import GestorDificultad
+from simulacion.ejecutor import ejecutar_partida, CONTROLADORES
+from simulacion.semillas import nueva_semilla, derivar_semilla
+from sistema.registro import configurar_registro, configurar_registro_proceso_hijo
+
+# Columnas de cada resultado: puntaje, nivel, pasos, mejor combo, pelotas por tipo...
+COLUMNAS = ("puntaje", "nivel", "pasos", "combo")
+
+PERCENTILES = (10, 50, 90, 99)
+
+
+# =============================================================================
+# TRABAJO EN LOS PROCESOS HIJOS
+# =============================================================================
+
+def _inicializar_trabajador():
+    """Se ejecuta una vez en cada proceso del pool."""
+    configurar_registro_proceso_hijo()
+
+
+def jugar_lote(clave, semillas, max_pasos, pelotas, controlador):
+    """
+    Juega un lote de partidas de una dificultad.
+
+    Corre en un proceso hijo: solo recibe y devuelve datos simples para
+    que el envío entre procesos sea barato.
+
+    Returns:
+        Tupla (clave, filas) con una fila por partida:
+        (puntaje, nivel, pasos, mejor_combo, *pelotas_por_tipo)
+    """
+    estrategia = GestorDificultad.obtener_estrategias_disponibles()[clave]
+    funcion_controlador = CONTROLADORES[controlador]
+
+    filas = []
+    for semilla in semillas:
+        simulacion = ejecutar_partida(estrategia, max_pasos, funcion_controlador,
+                                      pelotas=pelotas, semilla=semilla)
+        filas.append((simulacion.puntaje, simulacion.nivel, simulacion.pasos,
+                      simulacion.observador_puntaje.mejor_combo, *simulacion.pelotas_por_tipo))
+    return clave, filas
+
+
+# =============================================================================
+# REPORTE
+# =============================================================================
+
+def resumir(filas, pasos_por_segundo):
+    """
+    Calcula las distribuciones de una dificultad.
+
+    Args:
+        filas: Filas devueltas por jugar_lote
+        pasos_por_segundo: Para convertir pasos a segundos de sesión
+
+    Returns:
+        Diccionario con estadísticas por métrica y frecuencia de tipos de pelota
+    """
+    datos = np.asarray(filas, dtype=np.float64)
+    metricas = {
+        "puntaje": datos[:, 0],
+        "nivel": datos[:, 1],
+        "duracion_s": datos[:, 2] / pasos_por_segundo,
+        "combo": datos[:, 3],
+    }
+
+    resumen = {"partidas": len(datos)}
+    for nombre, valores in metricas.items():
+        percentiles = np.percentile(valores, PERCENTILES)
+        resumen[nombre] = {
+            "media": float(valores.mean()),
+            "desvio": float(valores.std()),
+            "min": float(valores.min()),
+            "max": float(valores.max()),
+            **{f"p{p}": float(v) for p, v in zip(PERCENTILES, percentiles)},
+        }
+
+    tipos = datos[:, len(COLUMNAS):].sum(axis=0)
+    total = max(tipos.sum(), 1.0)
+    resumen["tipos_pelota"] = {nombre: float(cantidad / total)
+                               for nombre, cantidad in zip(FabricaPelotas.NOMBRES, tipos)}
+    return resumen
+
+
+def imprimir_resumen(clave, resumen):
+    """Muestra el resumen de una dificultad en consola."""
+    print("-" * 70)
+    print(f"⚖️ [BALANCEO] {clave} — {resumen['partidas']:,} partidas")
+    print(f"   {'métrica':<12}{'media':>10}{'p10':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+    for nombre in ("puntaje", "nivel", "duracion_s", "combo"):
+        m = resumen[nombre]
+        print(f"   {nombre:<12}{m['media']:>10.1f}{m['p10']:>10.1f}{m['p50']:>10.1f}"
+              f"{m['p90']:>10.1f}{m['p99']:>10.1f}{m['max']:>10.1f}")
+    tipos = "  ".join(f"{nombre} {fraccion * 100:.1f}%" for nombre, fraccion in resumen["tipos_pelota"].items())
+    print(f"   pelotas: {tipos}")
+
+
+# =============================================================================
+# PUNTO DE ENTRADA
+# =============================================================================
+
+def crear_parser():
+    """Crea el parser de argumentos del subcomando 'balanceo'."""
+    disponibles = sorted(GestorDificultad.obtener_estrategias_disponibles())
+    parser = argparse.ArgumentParser(
+        prog="python -m squash_proyecto balanceo",
+        description="Juega muchas partidas headless por dificultad y reporta distribuciones."
+    )
+    parser.add_argument("--juegos", type=int, default=1000,
+                        help="Partidas por dificultad (por defecto 1000)")
+    parser.add_argument("--dificultades", nargs="+", choices=disponibles, default=disponibles,
+                        help="Dificultades a evaluar (por defecto todas)")
+    parser.add_argument("--max-pasos", type=int, default=18000,
+                        help="Límite de pasos por partida (por defecto 18000 = 5 min a 60 pasos/s)")
+    parser.add_argument("--pelotas", type=int, default=1,
+                        help="Pelotas simultáneas por partida")
+    parser.add_argument("--controlador", choices=sorted(CONTROLADORES), default="seguidor",
+                        help="Quién mueve la raqueta (por defecto seguidor)")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1,
+                        help="Procesos del pool (por defecto todos los núcleos)")
+    parser.add_argument("--lote", type=int, default=50,
+                        help="Partidas por tarea enviada a un proceso")
+    parser.add_argument("--semilla", type=int,
+                        help="Semilla raíz (por defecto una nueva, que se muestra en el reporte)")
+    parser.add_argument("--json", metavar="RUTA",
+                        help="Guardar el reporte completo en un archivo JSON")
+    return parser
+
+
+def ejecutar_balanceo(argv=None):
+    """Ejecuta el subcomando 'balanceo'."""
+    args = crear_parser().parse_args(argv)
+    configurar_registro("WARNING", modo_release=True)
+
+    from config.configuracion import ConfiguracionJuego
+    pasos_por_segundo = ConfiguracionJuego.obtener_instancia().tasa_simulacion
+
+    semilla_raiz = nueva_semilla() if args.semilla is None else args.semilla
+    total = args.juegos * len(args.dificultades)
+    print("=" * 70)
+    print(f"⚖️ [BALANCEO] {args.juegos:,} partidas × {len(args.dificultades)} dificultades "
+          f"en {args.procesos} procesos | semilla raíz {semilla_raiz}")
+
+    resultados = {clave: [] for clave in args.dificultades}
+    inicio = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.procesos, initializer=_inicializar_trabajador) as pool:
+        tareas = []
+        for k, clave in enumerate(args.dificultades):
+            # Cada dificultad tiene su propia rama de semillas
+            semilla_dificultad = derivar_semilla(semilla_raiz, k)
+            for desde in range(0, args.juegos, args.lote):
+                semillas = [derivar_semilla(semilla_dificultad, i)
+                            for i in range(desde, min(desde + args.lote, args.juegos))]
+                tareas.append(pool.submit(jugar_lote, clave, semillas, args.max_pasos,
+                                          args.pelotas, args.controlador))
+
+        # Los lotes llegan a medida que terminan, en cualquier orden
+        terminadas = 0
+        ultimo_aviso = 0.0
+        for tarea in as_completed(tareas):
+            clave, filas = tarea.result()
+            resultados[clave].extend(filas)
+            terminadas += len(filas)
+
+            ahora = time.perf_counter()
+            if ahora - ultimo_aviso >= 1.0 or terminadas == total:
+                ultimo_aviso = ahora
+                transcurrido = ahora - inicio
+                print(f"⏳ [BALANCEO] {terminadas:,}/{total:,} partidas "
+                      f"({terminadas / max(transcurrido, 1e-9):,.0f} partidas/s)", flush=True)
+
+    duracion = time.perf_counter() - inicio
+
+    reporte = {
+        "semilla_raiz": semilla_raiz,
+        "controlador": args.controlador,
+        "pelotas": args.pelotas,
+        "max_pasos": args.max_pasos,
+        "dificultades": {clave: resumir(resultados[clave], pasos_por_segundo)
+                         for clave in args.dificultades},
+    }
+
+    for clave, resumen in reporte["dificultades"].items():
+        imprimir_resumen(clave, resumen)
+    print("-" * 70)
+    print(f"⚖️ [BALANCEO] {total:,} partidas en {duracion:.1f} s ({total / duracion * 60:,.0f} partidas/min)")
+    print("=" * 70)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as archivo:
+            json.dump(reporte, archivo, indent=2, ensure_ascii=False)
+        print(f"💾 [BALANCEO] Reporte guardado en {args.json}")
+    return 0
@@ -0,0 +1,174 @@
+# pylint: disable=all
+"""
+Ejecutor de Simulaciones Headless
+==================================
+Corre N partidas completas sin ventana ni límite de FPS y reporta
+el rendimiento en frames por segundo.
+
+Uso:
+    python -m squash_proyecto sim --juegos 1000 --dificultad normal
+"""
+
+import argparse
+import time
+import numpy as np
+from estrategias.difficultad import GestorDificultad
+from simulacion.nucleo import SimulacionJuego, ENTRADA_IZQUIERDA, ENTRADA_DERECHA
+from simulacion.repeticion import GrabadorRepeticion
+from simulacion.semillas import nueva_semilla, derivar_semilla
+from adaptores.controlador_ia import ControladorIA, NIVELES_IA
+from sistema.registro import configurar_registro
+
+# =============================================================================
+# CONTROLADOR DE RAQUETA PARA SIMULACIONES
+# =============================================================================
+
+def controlador_seguidor(simulacion):
+    """
+    Controlador simple: mueve la raqueta hacia la posición x de la pelota.
+
+    Returns:
+        Máscara de entrada para el siguiente paso
+    """
+    raqueta = simulacion.raqueta
+    centro = raqueta.x + raqueta.ancho / 2
+    margen = raqueta.velocidad
+
+    if simulacion.motor is not None:
+        # Multibola: seguir a la pelota activa más baja
+        motor = simulacion.motor
+        if not motor.activa.any():
+            return 0
+        objetivo = motor.x[np.argmax(np.where(motor.activa, motor.y, -np.inf))]
+    else:
+        objetivo = simulacion.pelota.x
+
+    if objetivo < centro - margen:
+        return ENTRADA_IZQUIERDA
+    if objetivo > centro + margen:
+        return ENTRADA_DERECHA
+    return 0
+
+
+# Controladores disponibles por nombre (para la línea de comandos)
+CONTROLADORES = {
+    "seguidor": controlador_seguidor,
+    # IA con predicción del cruce; cada instancia se reinicia sola por partida
+    **{f"ia_{nivel}": ControladorIA.desde_nivel(nivel) for nivel in NIVELES_IA},
+}
+
+
+def ejecutar_partida(estrategia, max_pasos, controlador=controlador_seguidor, pelotas=1,
+                     semilla=None, ruta_grabacion=None):
+    """
+    Juega una partida completa sin ventana.
+
+    Args:
+        estrategia: EstrategiaDificultad a usar
+        max_pasos: Límite de frames por partida (evita partidas infinitas)
+        controlador: Función que recibe la simulación y retorna la entrada
+        pelotas: Pelotas simultáneas (más de una activa el modo multibola)
+        semilla: Semilla de la partida (por defecto una nueva)
+        ruta_grabacion: Si se indica, la partida se graba como repetición
+
+    Returns:
+        La SimulacionJuego terminada (o detenida al llegar al límite)
+    """
+    simulacion = SimulacionJuego(estrategia, pelotas=pelotas, semilla=semilla)
+    if ruta_grabacion is not None:
+        simulacion.grabador = GrabadorRepeticion(ruta_grabacion, simulacion.semilla, estrategia,
+                                                 pelotas, simulacion.pasos_por_segundo)
+    paso = simulacion.paso
+
+    while not simulacion.terminado and simulacion.pasos < max_pasos:
+        paso(controlador(simulacion))
+
+    # Que la partida devuelta tenga las estadísticas ya entregadas
+    simulacion.bus.esperar_entregas()
+    if simulacion.grabador is not None:
+        simulacion.grabador.cerrar()
+    return simulacion
+
+
+# =============================================================================
+# PUNTO DE ENTRADA
+# =============================================================================
+
+def crear_parser():
+    """Crea el parser de argumentos del subcomando 'sim'."""
+    parser = argparse.ArgumentParser(
+        prog="python -m squash_proyecto sim",
+        description="Corre partidas de Squash sin ventana y sin límite de FPS."
+    )
+    parser.add_argument("--juegos", type=int, default=100,
+                        help="Número de partidas a simular (por defecto 100)")
+    parser.add_argument("--dificultad", default="normal",
+                        choices=sorted(GestorDificultad.obtener_estrategias_disponibles()),
+                        help="Estrategia de dificultad (por defecto normal)")
+    parser.add_argument("--max-pasos", type=int, default=18000,
+                        help="Límite de frames por partida (por defecto 18000 = 5 min a 60 FPS)")
+    parser.add_argument("--pelotas", type=int, default=1,
+                        help="Pelotas simultáneas; más de una usa el motor multibola")
+    parser.add_argument("--controlador", choices=sorted(CONTROLADORES), default="seguidor",
+                        help="Quién mueve la raqueta (por defecto seguidor)")
+    parser.add_argument("--semilla", type=int,
+                        help="Semilla raíz del lote; la de cada partida se deriva de ella "
+                             "(por defecto una nueva, que se muestra en el reporte)")
+    parser.add_argument("--grabar", metavar="RUTA",
+                        help="Grabar la primera partida como repetición (.sqrp)")
+    parser.add_argument("--diario", metavar="RUTA",
+                        help="Exportar el diario de comandos de la última partida (JSON Lines)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Mostrar los mensajes de consola de los patrones")
+    return parser
+
+
+def ejecutar_simulaciones(argv=None):
+    """Ejecuta el subcomando 'sim' y muestra el reporte de rendimiento."""
+    args = crear_parser().parse_args(argv)
+    estrategia = GestorDificultad.obtener_estrategias_disponibles()[args.dificultad]
+
+    pasos_totales = 0
+    puntaje_total = 0
+    nivel_maximo = 0
+
+    # Sin --verbose se corre en modo release: los mensajes de las rutas
+    # calientes quedan deshabilitados y no cuestan nada
+    if args.verbose:
+        configurar_registro("DEBUG")
+    else:
+        configurar_registro("WARNING", modo_release=True)
+
+    semilla_raiz = nueva_semilla() if args.semilla is None else args.semilla
+
+    inicio = time.perf_counter()
+    for i in range(args.juegos):
+        semilla = derivar_semilla(semilla_raiz, i)
+        ruta_grabacion = args.grabar if i == 0 else None
+        simulacion = ejecutar_partida(estrategia, args.max_pasos, CONTROLADORES[args.controlador],
+                                      pelotas=args.pelotas, semilla=semilla,
+                                      ruta_grabacion=ruta_grabacion)
+        pasos_totales += simulacion.pasos
+        puntaje_total += simulacion.puntaje
+        nivel_maximo = max(nivel_maximo, simulacion.nivel)
+    duracion = time.perf_counter() - inicio
+
+    duracion = max(duracion, 1e-9)
+
+    print("=" * 70)
+    print(f"🧪 [SIM] Dificultad: {estrategia.obtener_nombre()}")
+    print(f"🧪 [SIM] Partidas: {args.juegos}")
+    print(f"🧪 [SIM] Semilla raíz: {semilla_raiz}")
+    print(f"🧪 [SIM] Pelotas simultáneas: {args.pelotas}")
+    print(f"🧪 [SIM] Controlador: {args.controlador}")
+    print(f"🧪 [SIM] Frames simulados: {pasos_totales:,}")
+    print(f"🧪 [SIM] Tiempo: {duracion:.2f} s")
+    print(f"🧪 [SIM] Frames/s: {pasos_totales / duracion:,.0f}")
+    print(f"🧪 [SIM] Partidas/min: {args.juegos / duracion * 60:,.0f}")
+    print(f"🧪 [SIM] Puntaje promedio: {puntaje_total / max(args.juegos, 1):.1f}")
+    print(f"🧪 [SIM] Nivel máximo: {nivel_maximo}")
+    if args.diario and args.juegos > 0:
+        escritos = simulacion.invocador.exportar(args.diario)
+        print(f"🧪 [SIM] Diario de comandos: {escritos} comandos en {args.diario}")
+    print("=" * 70)
+    return 0
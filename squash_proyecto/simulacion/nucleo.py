@@ -0,0 +1,453 @@
+# pylint: disable=all
+"""
+Núcleo de Simulación Headless
+==============================
+Contiene la lógica de una partida (puntaje, vidas, nivel, raqueta, pelota,
+dificultad y observadores) sin tocar la pantalla, las fuentes ni la cola
+de eventos de Pygame. EstadoJugando la usa para jugar con ventana y el
+ejecutor de simulaciones la usa para correr partidas sin límite de FPS.
+"""
+
+import math
+import time
+import numpy as np
+import pygame
+from entidades.raqueta import Raqueta
+from entidades.fabrica_pelotas import FabricaPelotas
+from fisica.motor_pelotas import MotorPelotas
+from fisica.prediccion import predecir_cruce
+from estrategias.difficultad import GestorDificultad
+from observers.observador_eventos import (ObservadorPuntaje, ObservadorSonido,
+                                          ObservadorEstadisticas, ObservadorLogros)
+from observers.bus_eventos import (BusEventos, EventoGolpe, EventoNivelSubido,
+                                   PELOTA_PERDIDA, GAME_OVER)
+from comandos.sistema_comandos import InvocadorComandos, ComandoAgregarPuntos, ComandoCambiarModo
+from config.configuracion import ConfiguracionJuego, ANCHO_CANCHA, VELOCIDAD_MAXIMA_PELOTA
+from simulacion.semillas import nueva_semilla, crear_generadores
+from sistema.perfilador import FASE_MODOS, FASE_FISICA, FASE_OBSERVADORES
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("juego")
+
+# =============================================================================
+# ENTRADA COMO MÁSCARA DE BITS
+# =============================================================================
+
+ENTRADA_IZQUIERDA = 1 << 0
+ENTRADA_DERECHA = 1 << 1
+ENTRADA_MODO_RAPIDO = 1 << 2       # Tecla A
+ENTRADA_MODO_ANCHO = 1 << 3        # Tecla S
+ENTRADA_MODO_IMANTACION = 1 << 4   # Tecla D
+ENTRADA_MODO_NORMAL = 1 << 5       # Tecla W
+ENTRADA_MODO_ESCUDO = 1 << 6       # Tecla Q
+
+# Relación tecla de Pygame -> bit de entrada
+TECLAS_ENTRADA = (
+    (pygame.K_LEFT, ENTRADA_IZQUIERDA),
+    (pygame.K_RIGHT, ENTRADA_DERECHA),
+    (pygame.K_a, ENTRADA_MODO_RAPIDO),
+    (pygame.K_s, ENTRADA_MODO_ANCHO),
+    (pygame.K_d, ENTRADA_MODO_IMANTACION),
+    (pygame.K_w, ENTRADA_MODO_NORMAL),
+    (pygame.K_q, ENTRADA_MODO_ESCUDO),
+)
+
+# Bit de entrada -> modo de raqueta (mismo orden que las teclas A, S, D, W, Q)
+MODOS_POR_ENTRADA = (
+    (ENTRADA_MODO_RAPIDO, "Rápido"),
+    (ENTRADA_MODO_ANCHO, "Ancho"),
+    (ENTRADA_MODO_IMANTACION, "Imantación"),
+    (ENTRADA_MODO_NORMAL, "Normal"),
+    (ENTRADA_MODO_ESCUDO, "Escudo"),
+)
+
+
+def entrada_desde_teclas(teclas):
+    """
+    Convierte una lista de teclas presionadas (como la de
+    pygame.key.get_pressed() o InputAdapter) a una máscara de bits.
+    """
+    entrada = 0
+    for tecla, bit in TECLAS_ENTRADA:
+        if teclas[tecla]:
+            entrada |= bit
+    return entrada
+
+
+# =============================================================================
+# SIMULACIÓN DE UNA PARTIDA
+# =============================================================================
+
+class SimulacionJuego:
+    """
+    Estado completo de una partida, avanzable paso a paso con una
+    entrada explícita. No depende de la pantalla ni de los eventos.
+    """
+
+    def __init__(self, estrategia_dificultad=None, pelotas=1, pasos_por_segundo=None, semilla=None):
+        """
+        Args:
+            estrategia_dificultad: EstrategiaDificultad (por defecto Normal)
+            pelotas: Pelotas simultáneas. Con más de una se usa el
+                     modo multibola sobre MotorPelotas.
+            pasos_por_segundo: Tasa de la simulación de paso fijo, usada para
+                               convertir duraciones en segundos a pasos
+                               (por defecto ConfiguracionJuego.tasa_simulacion)
+            semilla: Semilla del azar de la partida; con la misma semilla y las
+                     mismas entradas la partida se repite igual (por defecto
+                     una semilla nueva)
+        """
+        if pasos_por_segundo is None:
+            pasos_por_segundo = ConfiguracionJuego.obtener_instancia().tasa_simulacion
+        self.pasos_por_segundo = pasos_por_segundo
+
+        # Azar propio de la partida: nada depende del estado global de random
+        if semilla is None:
+            semilla = nueva_semilla()
+        self.semilla = semilla
+        self.rng, self.rng_np = crear_generadores(semilla)
+
+        # Grabador de repetición opcional (ver simulacion.repeticion)
+        self.grabador = None
+
+        # Perfilador de frames opcional (ver sistema.perfilador)
+        self.perfilador = None
+
+        # Inicializar estrategia de dificultad (STRATEGY)
+        self.gestor_dificultad = GestorDificultad(estrategia_dificultad)
+
+        # Inicializar variables del juego
+        self.puntaje = 0
+        self.nivel = 1
+        self.vidas = self.gestor_dificultad.obtener_estrategia().calcular_vidas_iniciales()
+        self.multiplicador_activo = False
+        self.tiempo_multiplicador = 0
+        self.pasos = 0
+        self.terminado = False
+        self.combo = 0
+
+        # Crear raqueta con DECORATOR
+        self.raqueta = Raqueta(450, 650)
+
+        # Crear pelota inicial con FACTORY METHOD
+        self.pelotas_simultaneas = pelotas
+        self.pelotas_por_tipo = [0] * len(FabricaPelotas.TIPOS)
+        self.pelota = None
+        self.motor = None
+        if pelotas > 1:
+            # Modo multibola: todas las pelotas viven en arreglos
+            self.motor = MotorPelotas(pelotas)
+        self.generar_pelotas()
+
+        # Sistema de OBSERVER: los eventos del paso se entregan en lote al final
+        self.bus = BusEventos()
+        self.observador_puntaje = ObservadorPuntaje()
+        self.observador_sonido = ObservadorSonido()
+        self.observador_estadisticas = ObservadorEstadisticas()
+        self.observador_logros = ObservadorLogros()
+        for observador in (self.observador_puntaje, self.observador_sonido,
+                           self.observador_estadisticas, self.observador_logros):
+            observador.suscribirse(self.bus)
+
+        # Invoker de COMMAND
+        self.invocador = InvocadorComandos()
+
+        # Entrada del paso anterior (para detectar teclas recién presionadas)
+        self.entrada_anterior = 0
+
+        # Aplicar configuración de dificultad
+        self.gestor_dificultad.aplicar_configuracion(self, self.nivel)
+
+    def paso(self, entrada):
+        """
+        Avanza la partida un paso fijo (1 / pasos_por_segundo segundos).
+
+        Args:
+            entrada: Máscara de bits ENTRADA_* con las teclas presionadas
+        """
+        if self.terminado:
+            return
+
+        self.pasos += 1
+        if self.grabador is not None:
+            self.grabador.registrar(entrada)
+
+        if self.perfilador is not None and self.perfilador.activo:
+            self.paso_perfilado(entrada)
+            return
+
+        self.avanzar_logica(entrada)
+
+        # Entregar a los observadores los eventos del paso, en un solo lote
+        self.bus.despachar()
+
+    def paso_perfilado(self, entrada):
+        """Igual que el resto de paso(), midiendo modos, física y observadores."""
+        inicio = time.perf_counter_ns()
+        self.manejar_modos(entrada)
+        fin_modos = time.perf_counter_ns()
+        self.avanzar_fisica(entrada)
+        fin_fisica = time.perf_counter_ns()
+        self.bus.despachar()
+        fin = time.perf_counter_ns()
+
+        self.perfilador.acumular(FASE_MODOS, fin_modos - inicio)
+        self.perfilador.acumular(FASE_FISICA, fin_fisica - fin_modos)
+        self.perfilador.acumular(FASE_OBSERVADORES, fin - fin_fisica)
+
+    def avanzar_pasos(self, entradas):
+        """
+        Avance por eventos: juega una secuencia de entradas conocida de
+        antemano (una repetición, un bot con guion). El resultado es el mismo
+        que llamar paso() con cada entrada, pero los tramos sin eventos (la
+        pelota volando lejos de la raqueta con la entrada sin cambios) se
+        saltan de una vez hasta el próximo evento: llegada a la raqueta,
+        cambio de entrada o fin del multiplicador.
+
+        Args:
+            entradas: Buffer de bytes con una máscara ENTRADA_* por paso
+                      (bytes, bytearray, memoryview o mmap)
+
+        Returns:
+            Pasos consumidos (menos que len(entradas) si la partida terminó)
+        """
+        datos = memoryview(entradas).cast("B")
+        total = len(datos)
+        if total == 0:
+            return 0
+
+        # Pasos donde cambia la entrada: fin de cada tramo de entrada constante
+        mascaras = np.frombuffer(datos, dtype=np.uint8)
+        cambios = np.flatnonzero(mascaras[1:] != mascaras[:-1]) + 1
+        del mascaras
+
+        i = 0
+        while i < total and not self.terminado:
+            entrada = datos[i]
+            saltables = 0
+            if entrada == self.entrada_anterior:
+                saltables = self.pasos_sin_eventos()
+            if saltables:
+                tramo = int(np.searchsorted(cambios, i, side="right"))
+                fin = int(cambios[tramo]) if tramo < len(cambios) else total
+                saltables = min(saltables, fin - i)
+                self.saltar_pasos(entrada, saltables, datos[i:i + saltables])
+                i += saltables
+            else:
+                self.paso(entrada)
+                i += 1
+        return i
+
+    def pasos_sin_eventos(self):
+        """
+        Cuántos pasos siguientes se pueden saltar sin que ocurra nada más que
+        movimiento en línea recta y rebotes en paredes (0 si hay que simular
+        el próximo paso normalmente).
+        """
+        if self.motor is not None or self.raqueta.modo_actual == "Imantación":
+            # Multibola e imantación cambian la física en cada paso
+            return 0
+        if self.puntaje >= self.nivel * 100:
+            # Hay subidas de nivel pendientes (una por paso)
+            return 0
+
+        pelota = self.pelota
+        y_plano = self.raqueta.y - pelota.radio
+        if pelota.y >= y_plano:
+            return 0
+
+        cruce = predecir_cruce(pelota.x, pelota.y, pelota.velocidad_x, pelota.velocidad_y, y_plano, ANCHO_CANCHA)
+        if cruce is None:
+            saltables = math.inf
+        else:
+            # Margen de un paso: el tramo termina antes de tocar el plano de la raqueta
+            saltables = max(int(cruce[1]) - 1, 0)
+
+        if self.multiplicador_activo:
+            saltables = min(saltables, self.tiempo_multiplicador)
+        return saltables
+
+    def saltar_pasos(self, entrada, pasos, entradas):
+        """
+        Avanza 'pasos' pasos sin eventos de una vez (ver pasos_sin_eventos).
+
+        Args:
+            entrada: Máscara de entrada (la misma en todos los pasos)
+            pasos: Cantidad de pasos
+            entradas: Las entradas del tramo, para el grabador
+        """
+        self.pasos += pasos
+        if self.grabador is not None:
+            self.grabador.registrar_lote(entradas)
+
+        self.raqueta.mover_direccion_pasos(entrada & ENTRADA_IZQUIERDA, entrada & ENTRADA_DERECHA, pasos)
+        self.pelota.avanzar_sin_obstaculos(pasos)
+
+        if self.multiplicador_activo:
+            self.tiempo_multiplicador -= pasos
+            if self.tiempo_multiplicador <= 0:
+                self.multiplicador_activo = False
+                registro.debug("⏰ Multiplicador desactivado")
+
+    def avanzar_logica(self, entrada):
+        """Lógica de un paso; los eventos quedan pendientes en el bus."""
+        # Manejar cambios de modo de la raqueta (DECORATOR)
+        self.manejar_modos(entrada)
+        self.avanzar_fisica(entrada)
+
+    def avanzar_fisica(self, entrada):
+        """Movimiento, colisiones, nivel y multiplicador de un paso."""
+        # Mover raqueta
+        self.raqueta.mover_direccion(entrada & ENTRADA_IZQUIERDA, entrada & ENTRADA_DERECHA)
+
+        if self.motor is not None:
+            self.paso_multibola()
+        else:
+            # Aplicar efecto de imantación si está activo
+            if self.raqueta.modo_actual == "Imantación":
+                self.raqueta.aplicar_imantacion(self.pelota)
+
+            # Mover pelota con colisión continua contra paredes y raqueta
+            if self.pelota.avanzar(self.raqueta):
+                self.registrar_golpe()
+
+            # Verificar si la pelota se perdió
+            if not self.pelota.activa:
+                self.registrar_pelota_perdida()
+
+        # Verificar subida de nivel
+        puntos_necesarios = self.nivel * 100
+
+        if self.puntaje >= puntos_necesarios:
+            self.nivel += 1
+
+            # Notificar observadores
+            self.bus.publicar(EventoNivelSubido(self.nivel))
+
+            # Aplicar nueva configuración de dificultad
+            self.gestor_dificultad.aplicar_configuracion(self, self.nivel)
+
+            registro.info("🎊 ¡NIVEL %s!", self.nivel)
+
+        # Actualizar multiplicador
+        if self.multiplicador_activo:
+            self.tiempo_multiplicador -= 1
+            if self.tiempo_multiplicador <= 0:
+                self.multiplicador_activo = False
+                registro.debug("⏰ Multiplicador desactivado")
+
+    def paso_multibola(self):
+        """Física del frame en modo multibola: una pasada vectorizada por operación."""
+        motor = self.motor
+
+        if self.raqueta.modo_actual == "Imantación":
+            motor.aplicar_imantacion(self.raqueta)
+
+        motor.mover()
+
+        golpes = motor.verificar_colisiones(self.raqueta)
+        motor.recoger_perdidas()
+        if len(golpes):
+            tipos = motor.tipo[golpes]
+
+            # Un solo comando con los puntos de todos los golpes del frame
+            estrategia = self.gestor_dificultad.obtener_estrategia()
+            puntos_base = estrategia.calcular_puntos_por_golpe(self.nivel)
+            puntos = puntos_base + motor.puntos_bonus[tipos]
+            if self.multiplicador_activo:
+                puntos *= 2
+            self.invocador.ejecutar_comando(ComandoAgregarPuntos(self, int(puntos.sum())))
+
+            for puntos_golpe, tipo_id in zip(puntos.tolist(), tipos.tolist()):
+                self.notificar_golpe(puntos_golpe)
+
+                efecto = FabricaPelotas.EFECTOS[tipo_id]
+                if efecto is not None:
+                    efecto(self)
+
+            # Modo escudo: rebote más fuerte
+            if self.raqueta.modo_actual == "Escudo":
+                motor.vy[golpes] = np.maximum(motor.vy[golpes] * 1.2, -VELOCIDAD_MAXIMA_PELOTA)
+
+        # En multibola se pierde una vida cuando no queda ninguna pelota
+        if not motor.activa.any():
+            self.registrar_pelota_perdida()
+
+    def registrar_golpe(self):
+        """Otorga puntos y aplica efectos cuando la pelota toca la raqueta."""
+        # Ejecutar comando de agregar puntos (COMMAND)
+        estrategia = self.gestor_dificultad.obtener_estrategia()
+        puntos_base = estrategia.calcular_puntos_por_golpe(self.nivel)
+        puntos_bonus = self.pelota.puntos_bonus
+
+        if self.multiplicador_activo:
+            puntos_totales = (puntos_base + puntos_bonus) * 2
+        else:
+            puntos_totales = puntos_base + puntos_bonus
+
+        comando_puntos = ComandoAgregarPuntos(self, puntos_totales)
+        self.invocador.ejecutar_comando(comando_puntos)
+
+        self.notificar_golpe(puntos_totales)
+
+        # Aplicar efecto especial de la pelota
+        self.pelota.efecto_especial(self)
+
+        # Modo escudo: rebote más fuerte
+        if self.raqueta.modo_actual == "Escudo":
+            self.pelota.velocidad_y = max(self.pelota.velocidad_y * 1.2, -VELOCIDAD_MAXIMA_PELOTA)
+
+    def notificar_golpe(self, puntos_totales):
+        """Notifica un golpe exitoso a los observadores."""
+        # Notificar observadores (OBSERVER); el combo se cuenta aquí porque
+        # los observadores recién reciben el evento al final del paso
+        self.combo += 1
+        self.bus.publicar(EventoGolpe(puntos_totales, self.combo))
+
+    def registrar_pelota_perdida(self):
+        """Descuenta una vida y repone la pelota o termina la partida."""
+        self.vidas -= 1
+
+        # Notificar observadores
+        self.bus.publicar(PELOTA_PERDIDA)
+
+        if self.vidas > 0:
+            # Crear nueva pelota (FACTORY METHOD)
+            self.generar_pelotas()
+            self.gestor_dificultad.aplicar_configuracion(self, self.nivel)
+
+            # Volver a modo normal
+            self.raqueta.activar_modo_normal(True)
+        else:
+            # Game Over
+            self.bus.publicar(GAME_OVER)
+            self.terminado = True
+
+    def generar_pelotas(self):
+        """Crea la pelota (o las pelotas del motor) y cuenta sus tipos."""
+        if self.motor is not None:
+            indices = FabricaPelotas.generar_en_motor(self.motor, self.nivel, self.pelotas_simultaneas, self.rng_np)
+            for tipo_id, cantidad in enumerate(np.bincount(self.motor.tipo[indices], minlength=len(self.pelotas_por_tipo))):
+                self.pelotas_por_tipo[tipo_id] += int(cantidad)
+        else:
+            self.pelota = FabricaPelotas.crear_pelota_aleatoria(self.nivel, self.rng)
+            self.pelotas_por_tipo[FabricaPelotas.NOMBRES.index(self.pelota.tipo)] += 1
+
+    def manejar_modos(self, entrada):
+        """Maneja el cambio de modos de la raqueta con las teclas recién presionadas."""
+        nuevas = entrada & ~self.entrada_anterior
+        self.entrada_anterior = entrada
+
+        if not nuevas:
+            return
+
+        for bit, modo in MODOS_POR_ENTRADA:
+            if nuevas & bit:
+                # Crear y ejecutar comando de cambio de modo (COMMAND)
+                comando = ComandoCambiarModo(self.raqueta, modo)
+                self.invocador.ejecutar_comando(comando)
+
+    def activar_multiplicador(self, duracion=5):
+        """Activa el multiplicador de puntos temporalmente."""
+        self.multiplicador_activo = True
+        self.tiempo_multiplicador = duracion * self.pasos_por_segundo  # Convertir a pasos
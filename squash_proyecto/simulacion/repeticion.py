@@ -0,0 +1,245 @@
+# pylint: disable=all
+"""
+Grabación y Reproducción de Partidas
+====================================
+Una partida queda determinada por su semilla, su dificultad, la cantidad
+de pelotas y la máscara de entrada de cada paso. Se guarda en un archivo
+binario con una cabecera pequeña seguida de un byte por paso.
+
+Formato (little endian):
+    cabecera: "SQRP" | versión u16 | pelotas u16 | tasa u16 | semilla u64 | dificultad 16 bytes
+    cuerpo:   un byte por paso con los bits ENTRADA_*
+
+La lectura usa mmap: una repetición de varias horas no se carga en RAM.
+
+Uso:
+    python -m squash_proyecto replay partida.sqrp                -> Con ventana, a tiempo real
+    python -m squash_proyecto replay partida.sqrp --sin-limite   -> Con ventana, lo más rápido posible
+    python -m squash_proyecto replay partida.sqrp --headless     -> Sin ventana (carga de trabajo fija)
+    python -m squash_proyecto replay partida.sqrp --headless --paso-a-paso
+                                                                 -> Sin ventana, sin avance por eventos
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from estrategias.difficultad import GestorDificultad
+from simulacion.nucleo import SimulacionJuego
+
+MAGIA = b"SQRP"
+# v2: el azar sale de los generadores propios de la partida (simulacion.semillas);
+# una repetición v1 no se reproduciría igual
+# v3: la posición de la pelota se calcula desde el origen de cada tramo
+# (Pelota.edad), no sumando paso a paso
+VERSION = 3
+CABECERA = struct.Struct("<4sHHHQ16s")
+
+# Escribir al disco en bloques, no un byte por paso
+TAMANO_BLOQUE = 4096
+
+
+def clave_estrategia(estrategia):
+    """Clave ('facil', 'normal', ...) de una instancia de EstrategiaDificultad."""
+    for clave, disponible in GestorDificultad.obtener_estrategias_disponibles().items():
+        if type(disponible) is type(estrategia):
+            return clave
+    raise ValueError(f"Dificultad sin clave registrada: {estrategia!r}")
+
+
+# =============================================================================
+# GRABACIÓN
+# =============================================================================
+
+class GrabadorRepeticion:
+    """Escribe la máscara de entrada de cada paso de una partida."""
+
+    def __init__(self, ruta, semilla, estrategia, pelotas=1, tasa_simulacion=60):
+        """
+        Args:
+            ruta: Archivo de salida
+            semilla: Semilla con la que se creó la partida
+            estrategia: EstrategiaDificultad de la partida
+            pelotas: Pelotas simultáneas
+            tasa_simulacion: Pasos por segundo (para reproducir a tiempo real)
+        """
+        self.ruta = ruta
+        self.archivo = open(ruta, "wb")
+        self.archivo.write(CABECERA.pack(MAGIA, VERSION, pelotas, tasa_simulacion, semilla,
+                                         clave_estrategia(estrategia).encode("ascii")))
+        self.pendientes = bytearray()
+        self.pasos = 0
+
+    def registrar(self, entrada):
+        """Agrega la entrada de un paso."""
+        self.pendientes.append(entrada)
+        self.pasos += 1
+        if len(self.pendientes) >= TAMANO_BLOQUE:
+            self.archivo.write(self.pendientes)
+            self.pendientes.clear()
+
+    def registrar_lote(self, entradas):
+        """Agrega las entradas de varios pasos seguidos."""
+        self.pendientes += entradas
+        self.pasos += len(entradas)
+        if len(self.pendientes) >= TAMANO_BLOQUE:
+            self.archivo.write(self.pendientes)
+            self.pendientes.clear()
+
+    def cerrar(self):
+        """Vuelca lo pendiente y cierra el archivo."""
+        if self.archivo is None:
+            return
+        self.archivo.write(self.pendientes)
+        self.pendientes.clear()
+        self.archivo.close()
+        self.archivo = None
+
+
+# =============================================================================
+# LECTURA
+# =============================================================================
+
+class LectorRepeticion:
+    """Acceso de solo lectura, mapeado en memoria, a una repetición."""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.archivo = open(ruta, "rb")
+        try:
+            self.datos = mmap.mmap(self.archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Archivo vacío: mmap no acepta longitud 0
+            self.archivo.close()
+            raise ValueError(f"{ruta}: no es una repetición de Squash")
+
+        if len(self.datos) < CABECERA.size:
+            self.cerrar()
+            raise ValueError(f"{ruta}: no es una repetición de Squash")
+
+        magia, version, pelotas, tasa, semilla, clave = CABECERA.unpack_from(self.datos, 0)
+        if magia != MAGIA:
+            self.cerrar()
+            raise ValueError(f"{ruta}: no es una repetición de Squash")
+        if version != VERSION:
+            self.cerrar()
+            raise ValueError(f"{ruta}: versión de formato {version} no soportada (se espera {VERSION})")
+
+        self.version = version
+        self.pelotas = pelotas
+        self.tasa_simulacion = tasa
+        self.semilla = semilla
+        self.clave_estrategia = clave.rstrip(b"\0").decode("ascii")
+
+    def crear_estrategia(self):
+        """Instancia de la dificultad con la que se grabó la partida."""
+        return GestorDificultad.obtener_estrategias_disponibles()[self.clave_estrategia]
+
+    def __len__(self):
+        return len(self.datos) - CABECERA.size
+
+    def __getitem__(self, paso):
+        return self.datos[CABECERA.size + paso]
+
+    def __iter__(self):
+        datos = self.datos
+        for i in range(CABECERA.size, len(datos)):
+            yield datos[i]
+
+    def cerrar(self):
+        if self.datos is not None:
+            self.datos.close()
+            self.datos = None
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+# =============================================================================
+# REPRODUCCIÓN SIN VENTANA
+# =============================================================================
+
+def reproducir_headless(lector, por_eventos=True):
+    """
+    Reproduce una repetición sobre SimulacionJuego, sin límite de velocidad.
+
+    Args:
+        lector: LectorRepeticion abierto
+        por_eventos: Si True, las entradas (conocidas de antemano) se juegan
+                     con SimulacionJuego.avanzar_pasos(), que salta los tramos
+                     sin eventos; si False, se simula paso a paso
+
+    Returns:
+        La SimulacionJuego al final de la repetición
+    """
+    simulacion = SimulacionJuego(lector.crear_estrategia(), pelotas=lector.pelotas,
+                                 pasos_por_segundo=lector.tasa_simulacion, semilla=lector.semilla)
+    if por_eventos:
+        with memoryview(lector.datos) as datos:
+            simulacion.avanzar_pasos(datos[CABECERA.size:])
+    else:
+        paso = simulacion.paso
+        for entrada in lector:
+            paso(entrada)
+    return simulacion
+
+
+def crear_parser():
+    """Crea el parser de argumentos del subcomando 'replay'."""
+    parser = argparse.ArgumentParser(
+        prog="python -m squash_proyecto replay",
+        description="Reproduce una partida grabada."
+    )
+    parser.add_argument("archivo", help="Archivo .sqrp grabado")
+    modo = parser.add_mutually_exclusive_group()
+    modo.add_argument("--sin-limite", action="store_true",
+                      help="Con ventana, sin esperar al reloj")
+    modo.add_argument("--headless", action="store_true",
+                      help="Sin ventana; reporta el tiempo de la reproducción")
+    parser.add_argument("--paso-a-paso", action="store_true",
+                        help="Con --headless, simular cada paso en lugar de saltar entre eventos")
+    return parser
+
+
+def ejecutar_repeticion(argv=None):
+    """Ejecuta el subcomando 'replay'."""
+    args = crear_parser().parse_args(argv)
+
+    try:
+        LectorRepeticion(args.archivo).cerrar()
+    except (OSError, ValueError) as error:
+        print(f"❌ [REPLAY] {error}")
+        return 1
+
+    if not args.headless:
+        # Mismos ajustes de video y audio que el juego (archivo por defecto)
+        from config.linea_comandos import preparar_configuracion
+        try:
+            preparar_configuracion([])
+        except ValueError as error:
+            print(f"❌ [CONFIG] {error}")
+            return 1
+        from main import main
+        main(repeticion=args.archivo, sin_limite=args.sin_limite)
+        return 0
+
+    from sistema.registro import configurar_registro
+    configurar_registro("WARNING", modo_release=True)
+
+    with LectorRepeticion(args.archivo) as lector:
+        inicio = time.perf_counter()
+        simulacion = reproducir_headless(lector, por_eventos=not args.paso_a_paso)
+        duracion = max(time.perf_counter() - inicio, 1e-9)
+
+        print("=" * 70)
+        print(f"🎬 [REPLAY] Archivo: {args.archivo} (formato v{lector.version})")
+        print(f"🎬 [REPLAY] Dificultad: {lector.clave_estrategia} | Semilla: {lector.semilla} | Pelotas: {lector.pelotas}")
+        print(f"🎬 [REPLAY] Pasos: {len(lector):,} ({'paso a paso' if args.paso_a_paso else 'avance por eventos'})")
+        print(f"🎬 [REPLAY] Tiempo: {duracion:.3f} s ({len(lector) / duracion:,.0f} pasos/s)")
+        print(f"🎬 [REPLAY] Puntaje final: {simulacion.puntaje} | Nivel: {simulacion.nivel} | Vidas: {simulacion.vidas}")
+        print("=" * 70)
+    return 0
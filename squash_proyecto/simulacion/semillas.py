@@ -0,0 +1,52 @@
+# pylint: disable=all
+"""
+Semillas y Generadores de Azar
+==============================
+Cada partida tiene sus propios generadores (random.Random para la lógica
+escalar y numpy.random.Generator para la vectorizada) creados desde una
+semilla explícita. Nada depende del estado global de 'random' ni de
+'np.random', así que dos partidas en hilos o procesos distintos no se
+correlacionan.
+
+Para lotes grandes, las semillas de cada partida se derivan de una
+semilla raíz con numpy.random.SeedSequence: el lote completo se
+reproduce con un solo número y las partidas son independientes entre sí.
+"""
+
+import random
+import numpy as np
+
+# Las semillas se guardan como u64 en las repeticiones; se usan 63 bits
+BITS_SEMILLA = 63
+
+
+def nueva_semilla():
+    """Semilla nueva tomada de la entropía del sistema operativo."""
+    return random.SystemRandom().getrandbits(BITS_SEMILLA)
+
+
+def derivar_semilla(raiz, indice):
+    """
+    Semilla de la partida número 'indice' de un lote con semilla raíz 'raiz'.
+
+    Args:
+        raiz: Semilla raíz del lote
+        indice: Posición de la partida en el lote (0, 1, 2, ...)
+    """
+    secuencia = np.random.SeedSequence(raiz, spawn_key=(indice,))
+    return int(secuencia.generate_state(1, np.uint64)[0]) >> (64 - BITS_SEMILLA)
+
+
+def derivar_semillas(raiz, cantidad):
+    """Lista con las semillas de las primeras 'cantidad' partidas del lote."""
+    return [derivar_semilla(raiz, indice) for indice in range(cantidad)]
+
+
+def crear_generadores(semilla):
+    """
+    Generadores de azar de una partida.
+
+    Returns:
+        Tupla (random.Random, numpy.random.Generator)
+    """
+    return random.Random(semilla), np.random.default_rng(semilla)
@@ -0,0 +1,139 @@
+# pylint: disable=all
+"""
+Arranque en Frío
+================
+Lo mínimo para mostrar el primer frame del menú, y el resto después.
+
+Antes del primer frame solo se inician los subsistemas display y font de
+pygame (pygame.init() abriría también el mezclador, el joystick y los
+demás). El mezclador, los módulos de la partida (estados.estado_jugando
+y todo lo que arrastra) y las fuentes de MANIFIESTO_JUEGO (recursos.gestor_recursos) se
+cargan en un hilo mientras el menú ya está en pantalla; el joystick lo inicia InputAdapter recién si se elige esa
+entrada.
+
+Cada paso queda registrado en un InformeArranque; con
+`python -m squash_proyecto --startup-report` se imprime la tabla de
+tiempos por fase y por módulo importado. Este módulo no importa pygame
+para que __main__ pueda medir también ese import.
+"""
+
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("app")
+
+
+class InformeArranque:
+    """
+    Tiempos de cada fase del arranque, medidos desde que se creó el informe
+    (lo primero que hace __main__). Las fases pueden venir de varios hilos.
+    """
+
+    def __init__(self, activo=False):
+        """
+        Args:
+            activo: Si es True, imprimir() muestra la tabla en consola
+        """
+        self.activo = activo
+        self.inicio = time.perf_counter_ns()
+        self.fases = []     # (nombre, inicio_ns, duracion_ns, modulos_nuevos, hilo)
+        self.impreso = False
+
+    @contextmanager
+    def fase(self, nombre):
+        """Mide el bloque del with como una fase del arranque."""
+        modulos = len(sys.modules)
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            fin = time.perf_counter_ns()
+            # Con dos hilos importando a la vez la cuenta de módulos es aproximada
+            self.fases.append((nombre, inicio - self.inicio, fin - inicio,
+                               len(sys.modules) - modulos, threading.current_thread().name))
+
+    def importar(self, nombre_modulo):
+        """Importa un módulo midiendo cuánto tardó (incluidas sus dependencias nuevas)."""
+        with self.fase(f"import {nombre_modulo}"):
+            return importlib.import_module(nombre_modulo)
+
+    def marcar(self, nombre):
+        """Registra un hito (fase de duración cero), p. ej. el primer frame."""
+        self.fases.append((nombre, time.perf_counter_ns() - self.inicio, 0, 0,
+                           threading.current_thread().name))
+
+    def imprimir(self):
+        """Muestra la tabla de fases, ordenada por momento de inicio."""
+        self.impreso = True
+        if not self.activo:
+            return
+
+        print("=" * 86)
+        print("🚀 [ARRANQUE] Tiempos desde el inicio del proceso (ms)")
+        print(f"   {'fase':<42}{'inicio':>9}{'duración':>10}{'módulos':>9}  hilo")
+        for nombre, inicio, duracion, modulos, hilo in sorted(self.fases, key=lambda fase: fase[1]):
+            if duracion == 0 and modulos == 0:
+                print(f"   ── {nombre} {'─' * (37 - len(nombre))}{inicio / 1e6:>9.1f}")
+                continue
+            print(f"   {nombre:<42}{inicio / 1e6:>9.1f}{duracion / 1e6:>10.1f}{modulos:>9}  {hilo}")
+        print("=" * 86, flush=True)
+
+
+# =============================================================================
+# PASOS DEL ARRANQUE
+# =============================================================================
+
+def iniciar_video(config, informe, titulo=""):
+    """
+    Inicia solo display y font y abre la ventana (renderizado.vista).
+
+    Returns:
+        Lienzo donde dibujan los estados
+    """
+    import pygame
+    from renderizado.vista import Vista
+    with informe.fase("pygame.display.init"):
+        pygame.display.init()
+    with informe.fase("pygame.font.init"):
+        pygame.font.init()
+    with informe.fase("pygame.display.set_mode"):
+        pantalla = Vista.obtener_instancia().abrir_ventana(config, titulo)
+    return pantalla
+
+
+def cargar_en_segundo_plano(config, informe):
+    """
+    Abre el mezclador y precarga los módulos y recursos de la partida en un hilo.
+
+    Si el jugador elige una dificultad antes de que termine, el import de
+    EstadoJugando en el menú espera a que el hilo lo complete (el sistema
+    de imports de Python lo garantiza); los sonidos que se disparen antes
+    de que el mezclador esté listo simplemente no suenan.
+
+    Returns:
+        threading.Thread ya iniciado
+    """
+    def cargar():
+        motor_audio = informe.importar("audio.motor_audio")
+        with informe.fase("mezclador + síntesis de efectos"):
+            motor_audio.MotorAudio.obtener_instancia().iniciar(
+                config.frecuencia_audio, config.buffer_audio,
+                config.canales_audio, config.volumen_efectos)
+        informe.importar("estados.estado_jugando")
+        gestor_recursos = informe.importar("recursos.gestor_recursos")
+        with informe.fase("precarga de recursos"):
+            # Las fuentes del manifiesto, al tamaño que pedirán los estados
+            vista = informe.importar("renderizado.vista").Vista.obtener_instancia()
+            manifiesto = [(tipo, ruta, vista.tamano_fuente(tamano) if tipo == "fuente" else tamano)
+                          for tipo, ruta, tamano in gestor_recursos.MANIFIESTO_JUEGO]
+            gestor_recursos.GestorRecursos.obtener_instancia().precargar(manifiesto)
+        informe.marcar("carga en segundo plano lista")
+        registro.debug("🚀 [ARRANQUE] Mezclador y módulos de juego listos")
+
+    hilo = threading.Thread(target=cargar, name="arranque", daemon=True)
+    hilo.start()
+    return hilo
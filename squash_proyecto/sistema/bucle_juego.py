@@ -0,0 +1,89 @@
+# pylint: disable=all
+"""
+Bucle de Paso Fijo
+==================
+Separa la velocidad de la simulación de la velocidad de dibujo.
+La lógica avanza siempre en pasos de 1/tasa_simulacion segundos; el
+dibujo interpola entre el paso anterior y el actual con 'alfa'.
+"""
+
+import time
+
+
+class BucleTiempoFijo:
+    """
+    Acumulador de tiempo para un bucle de paso fijo.
+
+    Cada frame se llama a avanzar(), que indica cuántos pasos de
+    simulación ejecutar y el factor de interpolación para dibujar.
+    Si el juego se atrasa, se ejecutan varios pasos seguidos sin dibujar
+    (saltando frames de dibujo) hasta max_pasos_por_frame; el tiempo que
+    exceda ese límite se descarta para no entrar en una espiral de atraso.
+    """
+
+    def __init__(self, tasa_simulacion=60, max_pasos_por_frame=5, reloj=time.perf_counter):
+        """
+        Args:
+            tasa_simulacion: Pasos de simulación por segundo
+            max_pasos_por_frame: Máximo de pasos seguidos antes de dibujar
+            reloj: Función que retorna el tiempo actual en segundos
+        """
+        self.dt = 1.0 / tasa_simulacion
+        self.max_pasos_por_frame = max_pasos_por_frame
+        self.reloj = reloj
+        self.acumulador = 0.0
+        self.tiempo_anterior = None
+        self.frames_saltados = 0
+
+    def reiniciar(self):
+        """Descarta el tiempo acumulado (p. ej. al salir de una espera larga)."""
+        self.acumulador = 0.0
+        self.tiempo_anterior = None
+
+    def avanzar(self):
+        """
+        Registra el tiempo transcurrido desde el frame anterior.
+
+        Returns:
+            Tupla (pasos, alfa): pasos de simulación a ejecutar y fracción
+            [0, 1) del siguiente paso ya transcurrida, para interpolar.
+        """
+        ahora = self.reloj()
+        if self.tiempo_anterior is None:
+            # Primer frame: ejecutar un paso para tener un estado que dibujar
+            self.tiempo_anterior = ahora
+            return 1, 0.0
+
+        self.acumulador += ahora - self.tiempo_anterior
+        self.tiempo_anterior = ahora
+
+        pasos = int(self.acumulador / self.dt)
+        if pasos > self.max_pasos_por_frame:
+            # Demasiado atrasado: descartar el exceso
+            pasos = self.max_pasos_por_frame
+            self.acumulador = pasos * self.dt
+
+        if pasos > 1:
+            self.frames_saltados += pasos - 1
+
+        self.acumulador -= pasos * self.dt
+        return pasos, self.acumulador / self.dt
+
+
+class BucleSinLimite:
+    """
+    Misma interfaz que BucleTiempoFijo, pero sin reloj: cada frame ejecuta
+    una cantidad fija de pasos. Sirve para reproducir partidas grabadas lo
+    más rápido posible.
+    """
+
+    def __init__(self, pasos_por_frame=5):
+        self.pasos_por_frame = pasos_por_frame
+        self.frames_saltados = 0
+
+    def reiniciar(self):
+        pass
+
+    def avanzar(self):
+        """Returns: (pasos, alfa) con alfa = 1 (se dibuja el último paso)."""
+        return self.pasos_por_frame, 1.0
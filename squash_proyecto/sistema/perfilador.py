@@ -0,0 +1,162 @@
+# pylint: disable=all
+"""
+Perfilador de Frames
+====================
+Divide cada frame en fases (eventos, entrada, modos, física, observadores,
+HUD, entidades, presentación y espera del reloj) y guarda la duración de
+cada una en buffers circulares de NumPy, de los que salen los percentiles
+p50/p95/p99 y el máximo que muestra renderizado.overlay_perfilador (F3).
+
+Los puntos de medición preguntan primero por perfilador.activo: apagado,
+el costo es una lectura de atributo por fase y no se toma ningún tiempo.
+
+Uso por frame (solo si perfilador.activo):
+    inicio = perfilador.iniciar_frame()
+    ...
+    inicio = perfilador.medir_desde(FASE_EVENTOS, inicio)
+    ...
+    perfilador.terminar_frame()
+"""
+
+import time
+import numpy as np
+from config.configuracion import ConfiguracionJuego
+from sistema.registro import obtener_logger
+
+registro = obtener_logger("perf")
+
+# Fases medidas (índices en los buffers)
+FASES = ("eventos", "entrada", "modos", "fisica", "observadores",
+         "entidades", "hud", "presentar", "espera")
+(FASE_EVENTOS, FASE_ENTRADA, FASE_MODOS, FASE_FISICA, FASE_OBSERVADORES,
+ FASE_ENTIDADES, FASE_HUD, FASE_PRESENTAR, FASE_ESPERA) = range(len(FASES))
+
+# Filas extra de los buffers: tiempo no atribuido a ninguna fase y frame completo
+FILAS = FASES + ("otros", "frame")
+FILA_OTROS = len(FASES)
+FILA_FRAME = len(FASES) + 1
+
+PERCENTILES = (50, 95, 99)
+
+
+class PerfiladorFrames:
+    """
+    PATRÓN: SINGLETON
+    -----------------
+    Un solo perfilador para todo el programa, así el bucle principal, el
+    estado de juego y la simulación acumulan en el mismo frame.
+    """
+
+    _instancia = None
+
+    def __new__(cls):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+            cls._instancia._inicializar()
+        return cls._instancia
+
+    @classmethod
+    def obtener_instancia(cls):
+        """Método estático para obtener la instancia Singleton."""
+        if cls._instancia is None:
+            cls()
+        return cls._instancia
+
+    def _inicializar(self):
+        """Apagado, con buffers para los últimos frames_perfilador frames."""
+        self.activo = False
+        self.capacidad = ConfiguracionJuego.obtener_instancia().frames_perfilador
+        self.tiempos = np.zeros((len(FILAS), self.capacidad), dtype=np.int64)
+        self.acumulado = [0] * len(FASES)
+        self.inicio_frame = 0
+        self.indice = 0
+        self.cantidad = 0
+
+    def alternar(self):
+        """
+        Enciende o apaga la medición. Cada encendido empieza con los
+        buffers vacíos.
+
+        Returns:
+            El nuevo valor de activo
+        """
+        self.activo = not self.activo
+        self.reiniciar()
+        registro.info("⏱️ [PERF] Perfilador de frames %s", "activado" if self.activo else "desactivado")
+        return self.activo
+
+    def reiniciar(self):
+        """Descarta los frames medidos."""
+        self.indice = 0
+        self.cantidad = 0
+        self.acumulado = [0] * len(FASES)
+
+    # -------------------------------------------------------------------------
+    # Medición
+    # -------------------------------------------------------------------------
+
+    def iniciar_frame(self):
+        """
+        Empieza un frame nuevo.
+
+        Returns:
+            Tiempo actual en ns (inicio de la primera fase)
+        """
+        self.acumulado = [0] * len(FASES)
+        self.inicio_frame = time.perf_counter_ns()
+        return self.inicio_frame
+
+    def acumular(self, fase, duracion):
+        """Suma duracion (ns) a la fase en el frame actual (p. ej. varios pasos por frame)."""
+        self.acumulado[fase] += duracion
+
+    def medir_desde(self, fase, inicio):
+        """
+        Suma a la fase el tiempo transcurrido desde inicio.
+
+        Returns:
+            Tiempo actual en ns, para encadenar con la fase siguiente
+        """
+        ahora = time.perf_counter_ns()
+        self.acumulado[fase] += ahora - inicio
+        return ahora
+
+    def terminar_frame(self):
+        """Guarda las fases del frame en los buffers circulares."""
+        total = time.perf_counter_ns() - self.inicio_frame
+        columna = self.tiempos[:, self.indice]
+        columna[:FILA_OTROS] = self.acumulado
+        columna[FILA_OTROS] = max(total - sum(self.acumulado), 0)
+        columna[FILA_FRAME] = total
+
+        self.indice = (self.indice + 1) % self.capacidad
+        self.cantidad = min(self.cantidad + 1, self.capacidad)
+
+    # -------------------------------------------------------------------------
+    # Resultados
+    # -------------------------------------------------------------------------
+
+    def estadisticas(self):
+        """
+        Percentiles de los frames en los buffers.
+
+        Returns:
+            Diccionario fila -> (p50, p95, p99, max) en ms, o {} si no hay frames
+        """
+        if self.cantidad == 0:
+            return {}
+        datos = self.tiempos[:, :self.cantidad]
+        percentiles = np.percentile(datos, PERCENTILES, axis=1) / 1e6
+        maximos = datos.max(axis=1) / 1e6
+        return {fila: (*percentiles[:, i], maximos[i]) for i, fila in enumerate(FILAS)}
+
+    def ultimos_frames(self, cantidad):
+        """
+        Duración de los últimos frames, del más viejo al más nuevo.
+
+        Returns:
+            Arreglo con hasta 'cantidad' duraciones en ms
+        """
+        cantidad = min(cantidad, self.cantidad)
+        indices = np.arange(self.indice - cantidad, self.indice) % self.capacidad
+        return self.tiempos[FILA_FRAME, indices] / 1e6
@@ -0,0 +1,108 @@
+# pylint: disable=all
+"""
+Registro de Eventos (Logging)
+=============================
+Reemplaza los print() del juego por loggers con niveles, uno por
+subsistema ("squash.observer", "squash.command", ...).
+
+Los registros no se escriben desde el hilo del juego: se dejan en una
+cola y un hilo en segundo plano (QueueListener) los escribe. Así una
+terminal lenta o una tubería hacia el colector de logs no frena el frame.
+
+En modo release se apagan por completo los subsistemas de rutas
+calientes (los que registran en cada golpe o cada frame).
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+RAIZ = "squash"
+
+# Subsistemas que registran dentro del bucle de juego (en cada golpe)
+SUBSISTEMAS_CALIENTES = ("observer", "command", "decorator", "strategy", "juego")
+
+_oyente = None
+
+
+def obtener_logger(subsistema):
+    """
+    Logger de un subsistema.
+
+    Args:
+        subsistema: Nombre corto, p. ej. "state" → logger "squash.state"
+    """
+    return logging.getLogger(f"{RAIZ}.{subsistema}")
+
+
+def configurar_registro(nivel="INFO", modo_release=False, destino=None):
+    """
+    Configura el registro del juego. Se puede volver a llamar para cambiar
+    el nivel o el modo; el hilo escritor solo se crea la primera vez.
+
+    Args:
+        nivel: Nivel mínimo ("DEBUG", "INFO", "WARNING", ...)
+        modo_release: Si True, solo se registran advertencias y errores y
+                      los subsistemas calientes quedan deshabilitados
+        destino: Flujo donde escribir (por defecto sys.stdout)
+    """
+    global _oyente
+
+    raiz = logging.getLogger(RAIZ)
+    raiz.propagate = False
+
+    if _oyente is None:
+        # Cola sin límite: put() nunca bloquea al hilo del juego
+        cola = queue.SimpleQueue()
+        raiz.addHandler(logging.handlers.QueueHandler(cola))
+
+        escritor = logging.StreamHandler(destino or sys.stdout)
+        escritor.setFormatter(logging.Formatter("%(message)s"))
+        _oyente = logging.handlers.QueueListener(cola, escritor)
+        _oyente.start()
+        atexit.register(detener_registro)
+
+    if modo_release:
+        nivel = max(logging.WARNING, logging.getLevelName(nivel) if isinstance(nivel, str) else nivel)
+    raiz.setLevel(nivel)
+
+    for subsistema in SUBSISTEMAS_CALIENTES:
+        obtener_logger(subsistema).disabled = modo_release
+
+
+def configurar_registro_proceso_hijo(nivel="WARNING"):
+    """
+    Configura el registro en un proceso hijo (p. ej. de ProcessPoolExecutor).
+    Con fork el hijo hereda la cola pero no el hilo escritor, así que
+    escribe directo a stderr y deja apagadas las rutas calientes.
+    """
+    global _oyente
+    _oyente = None
+
+    raiz = logging.getLogger(RAIZ)
+    raiz.propagate = False
+    for manejador in list(raiz.handlers):
+        raiz.removeHandler(manejador)
+
+    escritor = logging.StreamHandler(sys.stderr)
+    escritor.setFormatter(logging.Formatter("%(message)s"))
+    raiz.addHandler(escritor)
+    raiz.setLevel(nivel)
+
+    for subsistema in SUBSISTEMAS_CALIENTES:
+        obtener_logger(subsistema).disabled = True
+
+
+def detener_registro():
+    """Vacía la cola y detiene el hilo escritor."""
+    global _oyente
+
+    if _oyente is not None:
+        _oyente.stop()
+        _oyente = None
+        raiz = logging.getLogger(RAIZ)
+        for manejador in list(raiz.handlers):
+            if isinstance(manejador, logging.handlers.QueueHandler):
+                raiz.removeHandler(manejador)